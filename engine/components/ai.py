@@ -34,7 +34,7 @@ class AIState(Enum):
     DEAD = auto()        # Dead/dying
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class AIBrain:
     """
     AI decision-making component.
@@ -42,7 +42,7 @@ class AIBrain:
     Attributes:
         behavior: The type of AI behavior to use
         state: Current state in the behavior state machine
-        target_id: Entity ID of current target (usually player)
+        target_id: Entity ID of current target (usually player), 0 for none
         
         awareness_range: Distance at which AI becomes aware of target
         attack_range: Distance at which AI can attack
@@ -61,7 +61,7 @@ class AIBrain:
     """
     behavior: AIBehavior = AIBehavior.CHASER
     state: AIState = AIState.IDLE
-    target_id: Optional[str] = None
+    target_id: int = 0
     
     # Detection ranges
     awareness_range: float = 400.0
@@ -131,7 +131,7 @@ class AIBrain:
         return self.waypoints[self.current_waypoint]
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class BossPhase:
     """
     Configuration for a boss phase.
@@ -39,7 +39,7 @@ class CollisionMask(Flag):
     SOLID = PLAYER | ENEMY | OBSTACLE
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Collider:
     """
     Collision detection component.
@@ -8,7 +8,7 @@ The HealthSystem processes damage events and handles death.
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Health:
     """
     Health points and damage tracking.
@@ -38,7 +38,7 @@ class Health:
     
     # Damage tracking for effects
     last_damage_time: float = field(default=0.0, repr=False)
-    last_damage_source: str = field(default="", repr=False)
+    last_damage_source: int = field(default=0, repr=False)
     damage_this_frame: float = field(default=0.0, repr=False)
     
     @property
@@ -64,7 +64,7 @@ class Health:
         self.hp = min(self.max_hp, self.hp + amount)
         return self.hp - old_hp
     
-    def take_damage(self, amount: float, source_id: str = "") -> float:
+    def take_damage(self, amount: float, source_id: int = 0) -> float:
         """
         Apply damage to this entity.
         
@@ -87,7 +87,7 @@ class Health:
         return actual_damage
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Shield:
     """
     Energy shield that absorbs damage before health.
@@ -6,9 +6,10 @@ smooth, time-based movement with acceleration, friction, and mass.
 """
 
 from dataclasses import dataclass, field
+import math
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Velocity:
     """
     Linear and angular velocity.
@@ -25,7 +26,7 @@ class Velocity:
     @property
     def speed(self) -> float:
         """Get the magnitude of linear velocity."""
-        return (self.vx ** 2 + self.vy ** 2) ** 0.5
+        return math.hypot(self.vx, self.vy)
     
     def normalize(self) -> tuple[float, float]:
         """Get the normalized direction vector."""
@@ -35,7 +36,7 @@ class Velocity:
         return (self.vx / speed, self.vy / speed)
 
 
-@dataclass 
+@dataclass(slots=True, eq=False)
 class Physics:
     """
     Physical properties affecting movement.
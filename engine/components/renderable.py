@@ -7,7 +7,7 @@ an entity using Python's turtle graphics.
 
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Optional, Any
+from typing import Optional, Any, Tuple
 
 
 class RenderShape(Enum):
@@ -47,7 +47,7 @@ class RenderLayer(Enum):
     UI = 80
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Renderable:
     """
     Visual representation data for an entity.
@@ -89,6 +89,9 @@ class Renderable:
     turtle_id: Optional[int] = field(default=None, repr=False)
     _turtle_ref: Optional[Any] = field(default=None, repr=False)
     _text_turtle_ref: Optional[Any] = field(default=None, repr=False)
+    _applied_colors: Optional[Tuple[str, str]] = field(default=None, repr=False)
+    _applied_shape: str = field(default="", repr=False)
+    _applied_pose: Optional[Tuple[float, float, float, float]] = field(default=None, repr=False)
     
     # Animation state
     flash_timer: float = 0.0
@@ -107,7 +110,7 @@ class Renderable:
             self.original_color = self.color
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class TextRenderable:
     """
     Text rendering component for UI elements.
@@ -9,6 +9,8 @@ from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Dict, Optional
 
+from ..core.component import register_component
+
 
 class StatusEffect(Enum):
     """Types of status effects."""
@@ -28,7 +30,16 @@ class StatusEffect(Enum):
     RAPID_FIRE = auto()    # Increased fire rate
 
 
-@dataclass
+# One bit per effect type, for StatusEffects.active_flags
+EFFECT_BITS: Dict[StatusEffect, int] = {
+    effect: 1 << index for index, effect in enumerate(StatusEffect)
+}
+
+_DEBUFFS = (StatusEffect.SLOW, StatusEffect.STUN, StatusEffect.BURN,
+            StatusEffect.POISON, StatusEffect.FREEZE, StatusEffect.BLEED)
+
+
+@dataclass(slots=True, eq=False)
 class StatusEffectData:
     """
     Data for a single active status effect.
@@ -54,7 +65,7 @@ class StatusEffectData:
     duration: float
     time_remaining: float
     magnitude: float = 1.0
-    source_id: str = ""
+    source_id: int = 0
     stacks: int = 1
     max_stacks: int = 1
     tick_rate: float = 0.5
@@ -73,17 +84,21 @@ class StatusEffectData:
         return 1.0 - (self.time_remaining / self.duration)
 
 
-@dataclass
+@register_component(pooled=True, max_pool_size=16)
+@dataclass(slots=True, eq=False)
 class StatusEffects:
     """
     Container for all active status effects on an entity.
     
     The StatusEffectSystem iterates over entities with this component
-    and processes each active effect.
+    and processes each active effect. active_flags mirrors the keys of
+    active_effects as a bitmask (see EFFECT_BITS), so entities with no
+    effects can be skipped with a single integer check.
     """
     active_effects: Dict[StatusEffect, StatusEffectData] = field(
         default_factory=dict
     )
+    active_flags: int = 0
     
     # Cached modifiers (updated when effects change)
     speed_modifier: float = 1.0
@@ -101,7 +116,7 @@ class StatusEffects:
         effect_type: StatusEffect,
         duration: float,
         magnitude: float = 1.0,
-        source_id: str = "",
+        source_id: int = 0,
         max_stacks: int = 1,
         tick_rate: float = 0.5
     ) -> None:
@@ -134,6 +149,7 @@ class StatusEffects:
                 max_stacks=max_stacks,
                 tick_rate=tick_rate
             )
+            self.active_flags |= EFFECT_BITS[effect_type]
         
         self._update_modifiers()
     
@@ -141,13 +157,14 @@ class StatusEffects:
         """Remove a status effect. Returns True if it was present."""
         if effect_type in self.active_effects:
             del self.active_effects[effect_type]
+            self.active_flags &= ~EFFECT_BITS[effect_type]
             self._update_modifiers()
             return True
         return False
     
     def has_effect(self, effect_type: StatusEffect) -> bool:
         """Check if an effect is active."""
-        return effect_type in self.active_effects
+        return bool(self.active_flags & EFFECT_BITS[effect_type])
     
     def get_effect(self, effect_type: StatusEffect) -> Optional[StatusEffectData]:
         """Get data for an active effect."""
@@ -156,14 +173,14 @@ class StatusEffects:
     def clear_all(self) -> None:
         """Remove all status effects."""
         self.active_effects.clear()
+        self.active_flags = 0
         self._update_modifiers()
     
     def clear_debuffs(self) -> None:
         """Remove all negative effects."""
-        debuffs = [StatusEffect.SLOW, StatusEffect.STUN, StatusEffect.BURN,
-                   StatusEffect.POISON, StatusEffect.FREEZE, StatusEffect.BLEED]
-        for debuff in debuffs:
-            self.active_effects.pop(debuff, None)
+        for debuff in _DEBUFFS:
+            if self.active_effects.pop(debuff, None) is not None:
+                self.active_flags &= ~EFFECT_BITS[debuff]
         self._update_modifiers()
     
     def _update_modifiers(self) -> None:
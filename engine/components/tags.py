@@ -13,14 +13,16 @@ Using tag components instead of string tags:
 
 from dataclasses import dataclass
 
+from ..core.component import register_component
 
-@dataclass
+
+@dataclass(slots=True, eq=False)
 class PlayerTag:
     """Marks an entity as the player."""
     player_number: int = 1
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class EnemyTag:
     """Marks an entity as an enemy."""
     enemy_type: str = "basic"
@@ -28,13 +30,14 @@ class EnemyTag:
     point_value: int = 100
 
 
-@dataclass
+@register_component(pooled=True, max_pool_size=256)
+@dataclass(slots=True, eq=False)
 class ProjectileTag:
     """Marks an entity as a projectile."""
     is_player_owned: bool = True
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class ObstacleTag:
     """Marks an entity as a static obstacle/wall."""
     blocks_movement: bool = True
@@ -42,7 +45,7 @@ class ObstacleTag:
     destructible: bool = False
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class PowerupTag:
     """Marks an entity as a power-up pickup."""
     powerup_type: str = "health"
@@ -50,14 +53,14 @@ class PowerupTag:
     respawn_time: float = 10.0
 
 
-@dataclass 
+@dataclass(slots=True, eq=False)
 class BossTag:
     """Marks an entity as a boss enemy."""
     boss_name: str = "Boss"
     is_main_boss: bool = True
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class SpawnerTag:
     """Marks an entity as an enemy spawner."""
     spawn_type: str = "chaser"
@@ -66,7 +69,7 @@ class SpawnerTag:
     current_spawned: int = 0
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class TriggerTag:
     """Marks an entity as a trigger zone."""
     trigger_type: str = "zone"
@@ -9,7 +9,11 @@ from dataclasses import dataclass, field
 import math
 
 
-@dataclass
+# Degrees -> radians factor (the same value math.radians multiplies by)
+_DEG_TO_RAD = math.pi / 180.0
+
+
+@dataclass(slots=True, eq=False)
 class Transform:
     """
     Represents position and orientation in 2D space.
@@ -33,19 +37,17 @@ class Transform:
     
     def forward_vector(self) -> tuple[float, float]:
         """Get the unit vector pointing in the entity's forward direction."""
-        rad = math.radians(self.angle)
+        rad = self.angle * _DEG_TO_RAD
         return (math.cos(rad), math.sin(rad))
     
     def right_vector(self) -> tuple[float, float]:
         """Get the unit vector pointing to the entity's right."""
-        rad = math.radians(self.angle - 90)
+        rad = (self.angle - 90) * _DEG_TO_RAD
         return (math.cos(rad), math.sin(rad))
     
     def distance_to(self, other_x: float, other_y: float) -> float:
         """Calculate distance to a point."""
-        dx = other_x - self.x
-        dy = other_y - self.y
-        return math.sqrt(dx * dx + dy * dy)
+        return math.hypot(other_x - self.x, other_y - self.y)
     
     def angle_to(self, other_x: float, other_y: float) -> float:
         """Calculate angle (in degrees) to a point."""
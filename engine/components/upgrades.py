@@ -13,7 +13,8 @@ Design Philosophy:
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Dict, List, Optional
-import random
+
+from ..core.rng import RNG
 
 
 class UpgradeTier(Enum):
@@ -69,7 +70,7 @@ class UpgradeType(Enum):
     PROBABILITY_FIELD = auto()
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class UpgradeDefinition:
     """Definition for an upgrade type."""
     upgrade_type: UpgradeType
@@ -440,7 +441,7 @@ UPGRADE_DEFINITIONS: Dict[UpgradeType, UpgradeDefinition] = {
 }
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class UpgradeStack:
     """A single upgrade with its current stacks."""
     upgrade_type: UpgradeType
@@ -475,7 +476,7 @@ class UpgradeStack:
         return self.current_stacks > 0
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class PlayerUpgrades:
     """
     Container for all player upgrades.
@@ -547,7 +548,7 @@ class PlayerUpgrades:
         if not non_empty:
             return None
         
-        target = random.choice(non_empty)
+        target = RNG.choice(non_empty)
         target.remove_stack()
         
         # Remove upgrade entirely if no stacks left
@@ -732,7 +733,7 @@ def select_random_upgrade_type(wave_number: int, is_boss: bool = False) -> Upgra
     distribution = get_tier_distribution(wave_number, is_boss)
     
     # Roll for tier
-    roll = random.uniform(0, 100)
+    roll = RNG.uniform(0, 100)
     cumulative = 0
     selected_tier = UpgradeTier.TIER_1
     
@@ -755,7 +756,7 @@ def select_random_upgrade_type(wave_number: int, is_boss: bool = False) -> Upgra
             if definition.tier == UpgradeTier.TIER_1
         ]
     
-    return random.choice(tier_upgrades)
+    return RNG.choice(tier_upgrades)
 
 
 def calculate_drop_chance(wave_number: int, probability_bonus: float = 0.0) -> float:
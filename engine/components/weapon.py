@@ -9,6 +9,8 @@ from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Optional, List
 
+from ..core.component import register_component
+
 
 class WeaponType(Enum):
     """Predefined weapon types with different firing patterns."""
@@ -20,7 +22,7 @@ class WeaponType(Enum):
     RAPID = auto()       # Fast fire rate
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Weapon:
     """
     Weapon configuration and state.
@@ -97,7 +99,8 @@ class Weapon:
         return True
 
 
-@dataclass
+@register_component(pooled=True, max_pool_size=256)
+@dataclass(slots=True, eq=False)
 class Projectile:
     """
     Projectile component - attached to bullet/missile entities.
@@ -118,7 +121,7 @@ class Projectile:
         4. On hit: DamageEvent emitted, pierce_count decremented
         5. If pierce_count < 0 or lifetime exceeded: destroy
     """
-    owner_id: str = ""
+    owner_id: int = 0
     damage: float = 10.0
     lifetime: float = 2.0
     time_alive: float = 0.0
@@ -134,17 +137,17 @@ class Projectile:
     # Homing projectiles
     is_homing: bool = False
     homing_strength: float = 0.0
-    target_id: Optional[str] = None
+    target_id: Optional[int] = None
     
     # Hit tracking (to prevent multi-hit on same frame)
-    hit_entities: List[str] = field(default_factory=list)
+    hit_entities: List[int] = field(default_factory=list)
     
     @property
     def is_expired(self) -> bool:
         """Check if projectile should be destroyed."""
         return self.time_alive >= self.lifetime
     
-    def register_hit(self, entity_id: str) -> bool:
+    def register_hit(self, entity_id: int) -> bool:
         """
         Register a hit on an entity.
         
@@ -9,12 +9,14 @@ This module provides the fundamental building blocks:
 - GameSystem: Base class for all systems
 - SystemManager: Orchestrates system execution order
 - EventBus: Decoupled communication between systems
+- RNG: Shared, reseedable random source for gameplay code
 """
 
 from .entity import Entity, EntityManager
 from .component import ComponentRegistry
 from .system import GameSystem, SystemManager
 from .events import EventBus, Event
+from .rng import RNG, reseed
 
 __all__ = [
     "Entity",
@@ -24,4 +26,6 @@ __all__ = [
     "SystemManager",
     "EventBus",
     "Event",
+    "RNG",
+    "reseed",
 ]
@@ -25,10 +25,12 @@ class ComponentMeta:
         name: Optional[str] = None,
         description: str = "",
         pooled: bool = False,
-        max_pool_size: int = 100
+        max_pool_size: int = 100,
+        type_id: int = -1
     ):
         self.component_type = component_type
         self.name = name or component_type.__name__
+        self.type_id = type_id
         self.description = description
         self.pooled = pooled
         self.max_pool_size = max_pool_size
@@ -52,6 +54,7 @@ class ComponentRegistry:
     
     Responsibilities:
     - Register component types with metadata
+    - Intern component types as small integer ids
     - Provide component pooling for frequently created/destroyed components
     - Enable component introspection
     
@@ -59,10 +62,15 @@ class ComponentRegistry:
     For components that are frequently created and destroyed (like projectiles),
     pooling reduces allocation overhead. When an entity is destroyed, its pooled
     components are returned to the pool for reuse.
+    
+    Recycled instances are reset with the registered reset_fn, or, for
+    dataclass components without one, by re-running __init__ with the new
+    values so every field starts from its default.
     """
     
     def __init__(self):
         self._registered: Dict[Type, ComponentMeta] = {}
+        self._type_ids: Dict[Type, int] = {}
         self._pools: Dict[Type, List[Any]] = {}
         self._pool_reset_fns: Dict[Type, Callable[[Any], None]] = {}
     
@@ -94,7 +102,8 @@ class ComponentRegistry:
             name=name,
             description=description,
             pooled=pooled,
-            max_pool_size=max_pool_size
+            max_pool_size=max_pool_size,
+            type_id=self.type_id(component_type)
         )
         self._registered[component_type] = meta
         
@@ -105,6 +114,19 @@ class ComponentRegistry:
         
         return meta
     
+    def type_id(self, component_type: Type) -> int:
+        """
+        Get the small integer id of a component type.
+        
+        Ids are dense (0, 1, 2, ...) and assigned on first use; types
+        decorated with @register_component get theirs at import time.
+        EntityManager uses them as bit positions in component signatures.
+        """
+        type_id = self._type_ids.get(component_type)
+        if type_id is None:
+            type_id = self._type_ids[component_type] = len(self._type_ids)
+        return type_id
+    
     def get_meta(self, component_type: Type) -> Optional[ComponentMeta]:
         """Get metadata for a registered component type."""
         return self._registered.get(component_type)
@@ -130,10 +152,13 @@ class ComponentRegistry:
         if meta and meta.pooled and self._pools.get(component_type):
             instance = self._pools[component_type].pop()
             # Reset and update with new values
-            if component_type in self._pool_reset_fns:
-                self._pool_reset_fns[component_type](instance)
-            for key, value in kwargs.items():
-                setattr(instance, key, value)
+            reset_fn = self._pool_reset_fns.get(component_type)
+            if reset_fn is not None:
+                reset_fn(instance)
+                for key, value in kwargs.items():
+                    setattr(instance, key, value)
+            else:
+                instance.__init__(**kwargs)
             return instance
         
         # Create new instance
@@ -2,16 +2,26 @@
 Entity and EntityManager - Core ECS identity and lifecycle management.
 
 Design Philosophy:
-- Entities are just unique IDs (lightweight)
-- Components are stored in the EntityManager, indexed by entity ID
+- Entities are just unique integer IDs (lightweight, cheap to hash)
+- Components are stored in the EntityManager, one store per component type
 - This allows for data-oriented iteration over components
 - Deferred destruction prevents iterator invalidation
 """
 
 from __future__ import annotations
 from dataclasses import dataclass, field
+from itertools import count
 from typing import Dict, Set, Type, TypeVar, Optional, Iterator, List, Any
-from uuid import uuid4
+
+from .component import ComponentRegistry, get_component_registry
+
+
+# Entity IDs are plain ints. IDs are handed out monotonically starting at 1
+# and never reused, so a stale ID can never alias a newer entity, and 0 is
+# free to act as the "no entity" sentinel in components and events.
+EntityId = int
+
+_next_entity_id = count(1)
 
 
 @dataclass(frozen=True, slots=True)
@@ -25,10 +35,10 @@ class Entity:
     Using frozen=True makes entities hashable for use in sets/dicts.
     Using slots=True reduces memory overhead.
     """
-    id: str = field(default_factory=lambda: str(uuid4()))
+    id: EntityId = field(default_factory=lambda: next(_next_entity_id))
     
     def __hash__(self) -> int:
-        return hash(self.id)
+        return self.id
     
     def __eq__(self, other: object) -> bool:
         if isinstance(other, Entity):
@@ -49,34 +59,70 @@ class EntityManager:
     - Add/remove components from entities
     - Query entities by component signature
     - Defer destruction to end of frame for safe iteration
+    - Return pooled components to the ComponentRegistry on destruction
     
-    Data Layout:
-    - _entities: Set of all active entity IDs
-    - _components: Dict[entity_id, Dict[component_type, component_instance]]
-    - _by_component: Dict[component_type, Set[entity_id]] for fast queries
+    Data Layout (struct-of-arrays):
+    - _entities: Dict[entity_id, Entity] of all active entities
+    - _stores: Dict[component_type, Dict[entity_id, component_instance]]
+    - _signatures: Dict[entity_id, int] bitmask of the entity's component types
+    - _versions: Dict[entity_id, int] bumped on every component add/replace/remove
+    - _archetypes: Dict[signature, Dict[entity_id, Entity]] entities grouped
+      by their exact component set
     - _pending_destroy: Entities marked for destruction this frame
     
+    Each component type owns a single dense store, so the store keys double
+    as the reverse index for queries and a system that only touches one or
+    two component types walks just those stores instead of every entity.
+    
+    Every component type is also assigned one bit. An entity's signature
+    is the OR of its component bits, and entities sharing a signature form
+    an archetype. A query resolves (and caches) the archetypes whose
+    signature contains the query mask, then walks their members directly,
+    so entities that cannot match are never visited. Entities only move
+    between archetypes when a component is added or removed.
+    
     This design allows:
     1. O(1) component access by entity
     2. O(1) entity lookup by component type
     3. Safe iteration (destruction is deferred)
     """
     
-    def __init__(self):
-        # All active entities
-        self._entities: Set[Entity] = set()
+    def __init__(self, registry: Optional[ComponentRegistry] = None):
+        # Component registry that receives pooled components on destruction
+        self._registry = registry if registry is not None else get_component_registry()
+        
+        # All active entities, keyed by id
+        self._entities: Dict[EntityId, Entity] = {}
         
-        # Component storage: entity_id -> {component_type -> component}
-        self._components: Dict[str, Dict[Type, Any]] = {}
+        # Component storage: component_type -> {entity_id -> component}
+        self._stores: Dict[Type, Dict[EntityId, Any]] = {}
         
-        # Reverse index: component_type -> set of entity_ids
-        self._by_component: Dict[Type, Set[str]] = {}
+        # Component signatures: entity_id -> OR of component type bits.
+        # Bit positions are the registry's interned type ids, cached here.
+        self._signatures: Dict[EntityId, int] = {}
+        self._type_bits: Dict[Type, int] = {}
+        self._bit_types: Dict[int, Type] = {}
         
-        # Deferred destruction queue
+        # Component versions: entity_id -> counter bumped whenever any of the
+        # entity's components is added, replaced or removed
+        self._versions: Dict[EntityId, int] = {}
+        
+        # Archetypes: signature -> {entity_id -> entity}, plus a cache of
+        # query mask -> matching archetypes (reset when an archetype appears)
+        self._archetypes: Dict[int, Dict[EntityId, Entity]] = {0: {}}
+        self._archetype_matches: Dict[int, List[Dict[EntityId, Entity]]] = {}
+        
+        # Deferred destruction queue (ids mirrored in a set for O(1) alive checks)
         self._pending_destroy: List[Entity] = []
+        self._pending_ids: Set[EntityId] = set()
         
-        # Tag system for quick entity categorization
+        # Tag system for quick entity categorization. Each tag string is
+        # interned to one bit; entities carry an OR of their tag bits so
+        # has_tag() is a single AND, and tag -> entities sets back iteration.
         self._tags: Dict[str, Set[Entity]] = {}
+        self._tag_bits: Dict[str, int] = {}
+        self._tag_names: List[str] = []
+        self._tag_masks: Dict[EntityId, int] = {}
         
         # Named entity lookup (e.g., "player")
         self._named: Dict[str, Entity] = {}
@@ -92,8 +138,10 @@ class EntityManager:
             The newly created Entity
         """
         entity = Entity()
-        self._entities.add(entity)
-        self._components[entity.id] = {}
+        self._entities[entity.id] = entity
+        self._signatures[entity.id] = 0
+        self._versions[entity.id] = 0
+        self._archetypes[0][entity.id] = entity
         
         if name:
             self._named[name] = entity
@@ -112,30 +160,40 @@ class EntityManager:
             entity: The entity to destroy
             immediate: If True, destroy immediately (use with caution!)
         """
-        if entity not in self._entities:
+        if entity.id not in self._entities:
             return
             
         if immediate:
             self._do_destroy(entity)
         else:
-            if entity not in self._pending_destroy:
+            if entity.id not in self._pending_ids:
+                self._pending_ids.add(entity.id)
                 self._pending_destroy.append(entity)
     
     def _do_destroy(self, entity: Entity) -> None:
         """Internal: Actually destroy an entity and clean up all references."""
-        if entity not in self._entities:
+        if entity.id not in self._entities:
             return
             
-        # Remove from component indices
-        if entity.id in self._components:
-            for comp_type in self._components[entity.id]:
-                if comp_type in self._by_component:
-                    self._by_component[comp_type].discard(entity.id)
-            del self._components[entity.id]
+        # Remove from the component stores named by the signature bits
+        # (rather than probing every store), recycling pooled components
+        signature = self._signatures.pop(entity.id)
+        del self._versions[entity.id]
+        del self._archetypes[signature][entity.id]
+        release = self._registry.release
+        stores = self._stores
+        bit_types = self._bit_types
+        while signature:
+            low_bit = signature & -signature
+            release(stores[bit_types[low_bit]].pop(entity.id))
+            signature ^= low_bit
         
-        # Remove from tags
-        for tag_set in self._tags.values():
-            tag_set.discard(entity)
+        # Remove from the tags this entity actually carries
+        tag_mask = self._tag_masks.pop(entity.id, 0)
+        while tag_mask:
+            low_bit = tag_mask & -tag_mask
+            self._tags[self._tag_names[low_bit.bit_length() - 1]].discard(entity)
+            tag_mask ^= low_bit
         
         # Remove from named lookup
         names_to_remove = [n for n, e in self._named.items() if e == entity]
@@ -143,7 +201,7 @@ class EntityManager:
             del self._named[name]
         
         # Finally remove from active set
-        self._entities.discard(entity)
+        del self._entities[entity.id]
     
     def flush_destroyed(self) -> int:
         """
@@ -158,11 +216,12 @@ class EntityManager:
         for entity in self._pending_destroy:
             self._do_destroy(entity)
         self._pending_destroy.clear()
+        self._pending_ids.clear()
         return count
     
     def is_alive(self, entity: Entity) -> bool:
         """Check if an entity is still active (not destroyed)."""
-        return entity in self._entities and entity not in self._pending_destroy
+        return entity.id in self._entities and entity.id not in self._pending_ids
     
     def add_component(self, entity: Entity, component: C) -> C:
         """
@@ -177,19 +236,52 @@ class EntityManager:
             
         Note: If a component of this type already exists, it's replaced.
         """
-        if entity.id not in self._components:
+        if entity.id not in self._entities:
             raise ValueError(f"Entity {entity.id} does not exist")
         
         comp_type = type(component)
-        self._components[entity.id][comp_type] = component
-        
-        # Update reverse index
-        if comp_type not in self._by_component:
-            self._by_component[comp_type] = set()
-        self._by_component[comp_type].add(entity.id)
+        store = self._stores.get(comp_type)
+        if store is None:
+            store = self._stores[comp_type] = {}
+        store[entity.id] = component
+        self._versions[entity.id] += 1
+        signature = self._signatures[entity.id]
+        new_signature = signature | self._type_bit(comp_type)
+        if new_signature != signature:
+            self._move_archetype(entity, signature, new_signature)
         
         return component
     
+    def add_components(self, entity: Entity, *components: Any) -> None:
+        """
+        Add several components to an entity in one call.
+        
+        Equivalent to calling add_component() for each, but the entity's
+        signature is built once and it moves archetype at most once, instead
+        of hopping through an intermediate archetype per component.
+        
+        Args:
+            entity: The entity to add the components to
+            *components: The component instances
+        """
+        if entity.id not in self._entities:
+            raise ValueError(f"Entity {entity.id} does not exist")
+        
+        entity_id = entity.id
+        stores = self._stores
+        signature = self._signatures[entity_id]
+        new_signature = signature
+        for component in components:
+            comp_type = type(component)
+            store = stores.get(comp_type)
+            if store is None:
+                store = stores[comp_type] = {}
+            store[entity_id] = component
+            new_signature |= self._type_bit(comp_type)
+        self._versions[entity_id] += 1
+        if new_signature != signature:
+            self._move_archetype(entity, signature, new_signature)
+    
     def remove_component(self, entity: Entity, component_type: Type[C]) -> Optional[C]:
         """
         Remove a component from an entity.
@@ -201,16 +293,26 @@ class EntityManager:
         Returns:
             The removed component, or None if not found
         """
-        if entity.id not in self._components:
+        store = self._stores.get(component_type)
+        if store is None:
             return None
-            
-        component = self._components[entity.id].pop(component_type, None)
-        
-        if component is not None and component_type in self._by_component:
-            self._by_component[component_type].discard(entity.id)
-        
+        component = store.pop(entity.id, None)
+        if component is not None:
+            self._versions[entity.id] += 1
+            signature = self._signatures[entity.id]
+            self._move_archetype(entity, signature, signature & ~self._type_bits[component_type])
         return component
     
+    def _move_archetype(self, entity: Entity, old_signature: int, new_signature: int) -> None:
+        """Internal: Move an entity between archetypes after its signature changed."""
+        self._signatures[entity.id] = new_signature
+        del self._archetypes[old_signature][entity.id]
+        members = self._archetypes.get(new_signature)
+        if members is None:
+            members = self._archetypes[new_signature] = {}
+            self._archetype_matches.clear()
+        members[entity.id] = entity
+    
     def get_component(self, entity: Optional[Entity], component_type: Type[C]) -> Optional[C]:
         """
         Get a component from an entity.
@@ -224,50 +326,61 @@ class EntityManager:
         """
         if entity is None:
             return None
-        if entity.id not in self._components:
+        store = self._stores.get(component_type)
+        if store is None:
             return None
-        return self._components[entity.id].get(component_type)
+        return store.get(entity.id)
     
     def has_component(self, entity: Optional[Entity], component_type: Type) -> bool:
         """Check if an entity has a specific component type."""
         if entity is None:
             return False
-        if entity.id not in self._components:
-            return False
-        return component_type in self._components[entity.id]
+        store = self._stores.get(component_type)
+        return store is not None and entity.id in store
     
     def has_components(self, entity: Optional[Entity], *component_types: Type) -> bool:
         """Check if an entity has ALL specified component types."""
         if entity is None:
             return False
-        if entity.id not in self._components:
+        signature = self._signatures.get(entity.id)
+        mask = self._query_mask(component_types)
+        if signature is None or mask is None:
             return False
-        entity_components = self._components[entity.id]
-        return all(ct in entity_components for ct in component_types)
+        return signature & mask == mask
     
-    def get_entity_by_id(self, entity_id: str) -> Optional[Entity]:
+    def component_version(self, entity: Entity) -> int:
+        """
+        Get the component version of an entity (-1 if it does not exist).
+        
+        The version is bumped whenever a component is added to, replaced on
+        or removed from the entity, so callers can cache component references
+        and re-resolve them only when it changes.
+        """
+        return self._versions.get(entity.id, -1)
+    
+    def get_entity_by_id(self, entity_id: EntityId) -> Optional[Entity]:
         """
         Safely get an entity by its ID.
         
         Args:
-            entity_id: The entity's ID string
+            entity_id: The entity's ID
             
         Returns:
             The Entity if found and alive, None otherwise
         """
         if not entity_id:
             return None
-        for entity in self._entities:
-            if entity.id == entity_id and entity not in self._pending_destroy:
-                return entity
-        return None
+        entity = self._entities.get(entity_id)
+        if entity is None or entity_id in self._pending_ids:
+            return None
+        return entity
     
     def get_entities_with(self, *component_types: Type) -> Iterator[Entity]:
         """
         Get all entities that have ALL specified component types.
         
         This is the primary query method for systems.
-        Uses set intersection on reverse indices for efficiency.
+        Walks only the archetypes that contain every requested type.
         
         Args:
             *component_types: The component types to filter by
@@ -275,56 +388,135 @@ class EntityManager:
         Yields:
             Entities that have all specified components
         """
+        for entity, _ in self._iter_matching(component_types):
+            yield entity
+    
+    def query(self, *component_types: Type) -> Iterator[tuple]:
+        """
+        Get entities together with the requested components.
+        
+        Like get_entities_with(), but yields (entity, comp_a, comp_b, ...)
+        tuples in argument order, so systems read each component straight
+        from its store instead of calling get_component() per entity.
+        
+        Usage:
+            for entity, transform, velocity in entities.query(Transform, Velocity):
+                transform.x += velocity.vx * dt
+        
+        Args:
+            *component_types: The component types to fetch (at least one)
+            
+        Yields:
+            Tuples of (entity, *components)
+        """
         if not component_types:
-            # Iterate over a copy to prevent RuntimeError if set changes during iteration
-            yield from list(self._entities)
             return
+        rows = self._iter_matching(component_types)
+        stores = [self._stores.get(ct, {}) for ct in component_types]
         
-        # Start with the smallest set for efficiency
-        sets = []
+        # Common one/two/three-component shapes build their row tuple
+        # directly instead of unpacking a per-row list
+        if len(stores) == 1:
+            store_a, = stores
+            for entity, entity_id in rows:
+                yield (entity, store_a[entity_id])
+        elif len(stores) == 2:
+            store_a, store_b = stores
+            for entity, entity_id in rows:
+                yield (entity, store_a[entity_id], store_b[entity_id])
+        elif len(stores) == 3:
+            store_a, store_b, store_c = stores
+            for entity, entity_id in rows:
+                yield (entity, store_a[entity_id], store_b[entity_id], store_c[entity_id])
+        else:
+            for entity, entity_id in rows:
+                yield (entity, *[store[entity_id] for store in stores])
+    
+    def _iter_matching(self, component_types: tuple) -> Iterator[tuple[Entity, EntityId]]:
+        """Internal: Yield (entity, id) for entities having all component types."""
+        if not component_types:
+            # Iterate over a copy to prevent RuntimeError if dict changes during iteration
+            for entity in list(self._entities.values()):
+                yield entity, entity.id
+            return
+        
+        mask = self._query_mask(component_types)
+        if mask is None:
+            return  # No entities have one of these components
+        
+        archetypes = self._archetype_matches.get(mask)
+        if archetypes is None:
+            archetypes = self._archetype_matches[mask] = [
+                members for signature, members in self._archetypes.items()
+                if signature & mask == mask
+            ]
+        
+        # Snapshot the members to prevent RuntimeError if an entity changes
+        # archetype during iteration; re-check the signature before yielding
+        # so entities that lost a component or were destroyed are skipped
+        signatures = self._signatures
+        rows = [(entity, entity_id) for members in archetypes for entity_id, entity in members.items()]
+        for entity, entity_id in rows:
+            if signatures.get(entity_id, 0) & mask == mask:
+                yield entity, entity_id
+    
+    def _type_bit(self, component_type: Type) -> int:
+        """Internal: Get (assigning on first use) the signature bit of a component type."""
+        bit = self._type_bits.get(component_type)
+        if bit is None:
+            bit = self._type_bits[component_type] = 1 << self._registry.type_id(component_type)
+            self._bit_types[bit] = component_type
+        return bit
+    
+    def _query_mask(self, component_types: tuple) -> Optional[int]:
+        """Internal: OR of the type bits, or None if a type was never added."""
+        type_bits = self._type_bits
+        mask = 0
         for ct in component_types:
-            if ct not in self._by_component:
-                return  # No entities have this component
-            sets.append(self._by_component[ct])
-        
-        # Sort by size and intersect
-        sets.sort(key=len)
-        result = sets[0].copy()
-        for s in sets[1:]:
-            result &= s
-        
-        # Convert IDs back to entities
-        # Iterate over a copy to prevent RuntimeError if set changes during iteration
-        for entity in list(self._entities):
-            if entity.id in result:
-                yield entity
+            bit = type_bits.get(ct)
+            if bit is None:
+                return None
+            mask |= bit
+        return mask
     
     def get_components(self, entity: Entity) -> Dict[Type, Any]:
         """Get all components for an entity as a dict."""
-        return self._components.get(entity.id, {}).copy()
+        entity_id = entity.id
+        return {
+            comp_type: store[entity_id]
+            for comp_type, store in self._stores.items()
+            if entity_id in store
+        }
     
     # Tag system for quick categorization
     def add_tag(self, entity: Entity, tag: str) -> None:
         """Add a tag to an entity (e.g., 'enemy', 'projectile')."""
-        if tag not in self._tags:
+        bit = self._tag_bits.get(tag)
+        if bit is None:
+            bit = self._tag_bits[tag] = 1 << len(self._tag_names)
+            self._tag_names.append(tag)
             self._tags[tag] = set()
+        self._tag_masks[entity.id] = self._tag_masks.get(entity.id, 0) | bit
         self._tags[tag].add(entity)
     
     def remove_tag(self, entity: Entity, tag: str) -> None:
         """Remove a tag from an entity."""
-        if tag in self._tags:
+        bit = self._tag_bits.get(tag)
+        if bit is not None and entity.id in self._tag_masks:
+            self._tag_masks[entity.id] &= ~bit
             self._tags[tag].discard(entity)
     
     def has_tag(self, entity: Entity, tag: str) -> bool:
         """Check if an entity has a specific tag."""
-        return tag in self._tags and entity in self._tags[tag]
+        bit = self._tag_bits.get(tag)
+        return bit is not None and self._tag_masks.get(entity.id, 0) & bit != 0
     
     def get_entities_with_tag(self, tag: str) -> Iterator[Entity]:
         """Get all entities with a specific tag."""
         if tag in self._tags:
             # Iterate over a copy to prevent RuntimeError if set changes during iteration
             for entity in list(self._tags[tag]):
-                if entity in self._entities:
+                if entity.id in self._entities:
                     yield entity
     
     # Named entity lookup
@@ -340,6 +532,11 @@ class EntityManager:
             del self._named[old]
         self._named[name] = entity
     
+    @property
+    def registry(self) -> ComponentRegistry:
+        """Component registry used for pooled component instances."""
+        return self._registry
+    
     @property
     def entity_count(self) -> int:
         """Number of active entities."""
@@ -348,8 +545,8 @@ class EntityManager:
     def __iter__(self) -> Iterator[Entity]:
         """Iterate over all active entities."""
         # Return iterator over a copy to prevent RuntimeError if set changes during iteration
-        return iter(list(self._entities))
+        return iter(list(self._entities.values()))
     
     def __contains__(self, entity: Entity) -> bool:
         """Check if entity is managed by this manager."""
-        return entity in self._entities
+        return entity.id in self._entities
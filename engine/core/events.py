@@ -30,20 +30,20 @@ class Event:
 @dataclass
 class EntityCreatedEvent(Event):
     """Fired when an entity is created."""
-    entity_id: str
+    entity_id: int
 
 
 @dataclass
 class EntityDestroyedEvent(Event):
     """Fired when an entity is marked for destruction."""
-    entity_id: str
+    entity_id: int
 
 
 @dataclass 
 class CollisionEvent(Event):
     """Fired when two entities collide."""
-    entity_a_id: str
-    entity_b_id: str
+    entity_a_id: int
+    entity_b_id: int
     normal_x: float = 0.0
     normal_y: float = 0.0
     penetration: float = 0.0
@@ -52,8 +52,8 @@ class CollisionEvent(Event):
 @dataclass
 class DamageEvent(Event):
     """Fired when damage should be applied."""
-    target_id: str
-    source_id: Optional[str]
+    target_id: int
+    source_id: Optional[int]
     amount: float
     damage_type: str = "normal"
 
@@ -61,8 +61,8 @@ class DamageEvent(Event):
 @dataclass
 class DeathEvent(Event):
     """Fired when an entity dies."""
-    entity_id: str
-    killer_id: Optional[str] = None
+    entity_id: int
+    killer_id: Optional[int] = None
 
 
 @dataclass
@@ -81,8 +81,8 @@ class WaveCompleteEvent(Event):
 @dataclass
 class ProjectileFiredEvent(Event):
     """Fired when a projectile is created."""
-    projectile_id: str
-    owner_id: str
+    projectile_id: int
+    owner_id: int
     x: float
     y: float
     angle: float
@@ -122,7 +122,7 @@ class EventBus:
         bus.subscribe(DamageEvent, lambda e: apply_damage(e.target_id, e.amount))
         
         # Fire
-        bus.emit(DamageEvent(target_id="enemy1", source_id="player", amount=10))
+        bus.emit(DamageEvent(target_id=enemy.id, source_id=player.id, amount=10))
     """
     
     def __init__(self):
@@ -0,0 +1,18 @@
+"""
+Shared random number source for gameplay code.
+
+Every spawner, AI decision and damage roll draws from the single RNG
+instance below instead of the global `random` module state, so a whole
+run can be replayed by calling reseed() with the same seed.
+"""
+
+import random
+from typing import Optional
+
+
+RNG = random.Random()
+
+
+def reseed(seed: Optional[int] = None) -> None:
+    """Reseed the shared RNG (None reseeds from system entropy)."""
+    RNG.seed(seed)
@@ -11,7 +11,8 @@ Design Philosophy:
 
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional, Type, TYPE_CHECKING
+from operator import attrgetter
+from typing import Callable, List, Dict, Optional, Tuple, Type, TYPE_CHECKING
 from enum import IntEnum
 from dataclasses import dataclass
 
@@ -40,6 +41,9 @@ class SystemPriority(IntEnum):
     RENDER = 1000      # Render last
 
 
+_priority_key = attrgetter("priority")
+
+
 class GameSystem(ABC):
     """
     Base class for all game systems.
@@ -59,11 +63,24 @@ class GameSystem(ABC):
     
     def __init__(self, priority: int = SystemPriority.PHYSICS):
         self.priority = priority
-        self.enabled = True
+        self._enabled = True
+        self._manager: Optional[SystemManager] = None
         self._entity_manager: Optional[EntityManager] = None
         self._event_bus: Optional[EventBus] = None
         self._initialized = False
     
+    @property
+    def enabled(self) -> bool:
+        """Whether the SystemManager calls update() for this system."""
+        return self._enabled
+    
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        if value != self._enabled:
+            self._enabled = value
+            if self._manager is not None:
+                self._manager._invalidate()
+    
     def inject_dependencies(
         self,
         entity_manager: EntityManager,
@@ -130,6 +147,10 @@ class SystemManager:
     - Call update(dt) in correct order
     - Manage system lifecycle (init, update, cleanup)
     - Allow enabling/disabling systems at runtime
+    
+    The sorted bound update() methods of enabled systems are cached in a
+    tuple, rebuilt only when a system is added, removed, enabled or
+    disabled, so a frame is a plain loop over that tuple.
     """
     
     def __init__(
@@ -142,6 +163,7 @@ class SystemManager:
         self._systems: List[GameSystem] = []
         self._systems_by_type: Dict[Type[GameSystem], GameSystem] = {}
         self._sorted = False
+        self._update_fns: Optional[Tuple[Callable[[float], None], ...]] = None
     
     def add_system(self, system: GameSystem) -> GameSystem:
         """
@@ -161,7 +183,8 @@ class SystemManager:
         
         # Add to list and mark for re-sorting
         self._systems.append(system)
-        self._sorted = False
+        system._manager = self
+        self._invalidate()
         
         # Initialize
         system.initialize()
@@ -183,6 +206,8 @@ class SystemManager:
         if system:
             system.cleanup()
             self._systems.remove(system)
+            system._manager = None
+            self._invalidate()
         return system
     
     def get_system(self, system_type: Type[GameSystem]) -> Optional[GameSystem]:
@@ -196,15 +221,27 @@ class SystemManager:
         Args:
             dt: Delta time in seconds
         """
-        # Sort by priority if needed
-        if not self._sorted:
-            self._systems.sort(key=lambda s: s.priority)
-            self._sorted = True
+        update_fns = self._update_fns
+        if update_fns is None:
+            if not self._sorted:
+                self._sort()
+            update_fns = self._update_fns = tuple(
+                system.update for system in self._systems if system.enabled
+            )
         
         # Update enabled systems
-        for system in self._systems:
-            if system.enabled:
-                system.update(dt)
+        for update in update_fns:
+            update(dt)
+    
+    def _sort(self) -> None:
+        """Internal: Sort systems by priority (stable, so ties keep registration order)."""
+        self._systems.sort(key=_priority_key)
+        self._sorted = True
+    
+    def _invalidate(self) -> None:
+        """Internal: Force a re-sort and update tuple rebuild on the next frame."""
+        self._sorted = False
+        self._update_fns = None
     
     def cleanup(self) -> None:
         """Clean up all systems."""
@@ -213,6 +250,7 @@ class SystemManager:
                 system.cleanup()
         self._systems.clear()
         self._systems_by_type.clear()
+        self._update_fns = None
     
     def enable_system(self, system_type: Type[GameSystem]) -> bool:
         """Enable a system by type. Returns True if found."""
@@ -238,6 +276,5 @@ class SystemManager:
     def get_all_systems(self) -> List[GameSystem]:
         """Get all systems in priority order."""
         if not self._sorted:
-            self._systems.sort(key=lambda s: s.priority)
-            self._sorted = True
+            self._sort()
         return list(self._systems)
@@ -15,6 +15,10 @@ from .core import EntityManager, SystemManager, EventBus, GameSystem
 from .core.events import GameStateEvent
 
 
+# Module-level binding for the per-frame clock reads
+_perf_counter = time.perf_counter
+
+
 class GameState(Enum):
     """High-level game states."""
     INITIALIZING = auto()
@@ -25,7 +29,7 @@ class GameState(Enum):
     QUIT = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class FrameStats:
     """Statistics about frame timing."""
     frame_count: int = 0
@@ -60,7 +64,7 @@ class GameLoop:
         4. Flush deferred entity destruction
         5. Flush deferred events
         6. Update screen
-        7. Sleep to maintain target FPS
+        7. Sleep (then spin) until the frame deadline to maintain target FPS
     """
     
     def __init__(
@@ -84,12 +88,17 @@ class GameLoop:
         self.event_bus: Optional[EventBus] = None
         self.system_manager: Optional[SystemManager] = None
         
-        # State
+        # State (setting it also refreshes the cached `playing` flag)
+        self.playing = False
         self.state = GameState.INITIALIZING
         self.frame_stats = FrameStats()
         self._last_frame_time = 0.0
         self._running = False
         
+        # Running estimate of how long time.sleep(0.001) really takes; the
+        # frame cap sleeps while more than this remains, then spins
+        self._sleep_precision = 2e-3
+        
         # Callbacks
         self._on_update_callbacks: List[Callable[[float], None]] = []
         self._on_state_change_callbacks: List[Callable[[GameState], None]] = []
@@ -117,6 +126,17 @@ class GameLoop:
         # Start in INITIALIZING state - game will change to RUNNING when player starts
         self.state = GameState.INITIALIZING
     
+    @property
+    def state(self) -> GameState:
+        """Current high-level game state."""
+        return self._state
+    
+    @state.setter
+    def state(self, value: GameState) -> None:
+        self._state = value
+        # Cached so the per-frame checks are a plain attribute read
+        self.playing = value is GameState.RUNNING
+    
     def add_system(self, system: GameSystem) -> GameSystem:
         """Add a system to the engine."""
         if self.system_manager is None:
@@ -162,11 +182,14 @@ class GameLoop:
             self.initialize()
         
         self._running = True
-        self._last_frame_time = time.time()
+        self._last_frame_time = time.perf_counter()
         
+        # Bind the per-frame call and loop condition once
+        frame = self._frame
+        quit_state = GameState.QUIT
         try:
-            while self._running and self.state != GameState.QUIT:
-                self._frame()
+            while self._running and self._state is not quit_state:
+                frame()
         except turtle.Terminator:
             pass
         except KeyboardInterrupt:
@@ -177,14 +200,15 @@ class GameLoop:
     def _frame(self) -> None:
         """Execute one frame."""
         # Calculate delta time
-        current_time = time.time()
+        current_time = _perf_counter()
         dt = current_time - self._last_frame_time
         self._last_frame_time = current_time
         
         # Clamp dt to prevent spiral of death and validate
-        if not isinstance(dt, (int, float)) or dt < 0 or dt != dt:  # NaN check
+        if dt < 0 or dt != dt:  # NaN check
             dt = self.target_dt
-        dt = min(dt, 0.1)  # Max 100ms per frame
+        elif dt > 0.1:
+            dt = 0.1  # Max 100ms per frame
         
         # Update frame stats
         try:
@@ -193,7 +217,7 @@ class GameLoop:
             pass
         
         # Only update game logic when running (not when paused, in menu, or initializing)
-        if self.state == GameState.RUNNING:
+        if self.playing:
             # Update systems
             if self.system_manager:
                 try:
@@ -232,13 +256,29 @@ class GameLoop:
         
         # Frame rate limiting
         try:
-            elapsed = time.time() - current_time
-            sleep_time = self.target_dt - elapsed
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+            self._wait_until(current_time + self.target_dt)
         except Exception:
             pass
     
+    def _wait_until(self, deadline: float) -> None:
+        """
+        Block until the frame deadline (a time.perf_counter() value).
+        
+        A single time.sleep() for the whole remainder oversleeps by the OS
+        scheduler resolution, so sleep in 1ms steps while the remaining time
+        exceeds the measured sleep precision, then spin for the rest.
+        """
+        perf_counter = _perf_counter
+        sleep = time.sleep
+        while True:
+            remaining = deadline - perf_counter()
+            if remaining <= 0:
+                break
+            if remaining > self._sleep_precision:
+                start = perf_counter()
+                sleep(0.001)
+                self._sleep_precision = 0.9 * self._sleep_precision + 0.1 * (perf_counter() - start)
+    
     def _update_stats(self, dt: float) -> None:
         """Update frame statistics."""
         self.frame_stats.frame_count += 1
@@ -7,8 +7,7 @@ behavior-specific logic for different enemy types.
 
 from __future__ import annotations
 import math
-import random
-from typing import TYPE_CHECKING, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 from ..core.system import GameSystem, SystemPriority
 from ..components.transform import Transform
@@ -17,11 +16,73 @@ from ..components.weapon import Weapon
 from ..components.ai import AIBrain, AIBehavior, AIState
 from ..components.health import Health
 from ..components.tags import PlayerTag, EnemyTag
+from ..core.rng import RNG
 
 if TYPE_CHECKING:
     from ..core.entity import Entity
 
 
+def _flock_forces(
+    flock: Dict[Tuple[int, int], List[Tuple[int, float, float, float, float]]],
+    cell: float,
+    entity_id: int,
+    x: float,
+    y: float,
+    neighbor_distance: float,
+    separation_distance: float
+) -> Tuple[int, float, float, float, float, float, float]:
+    """
+    Accumulate raw boids forces for one swarm member.
+    
+    Scans the 3x3 block of flock cells around (x, y) using scalar locals
+    only. Returns (neighbor_count, separation_x, separation_y, alignment_x,
+    alignment_y, cohesion_x, cohesion_y); averaging and weighting are left
+    to the caller.
+    """
+    sqrt = math.sqrt
+    count = 0
+    sep_x = sep_y = 0.0
+    align_x = align_y = 0.0
+    coh_x = coh_y = 0.0
+    neighbor_sq = neighbor_distance * neighbor_distance
+    cx = int(x // cell)
+    cy = int(y // cell)
+    
+    for gx in (cx - 1, cx, cx + 1):
+        for gy in (cy - 1, cy, cy + 1):
+            bucket = flock.get((gx, gy))
+            if not bucket:
+                continue
+            for other_id, other_x, other_y, other_vx, other_vy in bucket:
+                if other_id == entity_id:
+                    continue
+                
+                dx = other_x - x
+                dy = other_y - y
+                dist_sq = dx * dx + dy * dy
+                if dist_sq >= neighbor_sq:
+                    continue
+                dist = sqrt(dist_sq)
+                
+                if dist < neighbor_distance and dist > 0.001:
+                    count += 1
+                    
+                    # Separation: push away from very close neighbors
+                    if dist < separation_distance:
+                        sep_x -= dx / dist
+                        sep_y -= dy / dist
+                    
+                    # Alignment: match velocity of neighbors
+                    align_x += other_vx
+                    align_y += other_vy
+                    
+                    # Cohesion: move toward center of flock
+                    coh_x += dx
+                    coh_y += dy
+    
+    return count, sep_x, sep_y, align_x, align_y, coh_x, coh_y
+
+
 class AISystem(GameSystem):
     """
     Handles all enemy AI behavior.
@@ -41,6 +102,31 @@ class AISystem(GameSystem):
         super().__init__(priority=SystemPriority.AI)
         self._player_entity: Optional[Entity] = None
         self._player_transform: Optional[Transform] = None
+        
+        # Player position snapshot for the current frame (AI never moves the
+        # player, so every distance/direction query can read these floats)
+        self._player_x = 0.0
+        self._player_y = 0.0
+        
+        # Swarm snapshot for the current frame, gathered on first use and
+        # bucketed into a uniform hash grid so each boid only scans the 3x3
+        # cells around it
+        self._flock: Optional[Dict[Tuple[int, int], List[Tuple[int, float, float, float, float]]]] = None
+        self._flock_cell = 100.0
+        self._ai_rows: List[Tuple[Entity, AIBrain, Transform]] = []
+        
+        # Behavior dispatch table (one dict lookup per entity instead of
+        # walking an if/elif chain)
+        self._behavior_handlers = {
+            AIBehavior.CHASER: self._process_chaser,
+            AIBehavior.TURRET: self._process_turret,
+            AIBehavior.SWARM: self._process_swarm,
+            AIBehavior.PATROL: self._process_patrol,
+            AIBehavior.ORBIT: self._process_orbit,
+            AIBehavior.BOSS: self._process_boss,
+            AIBehavior.WANDER: self._process_wander,
+            AIBehavior.FLEE: self._process_flee,
+        }
     
     def update(self, dt: float) -> None:
         """Process AI for all entities with AIBrain."""
@@ -51,21 +137,21 @@ class AISystem(GameSystem):
         # Cache player reference
         self._update_player_cache()
         
-        # Get all AI entities
+        # Get all AI entities together with their brain and transform in a
+        # single pass; behaviors (swarm neighbours included) reuse these rows
+        # instead of re-fetching components per entity
         try:
-            ai_entities = list(self.entities.get_entities_with(AIBrain, Transform))
+            ai_rows = list(self.entities.query(AIBrain, Transform))
         except Exception:
             return
         
-        for entity in ai_entities:
+        self._flock = None
+        self._ai_rows = ai_rows
+        handlers = self._behavior_handlers
+        is_alive = self.entities.is_alive
+        for entity, brain, transform in ai_rows:
             # Skip destroyed entities
-            if not self.entities.is_alive(entity):
-                continue
-                
-            brain = self.entities.get_component(entity, AIBrain)
-            transform = self.entities.get_component(entity, Transform)
-            
-            if not brain or not transform:
+            if not is_alive(entity):
                 continue
             
             try:
@@ -76,22 +162,9 @@ class AISystem(GameSystem):
                 brain.state_timer += dt
                 
                 # Process based on behavior type
-                if brain.behavior == AIBehavior.CHASER:
-                    self._process_chaser(entity, brain, transform, dt)
-                elif brain.behavior == AIBehavior.TURRET:
-                    self._process_turret(entity, brain, transform, dt)
-                elif brain.behavior == AIBehavior.SWARM:
-                    self._process_swarm(entity, brain, transform, ai_entities, dt)
-                elif brain.behavior == AIBehavior.PATROL:
-                    self._process_patrol(entity, brain, transform, dt)
-                elif brain.behavior == AIBehavior.ORBIT:
-                    self._process_orbit(entity, brain, transform, dt)
-                elif brain.behavior == AIBehavior.BOSS:
-                    self._process_boss(entity, brain, transform, dt)
-                elif brain.behavior == AIBehavior.WANDER:
-                    self._process_wander(entity, brain, transform, dt)
-                elif brain.behavior == AIBehavior.FLEE:
-                    self._process_flee(entity, brain, transform, dt)
+                handler = handlers.get(brain.behavior)
+                if handler:
+                    handler(entity, brain, transform, dt)
             except Exception:
                 # Continue processing other entities if one fails
                 continue
@@ -110,6 +183,10 @@ class AISystem(GameSystem):
             )
         else:
             self._player_transform = None
+        
+        if self._player_transform:
+            self._player_x = self._player_transform.x
+            self._player_y = self._player_transform.y
     
     def _get_direction_to_player(
         self,
@@ -119,14 +196,24 @@ class AISystem(GameSystem):
         if not self._player_transform:
             return (0, 0, float('inf'))
         
-        dx = self._player_transform.x - transform.x
-        dy = self._player_transform.y - transform.y
+        dx = self._player_x - transform.x
+        dy = self._player_y - transform.y
         dist = math.sqrt(dx * dx + dy * dy)
         
         if dist > 0.001:
-            return (dx / dist, dy / dist, dist)
+            inv_dist = 1.0 / dist
+            return (dx * inv_dist, dy * inv_dist, dist)
         return (0, 0, 0)
     
+    def _get_player_distance_sq(self, transform: Transform) -> float:
+        """Get squared distance to player (range checks need no sqrt)."""
+        if not self._player_transform:
+            return float('inf')
+        
+        dx = self._player_x - transform.x
+        dy = self._player_y - transform.y
+        return dx * dx + dy * dy
+    
     def _rotate_toward(
         self,
         transform: Transform,
@@ -138,12 +225,8 @@ class AISystem(GameSystem):
         """Smoothly rotate toward a target. Returns angle difference."""
         target_angle = transform.angle_to(target_x, target_y)
         
-        # Calculate shortest rotation direction
-        diff = target_angle - transform.angle
-        while diff > 180:
-            diff -= 360
-        while diff < -180:
-            diff += 360
+        # Calculate shortest rotation direction (wrapped into [-180, 180))
+        diff = (target_angle - transform.angle + 180.0) % 360.0 - 180.0
         
         # Apply rotation with speed limit
         max_rotation = brain.turn_speed * dt
@@ -158,6 +241,7 @@ class AISystem(GameSystem):
     def _apply_movement(
         self,
         entity: Entity,
+        brain: AIBrain,
         dir_x: float,
         dir_y: float,
         speed_mult: float = 1.0
@@ -169,11 +253,7 @@ class AISystem(GameSystem):
         
         physics = self.entities.get_component(entity, Physics)
         velocity = self.entities.get_component(entity, Velocity)
-        brain = self.entities.get_component(entity, AIBrain)
         
-        if not brain:
-            return
-            
         # Clamp speed multiplier to reasonable values
         speed_mult = max(0.0, min(5.0, speed_mult))
         brain_speed = max(0.0, min(5.0, brain.speed_multiplier))
@@ -210,26 +290,27 @@ class AISystem(GameSystem):
         dt: float
     ) -> None:
         """Chaser AI: Rush directly at player."""
-        dir_x, dir_y, dist = self._get_direction_to_player(transform)
+        dist_sq = self._get_player_distance_sq(transform)
         
-        if dist == float('inf'):
+        if dist_sq == float('inf'):
             brain.change_state(AIState.IDLE)
             return
         
-        if dist < brain.awareness_range:
+        if dist_sq < brain.awareness_range * brain.awareness_range:
             brain.change_state(AIState.CHASING)
+            dir_x, dir_y, dist = self._get_direction_to_player(transform)
             
             # Rotate toward player
             if self._player_transform:
                 self._rotate_toward(
                     transform, brain,
-                    self._player_transform.x,
-                    self._player_transform.y,
+                    self._player_x,
+                    self._player_y,
                     dt
                 )
             
             # Move toward player
-            self._apply_movement(entity, dir_x, dir_y)
+            self._apply_movement(entity, brain, dir_x, dir_y)
             
             # Attack if in range
             if dist < brain.attack_range:
@@ -251,9 +332,9 @@ class AISystem(GameSystem):
         dt: float
     ) -> None:
         """Turret AI: Stationary, rotate and shoot."""
-        dir_x, dir_y, dist = self._get_direction_to_player(transform)
+        dist_sq = self._get_player_distance_sq(transform)
         
-        if dist == float('inf'):
+        if dist_sq == float('inf'):
             brain.change_state(AIState.IDLE)
             return
         
@@ -267,18 +348,19 @@ class AISystem(GameSystem):
             velocity.vx = 0
             velocity.vy = 0
         
-        if dist < brain.awareness_range:
+        if dist_sq < brain.awareness_range * brain.awareness_range:
             # Rotate toward player
             if self._player_transform:
                 angle_diff = self._rotate_toward(
                     transform, brain,
-                    self._player_transform.x,
-                    self._player_transform.y,
+                    self._player_x,
+                    self._player_y,
                     dt
                 )
                 
                 # Only fire if roughly facing player
-                if dist < brain.attack_range and abs(angle_diff) < 15:
+                in_range = dist_sq < brain.attack_range * brain.attack_range
+                if in_range and abs(angle_diff) < 15:
                     brain.change_state(AIState.ATTACKING)
                     self._try_attack(entity, brain)
                 else:
@@ -286,80 +368,93 @@ class AISystem(GameSystem):
         else:
             brain.change_state(AIState.IDLE)
     
+    def _gather_flock(
+        self,
+        ai_rows: List[Tuple[Entity, AIBrain, Transform]]
+    ) -> Dict[Tuple[int, int], List[Tuple[int, float, float, float, float]]]:
+        """
+        Snapshot every swarm member as flat (id, x, y, vx, vy) rows.
+        
+        AI only steers through acceleration, so positions and velocities
+        are stable for the whole AI pass and each boid's neighbour scan
+        can read plain floats instead of fetching components per pair.
+        Rows are bucketed by cell, with the cell size set to the largest
+        neighbour distance so a 3x3 block always covers a boid's range.
+        """
+        members = []
+        cell = 1.0
+        get_component = self.entities.get_component
+        for other, other_brain, other_transform in ai_rows:
+            if other_brain.behavior != AIBehavior.SWARM:
+                continue
+            velocity = get_component(other, Velocity)
+            if velocity:
+                vx, vy = velocity.vx, velocity.vy
+            else:
+                vx = vy = 0.0
+            members.append((other.id, other_transform.x, other_transform.y, vx, vy))
+            if other_brain.neighbor_distance > cell:
+                cell = other_brain.neighbor_distance
+        
+        grid: Dict[Tuple[int, int], List[Tuple[int, float, float, float, float]]] = {}
+        for row in members:
+            key = (int(row[1] // cell), int(row[2] // cell))
+            bucket = grid.get(key)
+            if bucket is None:
+                grid[key] = [row]
+            else:
+                bucket.append(row)
+        self._flock_cell = cell
+        return grid
+    
     def _process_swarm(
         self,
         entity: Entity,
         brain: AIBrain,
         transform: Transform,
-        all_ai_entities: List[Entity],
         dt: float
     ) -> None:
         """Swarm AI: Flocking behavior (boids)."""
-        # Boids forces
-        separation = [0.0, 0.0]
-        alignment = [0.0, 0.0]
-        cohesion = [0.0, 0.0]
-        neighbor_count = 0
+        flock = self._flock
+        if flock is None:
+            flock = self._flock = self._gather_flock(self._ai_rows)
         
-        for other in all_ai_entities:
-            if other.id == entity.id:
-                continue
-            
-            other_brain = self.entities.get_component(other, AIBrain)
-            if not other_brain or other_brain.behavior != AIBehavior.SWARM:
-                continue
-            
-            other_transform = self.entities.get_component(other, Transform)
-            if not other_transform:
-                continue
-            
-            dx = other_transform.x - transform.x
-            dy = other_transform.y - transform.y
-            dist = math.sqrt(dx * dx + dy * dy)
-            
-            if dist < brain.neighbor_distance and dist > 0.001:
-                neighbor_count += 1
-                
-                # Separation: push away from very close neighbors
-                if dist < brain.separation_distance:
-                    separation[0] -= dx / dist
-                    separation[1] -= dy / dist
-                
-                # Alignment: match velocity of neighbors
-                other_velocity = self.entities.get_component(other, Velocity)
-                if other_velocity:
-                    alignment[0] += other_velocity.vx
-                    alignment[1] += other_velocity.vy
-                
-                # Cohesion: move toward center of flock
-                cohesion[0] += dx
-                cohesion[1] += dy
+        # Boids forces
+        (neighbor_count, sep_x, sep_y, align_x, align_y,
+         coh_x, coh_y) = _flock_forces(
+            flock, self._flock_cell, entity.id, transform.x, transform.y,
+            brain.neighbor_distance, brain.separation_distance
+        )
         
         # Normalize and weight forces
         move_x, move_y = 0.0, 0.0
         
         if neighbor_count > 0:
+            # Each force is scaled to unit length by a single reciprocal
+            # that also carries its weight. Averaging alignment/cohesion over
+            # neighbor_count would not change their direction, so it's skipped.
+            sqrt = math.sqrt
+            
             # Separation
-            sep_mag = math.sqrt(separation[0]**2 + separation[1]**2)
-            if sep_mag > 0:
-                move_x += (separation[0] / sep_mag) * brain.separation_weight
-                move_y += (separation[1] / sep_mag) * brain.separation_weight
+            sep_mag_sq = sep_x * sep_x + sep_y * sep_y
+            if sep_mag_sq > 0:
+                scale = brain.separation_weight / sqrt(sep_mag_sq)
+                move_x += sep_x * scale
+                move_y += sep_y * scale
             
             # Alignment
-            alignment[0] /= neighbor_count
-            alignment[1] /= neighbor_count
-            align_mag = math.sqrt(alignment[0]**2 + alignment[1]**2)
-            if align_mag > 0:
-                move_x += (alignment[0] / align_mag) * brain.alignment_weight
-                move_y += (alignment[1] / align_mag) * brain.alignment_weight
+            align_mag_sq = align_x * align_x + align_y * align_y
+            if align_mag_sq > 0:
+                scale = brain.alignment_weight / sqrt(align_mag_sq)
+                move_x += align_x * scale
+                move_y += align_y * scale
             
             # Cohesion
-            cohesion[0] /= neighbor_count
-            cohesion[1] /= neighbor_count
-            coh_mag = math.sqrt(cohesion[0]**2 + cohesion[1]**2)
-            if coh_mag > 0:
-                move_x += (cohesion[0] / coh_mag) * brain.cohesion_weight
-                move_y += (cohesion[1] / coh_mag) * brain.cohesion_weight
+            coh_mag_sq = coh_x * coh_x + coh_y * coh_y
+            if coh_mag_sq > 0:
+                scale = brain.cohesion_weight / sqrt(coh_mag_sq)
+                move_x += coh_x * scale
+                move_y += coh_y * scale
         
         # Add attraction to player
         dir_x, dir_y, dist = self._get_direction_to_player(transform)
@@ -371,11 +466,12 @@ class AISystem(GameSystem):
                 self._try_attack(entity, brain)
         
         # Normalize final direction
-        mag = math.sqrt(move_x**2 + move_y**2)
+        mag = math.sqrt(move_x * move_x + move_y * move_y)
         if mag > 0.001:
-            move_x /= mag
-            move_y /= mag
-            self._apply_movement(entity, move_x, move_y)
+            inv_mag = 1.0 / mag
+            move_x *= inv_mag
+            move_y *= inv_mag
+            self._apply_movement(entity, brain, move_x, move_y)
             
             # Face movement direction
             transform.angle = math.degrees(math.atan2(move_y, move_x))
@@ -388,19 +484,20 @@ class AISystem(GameSystem):
         dt: float
     ) -> None:
         """Patrol AI: Follow waypoints, chase if player nearby."""
-        dir_x, dir_y, dist = self._get_direction_to_player(transform)
+        dist_sq = self._get_player_distance_sq(transform)
         
         # Check if should chase player
-        if dist < brain.awareness_range:
+        if dist_sq < brain.awareness_range * brain.awareness_range:
+            dir_x, dir_y, dist = self._get_direction_to_player(transform)
             # Switch to chasing
             if self._player_transform:
                 self._rotate_toward(
                     transform, brain,
-                    self._player_transform.x,
-                    self._player_transform.y,
+                    self._player_x,
+                    self._player_y,
                     dt
                 )
-            self._apply_movement(entity, dir_x, dir_y)
+            self._apply_movement(entity, brain, dir_x, dir_y)
             
             if dist < brain.attack_range:
                 self._try_attack(entity, brain)
@@ -413,16 +510,17 @@ class AISystem(GameSystem):
         
         wp_dx = waypoint[0] - transform.x
         wp_dy = waypoint[1] - transform.y
-        wp_dist = math.sqrt(wp_dx * wp_dx + wp_dy * wp_dy)
+        wp_dist_sq = wp_dx * wp_dx + wp_dy * wp_dy
         
-        if wp_dist < brain.waypoint_threshold:
+        if wp_dist_sq < brain.waypoint_threshold * brain.waypoint_threshold:
             # Reached waypoint, move to next
             brain.advance_waypoint()
         else:
-            # Move toward waypoint
+            # Move toward waypoint (only now is the actual distance needed)
             self._rotate_toward(transform, brain, waypoint[0], waypoint[1], dt)
+            wp_dist = math.sqrt(wp_dist_sq)
             if wp_dist > 0.001:
-                self._apply_movement(entity, wp_dx/wp_dist, wp_dy/wp_dist, 0.5)
+                self._apply_movement(entity, brain, wp_dx/wp_dist, wp_dy/wp_dist, 0.5)
     
     def _process_orbit(
         self,
@@ -451,15 +549,15 @@ class AISystem(GameSystem):
         move_x = orbit_x + dir_x * approach_weight
         move_y = orbit_y + dir_y * approach_weight
         
-        mag = math.sqrt(move_x**2 + move_y**2)
+        mag = math.sqrt(move_x * move_x + move_y * move_y)
         if mag > 0.001:
-            self._apply_movement(entity, move_x/mag, move_y/mag)
+            self._apply_movement(entity, brain, move_x/mag, move_y/mag)
         
         # Always face player
         self._rotate_toward(
             transform, brain,
-            self._player_transform.x,
-            self._player_transform.y,
+            self._player_x,
+            self._player_y,
             dt
         )
         
@@ -514,18 +612,18 @@ class AISystem(GameSystem):
         """Wander AI: Random movement."""
         # Change direction periodically
         if brain.state_timer > brain.state_duration:
-            new_angle = random.uniform(0, 360)
-            brain.state_duration = random.uniform(1.0, 3.0)
+            new_angle = RNG.uniform(0, 360)
+            brain.state_duration = RNG.uniform(1.0, 3.0)
             brain.change_state(AIState.SEEKING, brain.state_duration)
         
         # Move forward
         fx, fy = transform.forward_vector()
-        self._apply_movement(entity, fx, fy, 0.5)
+        self._apply_movement(entity, brain, fx, fy, 0.5)
         
         # Slight random turning
         velocity = self.entities.get_component(entity, Velocity)
         if velocity:
-            velocity.angular = random.uniform(-30, 30)
+            velocity.angular = RNG.uniform(-30, 30)
     
     def _process_flee(
         self,
@@ -535,11 +633,12 @@ class AISystem(GameSystem):
         dt: float
     ) -> None:
         """Flee AI: Run away from player."""
-        dir_x, dir_y, dist = self._get_direction_to_player(transform)
+        dist_sq = self._get_player_distance_sq(transform)
         
-        if dist < brain.awareness_range:
+        if dist_sq < brain.awareness_range * brain.awareness_range:
+            dir_x, dir_y, dist = self._get_direction_to_player(transform)
             # Run away
-            self._apply_movement(entity, -dir_x, -dir_y, 1.2)
+            self._apply_movement(entity, brain, -dir_x, -dir_y, 1.2)
             
             # Face away from player
             transform.angle = math.degrees(math.atan2(-dir_y, -dir_x))
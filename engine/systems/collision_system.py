@@ -8,7 +8,7 @@ Uses a two-phase approach:
 
 from __future__ import annotations
 import math
-from typing import TYPE_CHECKING, List, Tuple, Dict, Set
+from typing import TYPE_CHECKING, Iterator, List, Tuple, Dict, Set
 from dataclasses import dataclass
 
 from ..core.system import GameSystem, SystemPriority
@@ -31,7 +31,7 @@ def _sanitize_float(value: float, default: float = 0.0) -> float:
     return value if _is_valid_float(value) else default
 
 
-@dataclass
+@dataclass(slots=True)
 class CollisionPair:
     """Data about a collision between two entities."""
     entity_a: Entity
@@ -56,15 +56,13 @@ class SpatialGrid:
         self.cols = max(1, int(math.ceil(width / cell_size)))
         self.rows = max(1, int(math.ceil(height / cell_size)))
         self.cells: Dict[Tuple[int, int], List[Entity]] = {}
-        self.entity_cells: Dict[str, List[Tuple[int, int]]] = {}
     
     def clear(self) -> None:
         """Clear all entities from the grid."""
         self.cells.clear()
-        self.entity_cells.clear()
     
-    def insert(self, entity: Entity, x: float, y: float, radius: float) -> None:
-        """Insert an entity into the grid based on its bounds."""
+    def _cell_range(self, x: float, y: float, radius: float) -> Tuple[int, int, int, int]:
+        """Get the clamped (min_col, max_col, min_row, max_row) covered by a circle."""
         # Convert to grid coordinates (offset by half arena size)
         min_col = int((x - radius + self.width/2) / self.cell_size)
         max_col = int((x + radius + self.width/2) / self.cell_size)
@@ -77,26 +75,31 @@ class SpatialGrid:
         min_row = max(0, min(self.rows - 1, min_row))
         max_row = max(0, min(self.rows - 1, max_row))
         
-        entity_cell_list = []
+        return min_col, max_col, min_row, max_row
+    
+    def insert(self, entity: Entity, x: float, y: float, radius: float) -> None:
+        """Insert an entity into the grid based on its bounds."""
+        min_col, max_col, min_row, max_row = self._cell_range(x, y, radius)
+        
         for col in range(min_col, max_col + 1):
             for row in range(min_row, max_row + 1):
                 cell_key = (col, row)
                 if cell_key not in self.cells:
                     self.cells[cell_key] = []
                 self.cells[cell_key].append(entity)
-                entity_cell_list.append(cell_key)
-        
-        self.entity_cells[entity.id] = entity_cell_list
     
-    def get_potential_collisions(self, entity: Entity) -> Set[Entity]:
-        """Get all entities that might be colliding with this one."""
-        potential = set()
-        cells = self.entity_cells.get(entity.id, [])
-        for cell_key in cells:
-            for other in self.cells.get(cell_key, []):
-                if other.id != entity.id:
-                    potential.add(other)
-        return potential
+    def query(self, x: float, y: float, radius: float) -> Set[Entity]:
+        """Get all entities in the cells overlapped by a circle."""
+        min_col, max_col, min_row, max_row = self._cell_range(x, y, radius)
+        
+        found = set()
+        cells = self.cells
+        for col in range(min_col, max_col + 1):
+            for row in range(min_row, max_row + 1):
+                occupants = cells.get((col, row))
+                if occupants:
+                    found.update(occupants)
+        return found
 
 
 class CollisionSystem(GameSystem):
@@ -104,7 +107,9 @@ class CollisionSystem(GameSystem):
     Handles collision detection and response.
     
     Features:
-    - Spatial partitioning for performance
+    - Spatial partitioning for performance (moving colliders are hashed
+      into cells each frame; static colliders live in a separate grid
+      that is only rebuilt when the static set changes)
     - Circle-circle and AABB collision
     - Collision masks for filtering
     - Trigger vs. solid collisions
@@ -116,52 +121,115 @@ class CollisionSystem(GameSystem):
         super().__init__(priority=SystemPriority.COLLISION)
         self.arena_width = arena_width
         self.arena_height = arena_height
-        self.spatial_grid = SpatialGrid(arena_width, arena_height, cell_size=80)
+        self.min_cell_size = 16.0  # Floor for the moving-collider hash cells
+        self.static_grid = SpatialGrid(arena_width, arena_height, cell_size=80)
+        self._static_key: Tuple = ()
         self._collision_pairs: List[CollisionPair] = []
     
     def update(self, dt: float) -> None:
         """Run collision detection and response."""
         self._collision_pairs.clear()
         
-        # Rebuild spatial grid
-        self.spatial_grid.clear()
-        
-        collidable_entities = list(self.entities.get_entities_with(Transform, Collider))
-        
-        # Insert all entities into spatial grid (skip invalid positions)
-        for entity in collidable_entities:
-            transform = self.entities.get_component(entity, Transform)
-            collider = self.entities.get_component(entity, Collider)
-            if transform and collider:
-                # Skip entities with invalid positions
-                if not _is_valid_float(transform.x) or not _is_valid_float(transform.y):
-                    continue
-                radius = self._get_effective_radius(collider)
-                if not _is_valid_float(radius) or radius <= 0:
-                    radius = 10.0  # Default safe radius
-                self.spatial_grid.insert(entity, transform.x, transform.y, radius)
-        
-        # Broad phase + narrow phase
-        tested_pairs: Set[Tuple[str, str]] = set()
-        
-        for entity_a in collidable_entities:
-            potential = self.spatial_grid.get_potential_collisions(entity_a)
+        # Fetch every collidable's components once; the broad and narrow
+        # phases below read them from this table instead of looking them up
+        # again for each candidate pair. Layer/mask flags are stored as plain
+        # ints so pair filtering is an int AND rather than Flag arithmetic,
+        # and each row carries the collider's world centre and bounding
+        # radius so distant pairs are rejected before the narrow phase.
+        components: Dict[int, Tuple[Transform, Collider, int, int, float, float, float]] = {}
+        dynamic_entities: List[Tuple[Entity, float, float, float]] = []
+        static_entities: List[Tuple[Entity, float, float, float]] = []
+        max_radius = 0.0
+        
+        # Sort entities into static/dynamic (skip invalid positions)
+        for entity, transform, collider in self.entities.query(Transform, Collider):
+            # Skip entities with invalid positions
+            if not _is_valid_float(transform.x) or not _is_valid_float(transform.y):
+                continue
+            components[entity.id] = (
+                transform, collider, collider.layer.value, collider.mask.value,
+                transform.x + collider.offset_x, transform.y + collider.offset_y,
+                self._get_bounding_radius(collider)
+            )
+            radius = self._get_effective_radius(collider)
+            if not _is_valid_float(radius) or radius <= 0:
+                radius = 10.0  # Default safe radius
+            
+            row = (entity, transform.x, transform.y, radius)
+            if collider.is_static:
+                static_entities.append(row)
+            else:
+                dynamic_entities.append(row)
+                if radius > max_radius:
+                    max_radius = radius
+        
+        # Static colliders (obstacles) rarely change: only rebuild their
+        # grid when one is added, removed, moved or resized
+        static_key = tuple((e.id, x, y, r) for e, x, y, r in static_entities)
+        if static_key != self._static_key:
+            self._static_key = static_key
+            self.static_grid.clear()
+            for entity, x, y, radius in static_entities:
+                self.static_grid.insert(entity, x, y, radius)
+        
+        # Broad phase + narrow phase. Pairs are always found from the moving
+        # side, so static-vs-static pairs (which can never resolve) are skipped.
+        test_collision = self._test_collision
+        add_pair = self._collision_pairs.append
+        
+        for entity_a, entity_b in self._dynamic_pairs(dynamic_entities, max_radius):
+            transform_a, collider_a, layer_a, mask_a, ax, ay, ar = components[entity_a.id]
+            transform_b, collider_b, layer_b, mask_b, bx, by, br = components[entity_b.id]
             
-            for entity_b in potential:
-                # Avoid duplicate pair testing
-                pair_key = tuple(sorted([entity_a.id, entity_b.id]))
-                if pair_key in tested_pairs:
-                    continue
-                tested_pairs.add(pair_key)
-                
-                # Check collision
-                collision = self._test_collision(entity_a, entity_b)
-                if collision:
-                    self._collision_pairs.append(collision)
+            # Check collision masks
+            if not (layer_a & mask_b and layer_b & mask_a):
+                continue
+            
+            # Bounding circles apart: cannot collide
+            dx = bx - ax
+            dy = by - ay
+            reach = ar + br
+            if dx * dx + dy * dy > reach * reach:
+                continue
+            
+            collision = test_collision(
+                entity_a, transform_a, collider_a,
+                entity_b, transform_b, collider_b
+            )
+            if collision:
+                add_pair(collision)
+        
+        if self.static_grid.cells:
+            static_query = self.static_grid.query
+            for entity_a, x, y, radius in dynamic_entities:
+                transform_a, collider_a, layer_a, mask_a, ax, ay, ar = components[entity_a.id]
+                for entity_b in static_query(x, y, radius):
+                    row_b = components.get(entity_b.id)
+                    if row_b is None:
+                        continue
+                    transform_b, collider_b, layer_b, mask_b, bx, by, br = row_b
+                    
+                    # Check collision masks
+                    if not (layer_a & mask_b and layer_b & mask_a):
+                        continue
+                    
+                    # Bounding circles apart: cannot collide
+                    dx = bx - ax
+                    dy = by - ay
+                    reach = ar + br
+                    if dx * dx + dy * dy > reach * reach:
+                        continue
+                    
+                    collision = test_collision(
+                        entity_a, transform_a, collider_a,
+                        entity_b, transform_b, collider_b
+                    )
+                    if collision:
+                        add_pair(collision)
         
         # Reset collision states
-        for entity in collidable_entities:
-            collider = self.entities.get_component(entity, Collider)
+        for row in components.values():
+            collider = row[1]
             if collider:
                 collider.is_colliding = False
                 collider.collision_count = 0
@@ -170,6 +238,53 @@ class CollisionSystem(GameSystem):
         for pair in self._collision_pairs:
             self._resolve_collision(pair)
     
+    def _dynamic_pairs(
+        self,
+        dynamic_entities: List[Tuple[Entity, float, float, float]],
+        max_radius: float
+    ) -> Iterator[Tuple[Entity, Entity]]:
+        """
+        Yield each candidate pair of moving colliders exactly once.
+        
+        Colliders are bucketed into a uniform hash by centre. The cell is
+        sized to the largest possible pair reach (twice the largest moving
+        radius), so touching colliders always share a cell or sit in
+        neighbouring cells while far-apart ones are rarely paired. Each
+        cell is paired with itself and its four "forward" neighbours, which
+        visits every neighbouring cell pair once without a dedup set.
+        """
+        cell = max(self.min_cell_size, max_radius * 2.0)
+        
+        buckets: Dict[Tuple[int, int], List[Entity]] = {}
+        for entity, x, y, _ in dynamic_entities:
+            key = (int(x // cell), int(y // cell))
+            bucket = buckets.get(key)
+            if bucket is None:
+                buckets[key] = [entity]
+            else:
+                bucket.append(entity)
+        
+        for (cx, cy), bucket in buckets.items():
+            count = len(bucket)
+            for i in range(count - 1):
+                entity_a = bucket[i]
+                for j in range(i + 1, count):
+                    yield entity_a, bucket[j]
+            
+            for key in ((cx + 1, cy - 1), (cx + 1, cy), (cx + 1, cy + 1), (cx, cy + 1)):
+                other = buckets.get(key)
+                if other:
+                    for entity_a in bucket:
+                        for entity_b in other:
+                            yield entity_a, entity_b
+    
+    def _get_bounding_radius(self, collider: Collider) -> float:
+        """Get the radius of a circle enclosing the collider shape."""
+        if collider.collider_type == ColliderType.CIRCLE:
+            return collider.radius
+        else:
+            return math.hypot(collider.width, collider.height) / 2
+    
     def _get_effective_radius(self, collider: Collider) -> float:
         """Get the radius for spatial partitioning."""
         if collider.collider_type == ColliderType.CIRCLE:
@@ -177,18 +292,21 @@ class CollisionSystem(GameSystem):
         else:
             return max(collider.width, collider.height) / 2
     
-    def _test_collision(self, entity_a: Entity, entity_b: Entity) -> CollisionPair | None:
-        """Test if two entities are colliding."""
-        collider_a = self.entities.get_component(entity_a, Collider)
-        collider_b = self.entities.get_component(entity_b, Collider)
-        transform_a = self.entities.get_component(entity_a, Transform)
-        transform_b = self.entities.get_component(entity_b, Transform)
-        
-        if not all([collider_a, collider_b, transform_a, transform_b]):
-            return None
+    def _test_collision(
+        self,
+        entity_a: Entity,
+        transform_a: Transform,
+        collider_a: Collider,
+        entity_b: Entity,
+        transform_b: Transform,
+        collider_b: Collider
+    ) -> CollisionPair | None:
+        """
+        Test if two entities (with their components) are colliding.
         
-        # Check collision masks
-        if not collider_a.should_collide_with(collider_b):
+        Collision masks are checked by the caller before the narrow phase.
+        """
+        if not (collider_a and collider_b and transform_a and transform_b):
             return None
         
         # Get world positions
@@ -511,4 +629,5 @@ class CollisionSystem(GameSystem):
         """Update arena dimensions."""
         self.arena_width = width
         self.arena_height = height
-        self.spatial_grid = SpatialGrid(width, height, cell_size=80)
+        self.static_grid = SpatialGrid(width, height, cell_size=80)
+        self._static_key = ()
@@ -6,7 +6,7 @@ Integrates with the upgrade system for effects like evasion and lifesteal.
 """
 
 from __future__ import annotations
-import random
+import math
 from typing import TYPE_CHECKING, Optional
 
 from ..core.system import GameSystem, SystemPriority
@@ -19,6 +19,7 @@ from ..components.renderable import Renderable
 from ..components.tags import PlayerTag, EnemyTag, ProjectileTag
 from ..components.upgrades import PlayerUpgrades
 from ..core.entity import Entity
+from ..core.rng import RNG
 
 if TYPE_CHECKING:
     pass
@@ -42,8 +43,8 @@ class HealthSystem(GameSystem):
     def __init__(self, i_frame_duration: float = 0.5):
         super().__init__(priority=SystemPriority.HEALTH)
         self.i_frame_duration = i_frame_duration
-        self._pending_damage: list[tuple[str, str, float]] = []  # (target_id, source_id, damage)
-        self._pending_lifesteal: list[tuple[str, float]] = []  # (player_id, amount)
+        self._pending_damage: list[tuple[int, int, float]] = []  # (target_id, source_id, damage)
+        self._pending_lifesteal: list[tuple[int, float]] = []  # (player_id, amount)
     
     def initialize(self) -> None:
         """Subscribe to collision events."""
@@ -118,7 +119,7 @@ class HealthSystem(GameSystem):
                 damage *= upgrades.damage_multiplier
                 
                 # Apply critical hit
-                if upgrades.crit_chance > 0 and random.random() < upgrades.crit_chance:
+                if upgrades.crit_chance > 0 and RNG.random() < upgrades.crit_chance:
                     damage *= upgrades.crit_multiplier
                 
                 # Queue lifesteal
@@ -161,7 +162,7 @@ class HealthSystem(GameSystem):
     
     def _on_damage_event(self, event: DamageEvent) -> None:
         """Handle explicit damage event."""
-        self._pending_damage.append((event.target_id, event.source_id or "", event.amount))
+        self._pending_damage.append((event.target_id, event.source_id or 0, event.amount))
     
     def update(self, dt: float) -> None:
         """Process health updates."""
@@ -179,9 +180,10 @@ class HealthSystem(GameSystem):
                     health.heal(amount)
         self._pending_lifesteal.clear()
         
-        # Update all entities with health
-        for entity in self.entities.get_entities_with(Health):
-            health = self.entities.get_component(entity, Health)
+        # Update all entities with health (query yields the component with
+        # the entity, so only the optional Shield needs a lookup)
+        get_component = self.entities.get_component
+        for entity, health in self.entities.query(Health):
             if not health:
                 continue
             
@@ -193,7 +195,7 @@ class HealthSystem(GameSystem):
             health.damage_this_frame = 0.0
             
             # Update shield regeneration
-            shield = self.entities.get_component(entity, Shield)
+            shield = get_component(entity, Shield)
             if shield:
                 shield.update_recharge(dt)
             
@@ -201,7 +203,7 @@ class HealthSystem(GameSystem):
             if not health.is_alive:
                 self._handle_death(entity, health.last_damage_source)
     
-    def _apply_damage(self, target_id: str, source_id: str, damage: float) -> None:
+    def _apply_damage(self, target_id: int, source_id: int, damage: float) -> None:
         """Apply damage to an entity."""
         if not target_id:
             return
@@ -209,7 +211,6 @@ class HealthSystem(GameSystem):
         # Validate damage value
         if not isinstance(damage, (int, float)) or damage <= 0:
             return
-        import math
         if not math.isfinite(damage):
             return
             
@@ -229,7 +230,7 @@ class HealthSystem(GameSystem):
         # Check for evasion (from upgrade system)
         upgrades = self.entities.get_component(target, PlayerUpgrades)
         if upgrades and upgrades.evasion_chance > 0:
-            if random.random() < upgrades.evasion_chance:
+            if RNG.random() < upgrades.evasion_chance:
                 # Evaded! Show visual feedback
                 renderable = self.entities.get_component(target, Renderable)
                 if renderable:
@@ -264,7 +265,7 @@ class HealthSystem(GameSystem):
         if actual_damage > 0:
             health.hp = max(0.0, health.hp - actual_damage)
             health.damage_this_frame += actual_damage
-            health.last_damage_source = source_id if source_id else ""
+            health.last_damage_source = source_id if source_id else 0
             
             # Trigger i-frames for player
             if self.entities.has_component(target, PlayerTag):
@@ -284,7 +285,7 @@ class HealthSystem(GameSystem):
                 if thorns_damage > 0:
                     self._pending_damage.append((source_id, target_id, thorns_damage))
     
-    def _handle_death(self, entity: Entity, killer_id: str) -> None:
+    def _handle_death(self, entity: Entity, killer_id: int) -> None:
         """Handle entity death."""
         if not entity:
             return
@@ -319,7 +320,7 @@ class HealthSystem(GameSystem):
         self,
         entity: Entity,
         amount: float,
-        source_id: str = ""
+        source_id: int = 0
     ) -> None:
         """Apply damage to an entity."""
         self._pending_damage.append((entity.id, source_id, amount))
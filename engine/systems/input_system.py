@@ -16,9 +16,10 @@ Updated Controls:
 from __future__ import annotations
 import turtle
 import math
+from functools import partial
 from typing import TYPE_CHECKING, Dict, Set, Callable, Optional
 from enum import Enum, auto
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
 from ..core.system import GameSystem, SystemPriority
 from ..components.transform import Transform
@@ -64,24 +65,82 @@ class GameAction(Enum):
     STRAFE_RIGHT = auto()
 
 
-@dataclass
+# One bit per action, for the InputState action masks
+ACTION_BITS: Dict[GameAction, int] = {
+    action: 1 << index for index, action in enumerate(GameAction)
+}
+
+_MOVE_UP = ACTION_BITS[GameAction.MOVE_UP]
+_MOVE_DOWN = ACTION_BITS[GameAction.MOVE_DOWN]
+_MOVE_LEFT = ACTION_BITS[GameAction.MOVE_LEFT]
+_MOVE_RIGHT = ACTION_BITS[GameAction.MOVE_RIGHT]
+_AIM_UP = ACTION_BITS[GameAction.AIM_UP]
+_AIM_DOWN = ACTION_BITS[GameAction.AIM_DOWN]
+_AIM_LEFT = ACTION_BITS[GameAction.AIM_LEFT]
+_AIM_RIGHT = ACTION_BITS[GameAction.AIM_RIGHT]
+_AIM_ANY = _AIM_UP | _AIM_DOWN | _AIM_LEFT | _AIM_RIGHT
+_ROTATE_LEFT = ACTION_BITS[GameAction.ROTATE_LEFT]
+_ROTATE_RIGHT = ACTION_BITS[GameAction.ROTATE_RIGHT]
+_FIRE = ACTION_BITS[GameAction.FIRE]
+_RELOAD = ACTION_BITS[GameAction.RELOAD]
+
+
+def _build_direction_tables() -> tuple:
+    """
+    Precompute movement and aim results for every WASD / arrow key combo.
+    
+    Returns:
+        (move_lut, aim_lut) where move_lut maps the held movement bits to a
+        unit (x, y) direction (diagonals normalized, opposites cancelled)
+        and aim_lut maps the held aim bits to a heading in degrees, or None
+        when the arrow keys give no direction.
+    """
+    move_lut: Dict[int, tuple] = {}
+    aim_lut: Dict[int, Optional[float]] = {}
+    for combo in range(16):
+        up, down, left, right = (combo & 1, combo & 2, combo & 4, combo & 8)
+        dx = (1.0 if right else 0.0) - (1.0 if left else 0.0)
+        dy = (1.0 if up else 0.0) - (1.0 if down else 0.0)
+        
+        move_bits = ((_MOVE_UP if up else 0) | (_MOVE_DOWN if down else 0) |
+                     (_MOVE_LEFT if left else 0) | (_MOVE_RIGHT if right else 0))
+        if dx != 0 and dy != 0:
+            inv = 1.0 / math.sqrt(2.0)
+            move_lut[move_bits] = (dx * inv, dy * inv)
+        else:
+            move_lut[move_bits] = (dx, dy)
+        
+        aim_bits = ((_AIM_UP if up else 0) | (_AIM_DOWN if down else 0) |
+                    (_AIM_LEFT if left else 0) | (_AIM_RIGHT if right else 0))
+        aim_lut[aim_bits] = math.degrees(math.atan2(dy, dx)) if (dx or dy) else None
+    return move_lut, aim_lut
+
+
+_MOVE_ANY = _MOVE_UP | _MOVE_DOWN | _MOVE_LEFT | _MOVE_RIGHT
+_MOVE_LUT, _AIM_LUT = _build_direction_tables()
+
+
+@dataclass(slots=True)
 class InputState:
     """
     Current state of all inputs.
     
+    Actions are stored as bitmasks (see ACTION_BITS), so checking an
+    action is a single AND instead of a set lookup.
+    
     Attributes:
-        actions_held: Set of actions currently being held
-        actions_pressed: Set of actions pressed this frame
-        actions_released: Set of actions released this frame
+        held_mask: Bits of actions currently being held
+        pressed_mask: Bits of actions pressed this frame
+        released_mask: Bits of actions released this frame
         mouse_x: Mouse X position (if using mouse)
         mouse_y: Mouse Y position (if using mouse)
         mouse_clicked: Whether mouse was clicked this frame
         aim_angle: Current aim angle (from arrow keys or mouse)
         using_mouse_aim: Whether mouse is being used for aiming
     """
-    actions_held: Set[GameAction] = field(default_factory=set)
-    actions_pressed: Set[GameAction] = field(default_factory=set)
-    actions_released: Set[GameAction] = field(default_factory=set)
+    held_mask: int = 0
+    pressed_mask: int = 0
+    released_mask: int = 0
     mouse_x: float = 0.0
     mouse_y: float = 0.0
     mouse_clicked: bool = False
@@ -92,20 +151,20 @@ class InputState:
     
     def is_action_held(self, action: GameAction) -> bool:
         """Check if an action is currently being held."""
-        return action in self.actions_held
+        return self.held_mask & ACTION_BITS[action] != 0
     
     def is_action_pressed(self, action: GameAction) -> bool:
         """Check if an action was pressed this frame."""
-        return action in self.actions_pressed
+        return self.pressed_mask & ACTION_BITS[action] != 0
     
     def is_action_released(self, action: GameAction) -> bool:
         """Check if an action was released this frame."""
-        return action in self.actions_released
+        return self.released_mask & ACTION_BITS[action] != 0
     
     def clear_frame_state(self) -> None:
         """Clear per-frame state (pressed/released)."""
-        self.actions_pressed.clear()
-        self.actions_released.clear()
+        self.pressed_mask = 0
+        self.released_mask = 0
         self.mouse_clicked = False
 
 
@@ -165,6 +224,10 @@ class InputSystem(GameSystem):
         self._key_to_action: Dict[str, GameAction] = {}
         self._action_to_keys: Dict[GameAction, Set[str]] = {}
         
+        # Pre-curried (press, release) handlers per key, built once in
+        # bind_key() and reused whenever the bindings are re-registered
+        self._key_handlers: Dict[str, tuple] = {}
+        
         # Callbacks for special actions
         self._action_callbacks: Dict[GameAction, Callable[[], None]] = {}
         
@@ -179,6 +242,11 @@ class InputSystem(GameSystem):
         
         # Arrow key aim smoothing
         self._arrow_aim_speed = 180.0  # Degrees per second
+        
+        # Cached player components, re-resolved only when the player entity
+        # or its component version changes
+        self._player_key: tuple = ()
+        self._player_components: tuple = (None, None, None, None)
     
     def initialize(self) -> None:
         """Set up input bindings."""
@@ -258,8 +326,14 @@ class InputSystem(GameSystem):
         self._action_to_keys[action].add(key)
         
         # Register with turtle
-        self.screen.onkeypress(lambda k=key: self._on_key_press(k), key)
-        self.screen.onkeyrelease(lambda k=key: self._on_key_release(k), key)
+        handlers = self._key_handlers.get(key)
+        if handlers is None:
+            handlers = self._key_handlers[key] = (
+                partial(self._on_key_press, key),
+                partial(self._on_key_release, key),
+            )
+        self.screen.onkeypress(handlers[0], key)
+        self.screen.onkeyrelease(handlers[1], key)
     
     def unbind_key(self, key: str) -> None:
         """Unbind a key."""
@@ -287,12 +361,12 @@ class InputSystem(GameSystem):
             
             action = self._key_to_action.get(key)
             if action:
-                self.state.actions_held.add(action)
-                self.state.actions_pressed.add(action)
+                bit = ACTION_BITS[action]
+                self.state.held_mask |= bit
+                self.state.pressed_mask |= bit
                 
                 # If arrow key is pressed, switch to arrow aiming
-                if action in (GameAction.AIM_UP, GameAction.AIM_DOWN, 
-                              GameAction.AIM_LEFT, GameAction.AIM_RIGHT):
+                if bit & _AIM_ANY:
                     self.state.using_mouse_aim = False
                 
                 # Call action callback if registered
@@ -306,10 +380,11 @@ class InputSystem(GameSystem):
         action = self._key_to_action.get(key)
         if action:
             # Only remove from held if no other keys for this action are down
+            bit = ACTION_BITS[action]
             other_keys = self._action_to_keys.get(action, set())
             if not any(k in self._keys_down for k in other_keys):
-                self.state.actions_held.discard(action)
-            self.state.actions_released.add(action)
+                self.state.held_mask &= ~bit
+            self.state.released_mask |= bit
     
     def update(self, dt: float) -> None:
         """Apply input to player entity."""
@@ -326,10 +401,16 @@ class InputSystem(GameSystem):
             return
         
         # Get player components
-        transform = self.entities.get_component(player, Transform)
-        velocity = self.entities.get_component(player, Velocity)
-        physics = self.entities.get_component(player, Physics)
-        weapon = self.entities.get_component(player, Weapon)
+        player_key = (player.id, self.entities.component_version(player))
+        if player_key != self._player_key:
+            self._player_key = player_key
+            self._player_components = (
+                self.entities.get_component(player, Transform),
+                self.entities.get_component(player, Velocity),
+                self.entities.get_component(player, Physics),
+                self.entities.get_component(player, Weapon),
+            )
+        transform, velocity, physics, weapon = self._player_components
         
         if not transform or not velocity:
             self.state.clear_frame_state()
@@ -338,25 +419,15 @@ class InputSystem(GameSystem):
         # Get movement speed
         move_speed = physics.acceleration if physics else 500.0
         
-        # === OMNIDIRECTIONAL MOVEMENT (WASD) ===
-        # Movement is independent of facing direction
-        accel_x = 0.0
-        accel_y = 0.0
-        
-        if self.state.is_action_held(GameAction.MOVE_UP):
-            accel_y += move_speed
-        if self.state.is_action_held(GameAction.MOVE_DOWN):
-            accel_y -= move_speed
-        if self.state.is_action_held(GameAction.MOVE_LEFT):
-            accel_x -= move_speed
-        if self.state.is_action_held(GameAction.MOVE_RIGHT):
-            accel_x += move_speed
+        # Read the held actions once; every check below is a local AND
+        held = self.state.held_mask
         
-        # Normalize diagonal movement
-        if accel_x != 0 and accel_y != 0:
-            magnitude = math.sqrt(accel_x**2 + accel_y**2)
-            accel_x = (accel_x / magnitude) * move_speed
-            accel_y = (accel_y / magnitude) * move_speed
+        # === OMNIDIRECTIONAL MOVEMENT (WASD) ===
+        # Movement is independent of facing direction. The held key combo
+        # indexes a precomputed unit direction (diagonals already normalized).
+        dir_x, dir_y = _MOVE_LUT[held & _MOVE_ANY]
+        accel_x = dir_x * move_speed
+        accel_y = dir_y * move_speed
         
         # Apply movement
         if physics:
@@ -367,23 +438,11 @@ class InputSystem(GameSystem):
             velocity.vy = accel_y
         
         # === AIMING (Mouse or Arrow Keys) ===
-        # Check if arrow keys are being used for aiming
-        aim_x = 0.0
-        aim_y = 0.0
-        
-        if self.state.is_action_held(GameAction.AIM_UP):
-            aim_y += 1.0
-        if self.state.is_action_held(GameAction.AIM_DOWN):
-            aim_y -= 1.0
-        if self.state.is_action_held(GameAction.AIM_LEFT):
-            aim_x -= 1.0
-        if self.state.is_action_held(GameAction.AIM_RIGHT):
-            aim_x += 1.0
+        # Arrow key combos map to a precomputed heading (None = no direction)
+        target_angle = _AIM_LUT[held & _AIM_ANY]
         
         # If arrow keys are held, use arrow key aiming
-        if aim_x != 0 or aim_y != 0:
-            target_angle = math.degrees(math.atan2(aim_y, aim_x))
-            
+        if target_angle is not None:
             # Smooth rotation towards target
             current = transform.angle
             diff = self._angle_difference(current, target_angle)
@@ -405,12 +464,12 @@ class InputSystem(GameSystem):
         # === LEGACY ROTATION (if needed) ===
         turn_speed = physics.angular_acceleration if physics else 360.0
         
-        if self.state.is_action_held(GameAction.ROTATE_LEFT):
+        if held & _ROTATE_LEFT:
             if physics:
                 physics.angular_accel = turn_speed
             else:
                 velocity.angular = turn_speed
-        elif self.state.is_action_held(GameAction.ROTATE_RIGHT):
+        elif held & _ROTATE_RIGHT:
             if physics:
                 physics.angular_accel = -turn_speed
             else:
@@ -424,12 +483,12 @@ class InputSystem(GameSystem):
         if weapon:
             # Fire on space key held OR mouse button held OR mouse clicked this frame
             weapon.is_firing = (
-                self.state.is_action_held(GameAction.FIRE) or 
+                bool(held & _FIRE) or 
                 self._mouse_button_down or
                 self.state.mouse_clicked
             )
             
-            if self.state.is_action_pressed(GameAction.RELOAD):
+            if self.state.pressed_mask & _RELOAD:
                 weapon.start_reload()
         
         # Clear per-frame state at end
@@ -460,10 +519,11 @@ class InputSystem(GameSystem):
     
     def rebind_keys(self) -> None:
         """Re-register all key bindings. Call after menu hides to restore bindings."""
-        for key, action in self._key_to_action.items():
+        for key in self._key_to_action:
+            on_press, on_release = self._key_handlers[key]
             try:
-                self.screen.onkeypress(lambda k=key: self._on_key_press(k), key)
-                self.screen.onkeyrelease(lambda k=key: self._on_key_release(k), key)
+                self.screen.onkeypress(on_press, key)
+                self.screen.onkeyrelease(on_release, key)
             except Exception:
                 pass
         self.screen.listen()
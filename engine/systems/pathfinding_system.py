@@ -108,6 +108,8 @@ class PathfindingGrid:
         """Mark cells covered by a circular obstacle as unwalkable."""
         gx, gy = self.world_to_grid(x, y)
         cells_radius = int(math.ceil(radius / self.cell_size)) + 1
+        reach = radius + self.cell_size * 0.5
+        reach_sq = reach * reach
         
         for dy in range(-cells_radius, cells_radius + 1):
             for dx in range(-cells_radius, cells_radius + 1):
@@ -115,8 +117,9 @@ class PathfindingGrid:
                 if 0 <= cx < self.cols and 0 <= cy < self.rows:
                     # Check if cell center is within obstacle radius
                     wx, wy = self.grid_to_world(cx, cy)
-                    dist = math.sqrt((wx - x)**2 + (wy - y)**2)
-                    if dist < radius + self.cell_size * 0.5:
+                    ddx = wx - x
+                    ddy = wy - y
+                    if ddx * ddx + ddy * ddy < reach_sq:
                         self.grid[cy][cx] = False
     
     def get_neighbors(self, gx: int, gy: int) -> List[Tuple[int, int]]:
@@ -301,7 +304,7 @@ class PathfindingSystem(GameSystem):
         self.grid = PathfindingGrid(arena_width, arena_height, cell_size)
         
         # Path cache
-        self._path_cache: Dict[str, List[Tuple[float, float]]] = {}
+        self._path_cache: Dict[int, List[Tuple[float, float]]] = {}
         self._cache_timer = 0.0
         self._cache_interval = 0.5  # Recalculate paths every 0.5s
     
@@ -335,7 +338,7 @@ class PathfindingSystem(GameSystem):
         start_y: float,
         goal_x: float,
         goal_y: float,
-        entity_id: str = ""
+        entity_id: int = 0
     ) -> Optional[List[Tuple[float, float]]]:
         """
         Find a path from start to goal.
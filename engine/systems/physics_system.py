@@ -7,14 +7,15 @@ Applies acceleration, friction, drag, and updates positions.
 
 from __future__ import annotations
 import math
-from typing import TYPE_CHECKING
 
 from ..core.system import GameSystem, SystemPriority
 from ..components.transform import Transform
 from ..components.physics import Physics, Velocity
+from ..components.collider import Collider
 
-if TYPE_CHECKING:
-    from ..core.entity import Entity
+
+# Squared speed below which an unforced body is settled to rest (0.01 u/s)
+_REST_SPEED_SQ = 1e-4
 
 
 def _is_valid_float(value: float) -> bool:
@@ -67,26 +68,42 @@ class PhysicsSystem(GameSystem):
     def update(self, dt: float) -> None:
         """Process physics for all relevant entities."""
         
+        # Sanitize dt once per frame to prevent physics explosion
+        dt = _clamp_float(dt, 0.0, 0.1)
+        
+        get_component = self.entities.get_component
+        process_physics = self._process_physics
+        integrate_simple = self._integrate_simple
+        enforce_bounds = self._enforce_bounds if self.enforce_bounds else None
+        half_w = self.arena_half_width
+        half_h = self.arena_half_height
+        
         # Get all entities with Transform and Velocity
-        for entity in self.entities.get_entities_with(Transform, Velocity):
-            transform = self.entities.get_component(entity, Transform)
-            velocity = self.entities.get_component(entity, Velocity)
-            
-            if transform is None or velocity is None:
-                continue
-            
+        for entity, transform, velocity in self.entities.query(Transform, Velocity):
             # Check for Physics component (optional for advanced physics)
-            physics = self.entities.get_component(entity, Physics)
+            physics = get_component(entity, Physics)
             
             if physics is not None and not physics.is_kinematic:
-                self._process_physics(transform, velocity, physics, dt)
+                # Bodies at rest (no velocity, no pending forces) have
+                # nothing to integrate
+                if (velocity.vx or velocity.vy or velocity.angular or
+                        physics.accel_x or physics.accel_y or physics.angular_accel):
+                    process_physics(transform, velocity, physics, dt)
             else:
                 # Simple velocity integration (no physics modifiers)
-                self._integrate_simple(transform, velocity, dt)
+                integrate_simple(transform, velocity, dt)
             
-            # Enforce arena bounds
-            if self.enforce_bounds:
-                self._enforce_bounds(entity, transform, velocity, physics)
+            # Enforce arena bounds (most entities are well inside the arena,
+            # so only those touching an edge take the full clamp/bounce path).
+            # The extent is the collider radius, else a default of 15.
+            if enforce_bounds is not None:
+                collider = get_component(entity, Collider)
+                radius = collider.radius if collider else 15.0
+                x = transform.x
+                y = transform.y
+                if (x - radius < -half_w or x + radius > half_w or
+                        y - radius < -half_h or y + radius > half_h):
+                    enforce_bounds(transform, velocity, physics, radius)
     
     def _process_physics(
         self,
@@ -95,53 +112,68 @@ class PhysicsSystem(GameSystem):
         physics: Physics,
         dt: float
     ) -> None:
-        """Full physics processing with acceleration, friction, drag."""
-        
-        # Sanitize dt to prevent physics explosion
-        dt = _clamp_float(dt, 0.0, 0.1)
+        """
+        Full physics processing with acceleration, friction, drag.
         
+        Works on local floats and writes each component field back once,
+        which keeps attribute traffic in this per-entity hot path minimal.
+        Expects dt to be already sanitized by update().
+        """
         # Apply accumulated acceleration (sanitize values)
         accel_x = _sanitize_float(physics.accel_x)
         accel_y = _sanitize_float(physics.accel_y)
         angular_accel = _sanitize_float(physics.angular_accel)
         
-        velocity.vx = _sanitize_float(velocity.vx) + accel_x * dt
-        velocity.vy = _sanitize_float(velocity.vy) + accel_y * dt
-        velocity.angular = _sanitize_float(velocity.angular) + angular_accel * dt
+        vx = _sanitize_float(velocity.vx) + accel_x * dt
+        vy = _sanitize_float(velocity.vy) + accel_y * dt
+        angular = _sanitize_float(velocity.angular) + angular_accel * dt
         
         # Apply friction (ground contact)
-        if physics.friction > 0:
-            friction_factor = 1.0 - (physics.friction * dt)
-            friction_factor = max(0.0, friction_factor)
-            velocity.vx *= friction_factor
-            velocity.vy *= friction_factor
+        friction = physics.friction
+        if friction > 0:
+            friction_factor = max(0.0, 1.0 - (friction * dt))
+            vx *= friction_factor
+            vy *= friction_factor
         
         # Apply drag (air resistance)
-        if physics.drag < 1.0 and physics.drag > 0:
-            drag_factor = physics.drag ** dt
-            velocity.vx *= drag_factor
-            velocity.vy *= drag_factor
-        
-        # Clamp to max speed
-        speed = velocity.speed
-        if _is_valid_float(speed) and speed > physics.max_speed and speed > 0:
-            factor = physics.max_speed / speed
-            velocity.vx *= factor
-            velocity.vy *= factor
+        drag = physics.drag
+        if 0 < drag < 1.0:
+            drag_factor = drag ** dt
+            vx *= drag_factor
+            vy *= drag_factor
+        
+        # Clamp to max speed (compared squared; sqrt only when over the cap)
+        max_speed = physics.max_speed
+        speed_sq = vx * vx + vy * vy
+        if speed_sq > max_speed * max_speed:
+            speed = math.sqrt(speed_sq)
+            if _is_valid_float(speed) and speed > 0:
+                factor = max_speed / speed
+                vx *= factor
+                vy *= factor
+        
+        # Settle unforced bodies that have coasted to a crawl; friction and
+        # drag only decay speed geometrically, so it would never reach zero
+        if not (accel_x or accel_y) and vx * vx + vy * vy < _REST_SPEED_SQ:
+            vx = 0.0
+            vy = 0.0
         
         # Clamp angular velocity
-        if abs(velocity.angular) > physics.max_angular_speed:
-            velocity.angular = math.copysign(physics.max_angular_speed, velocity.angular)
+        if abs(angular) > physics.max_angular_speed:
+            angular = math.copysign(physics.max_angular_speed, angular)
         
         # Final sanitization of velocity
-        velocity.vx = _clamp_float(velocity.vx, -10000, 10000)
-        velocity.vy = _clamp_float(velocity.vy, -10000, 10000)
-        velocity.angular = _clamp_float(velocity.angular, -3600, 3600)
+        vx = _clamp_float(vx, -10000, 10000)
+        vy = _clamp_float(vy, -10000, 10000)
+        angular = _clamp_float(angular, -3600, 3600)
+        velocity.vx = vx
+        velocity.vy = vy
+        velocity.angular = angular
         
         # Integrate position
-        transform.x += velocity.vx * dt
-        transform.y += velocity.vy * dt
-        transform.angle += velocity.angular * dt
+        transform.x += vx * dt
+        transform.y += vy * dt
+        transform.angle += angular * dt
         
         # Sanitize final position
         transform.x = _clamp_float(transform.x, -10000, 10000)
@@ -160,8 +192,7 @@ class PhysicsSystem(GameSystem):
         dt: float
     ) -> None:
         """Simple velocity integration without physics component."""
-        # Sanitize inputs
-        dt = _clamp_float(dt, 0.0, 0.1)
+        # Sanitize inputs (dt is already sanitized by update())
         vx = _sanitize_float(velocity.vx)
         vy = _sanitize_float(velocity.vy)
         angular = _sanitize_float(velocity.angular)
@@ -177,18 +208,16 @@ class PhysicsSystem(GameSystem):
     
     def _enforce_bounds(
         self,
-        entity: Entity,
         transform: Transform,
         velocity: Velocity,
-        physics: Physics | None
+        physics: Physics | None,
+        radius: float
     ) -> None:
-        """Keep entity within arena bounds."""
-        
-        # Get collider radius if available, else use default
-        from ..components.collider import Collider
-        collider = self.entities.get_component(entity, Collider)
-        radius = collider.radius if collider else 15.0
+        """
+        Keep entity within arena bounds.
         
+        radius is the entity's extent as already worked out by update().
+        """
         min_x = -self.arena_half_width + radius
         max_x = self.arena_half_width - radius
         min_y = -self.arena_half_height + radius
@@ -6,6 +6,7 @@ and updates their visual representation each frame.
 """
 
 from __future__ import annotations
+import math
 import turtle
 from typing import TYPE_CHECKING, Dict, List, Optional, Any
 from dataclasses import dataclass
@@ -19,11 +20,18 @@ if TYPE_CHECKING:
     from ..core.entity import Entity
 
 
+# Canvas tag shared by the background grid lines
+_GRID_TAG = "arena_grid"
+
+# (x, y, heading, size) placeholder that differs from any real pose
+_NO_POSE = (math.inf, math.inf, math.nan, math.nan)
+
+
 @dataclass
 class TurtleInfo:
     """Tracking info for a turtle object."""
     turtle_obj: turtle.Turtle
-    entity_id: str
+    entity_id: int
     layer: RenderLayer
 
 
@@ -41,7 +49,7 @@ class RenderSystem(GameSystem):
     
     Performance Notes:
     - Uses screen.tracer(0) for manual updates
-    - Reuses turtle objects via pooling
+    - Reuses turtle objects via pooling (pre-warmed at initialize)
     - Batches visual updates before screen.update()
     """
     
@@ -51,7 +59,8 @@ class RenderSystem(GameSystem):
         arena_width: float = 800,
         arena_height: float = 600,
         show_health_bars: bool = True,
-        show_debug: bool = False
+        show_debug: bool = False,
+        prewarm_turtles: int = 32
     ):
         super().__init__(priority=SystemPriority.RENDER)
         self.screen = screen
@@ -59,15 +68,17 @@ class RenderSystem(GameSystem):
         self.arena_height = arena_height
         self.show_health_bars = show_health_bars
         self.show_debug = show_debug
+        self.prewarm_turtles = prewarm_turtles
         
         # Turtle management
-        self._turtles: Dict[str, TurtleInfo] = {}  # entity_id -> TurtleInfo
+        self._turtles: Dict[int, TurtleInfo] = {}  # entity_id -> TurtleInfo
         self._turtle_pool: List[turtle.Turtle] = []  # Recycled turtles
         self._next_turtle_id = 0
         
         # Health bar turtles (separate pool)
-        self._health_bar_turtles: Dict[str, turtle.Turtle] = {}
+        self._health_bar_turtles: Dict[int, turtle.Turtle] = {}
         self._health_bar_pool: List[turtle.Turtle] = []
+        self._health_bar_keys: Dict[int, tuple] = {}  # entity_id -> last drawn bar
         
         # Background turtle for static elements
         self._background_turtle: Optional[turtle.Turtle] = None
@@ -97,6 +108,14 @@ class RenderSystem(GameSystem):
         
         # Draw initial background
         self._draw_arena_background()
+        
+        # Pay turtle creation up front instead of during the first wave
+        self.warmup(self.prewarm_turtles)
+    
+    def warmup(self, count: int) -> None:
+        """Pre-create hidden turtles so the pool can serve the first spawns."""
+        for _ in range(max(0, count - len(self._turtle_pool))):
+            self._turtle_pool.append(self._create_turtle())
     
     def _register_custom_shapes(self) -> None:
         """Register custom turtle shapes."""
@@ -121,7 +140,6 @@ class RenderSystem(GameSystem):
             pass
         
         # Star shape (5-pointed)
-        import math
         star_points = []
         for i in range(10):
             angle = math.pi / 2 + i * math.pi / 5
@@ -210,23 +228,27 @@ class RenderSystem(GameSystem):
         t.penup()
         
         # Draw grid lines
-        t.pensize(1)
-        t.pencolor(grid_color)
         grid_size = 50
-        
-        # Vertical lines
-        for x in range(int(-hw), int(hw) + 1, grid_size):
-            t.goto(x, -hh)
-            t.pendown()
-            t.goto(x, hh)
-            t.penup()
-        
-        # Horizontal lines
-        for y in range(int(-hh), int(hh) + 1, grid_size):
-            t.goto(-hw, y)
-            t.pendown()
-            t.goto(hw, y)
-            t.penup()
+        try:
+            self._draw_grid_lines(hw, hh, grid_size, grid_color)
+        except Exception:
+            # Fall back to drawing through the turtle
+            t.pensize(1)
+            t.pencolor(grid_color)
+            
+            # Vertical lines
+            for x in range(int(-hw), int(hw) + 1, grid_size):
+                t.goto(x, -hh)
+                t.pendown()
+                t.goto(x, hh)
+                t.penup()
+            
+            # Horizontal lines
+            for y in range(int(-hh), int(hh) + 1, grid_size):
+                t.goto(-hw, y)
+                t.pendown()
+                t.goto(hw, y)
+                t.penup()
         
         # Draw corner accent markers
         corner_size = 20
@@ -254,6 +276,35 @@ class RenderSystem(GameSystem):
         
         t.hideturtle()
     
+    def _draw_grid_lines(self, hw: float, hh: float, grid_size: int, color: str) -> None:
+        """
+        Draw the background grid straight onto the Tk canvas.
+        
+        Each turtle goto() is a separate canvas round-trip, so the grid
+        (dozens of lines) is issued as plain create_line calls instead.
+        Lines share a canvas tag so a redraw can delete them, and are kept
+        below every other canvas item.
+        """
+        canvas = self.screen.getcanvas()
+        canvas.delete(_GRID_TAG)
+        
+        # Turtle coordinates -> canvas coordinates (canvas Y points down)
+        xscale = self.screen.xscale
+        yscale = self.screen.yscale
+        top = -hh * yscale
+        bottom = hh * yscale
+        left = -hw * xscale
+        right = hw * xscale
+        
+        for x in range(int(-hw), int(hw) + 1, grid_size):
+            cx = x * xscale
+            canvas.create_line(cx, bottom, cx, top, fill=color, width=1, tags=_GRID_TAG)
+        for y in range(int(-hh), int(hh) + 1, grid_size):
+            cy = -y * yscale
+            canvas.create_line(left, cy, right, cy, fill=color, width=1, tags=_GRID_TAG)
+        
+        canvas.tag_lower(_GRID_TAG)
+    
     def set_arena_theme(self, theme) -> None:
         """Set the arena visual theme."""
         self._arena_theme = theme
@@ -278,7 +329,6 @@ class RenderSystem(GameSystem):
                 
                 if transform and renderable and renderable.visible:
                     # Validate transform values
-                    import math
                     if math.isfinite(transform.x) and math.isfinite(transform.y):
                         render_list.append((entity, transform, renderable))
         except Exception:
@@ -353,6 +403,11 @@ class RenderSystem(GameSystem):
         )
         renderable._turtle_ref = t
         
+        # Fresh turtle: nothing has been applied to it for this renderable yet
+        renderable._applied_colors = None
+        renderable._applied_shape = ""
+        renderable._applied_pose = None
+        
         return t
     
     def _create_turtle(self) -> turtle.Turtle:
@@ -374,8 +429,6 @@ class RenderSystem(GameSystem):
             return
             
         try:
-            import math
-            
             # Handle pulse effect
             if renderable.glow:
                 renderable._pulse_time += 0.016  # Approx dt
@@ -387,46 +440,65 @@ class RenderSystem(GameSystem):
             
             # Shape
             shape_name = self._get_shape_name(renderable.shape)
-            try:
-                if t.shape() != shape_name:
-                    t.shape(shape_name)
-            except (turtle.TurtleGraphicsError, Exception):
+            if shape_name != renderable._applied_shape:
                 try:
-                    t.shape("circle")
-                except Exception:
-                    pass
+                    t.shape(shape_name)
+                except (turtle.TurtleGraphicsError, Exception):
+                    try:
+                        t.shape("circle")
+                    except Exception:
+                        pass
+                renderable._applied_shape = shape_name
             
-            # Color (handle flash)
+            # Color (handle flash). Turtle validates color strings against Tk
+            # on every call, so only push them when they actually change.
             color = renderable.flash_color if renderable.flash_timer > 0 else renderable.color
-            try:
-                t.color(renderable.outline_color or "white", color or "white")
-            except (turtle.TurtleGraphicsError, Exception):
+            colors = (renderable.outline_color or "white", color or "white")
+            if colors != renderable._applied_colors:
                 try:
-                    t.color("white", "white")
-                except Exception:
-                    pass
+                    t.color(*colors)
+                    renderable._applied_colors = colors
+                except (turtle.TurtleGraphicsError, Exception):
+                    try:
+                        t.color("white", "white")
+                        renderable._applied_colors = ("white", "white")
+                    except Exception:
+                        pass
+            
+            # Size, position and rotation - validate values. Each turtle
+            # call is skipped while its value is unchanged since the last
+            # frame (position within half a pixel), as for colors above.
+            last_x, last_y, last_angle, last_size = renderable._applied_pose or _NO_POSE
             
-            # Size - validate values
             size = renderable.size * transform.scale * pulse_size_factor
-            if math.isfinite(size) and size > 0:
+            if size != last_size and math.isfinite(size) and size > 0:
                 try:
                     t.shapesize(size, size)
+                    last_size = size
                 except Exception:
                     pass
             
-            # Position and rotation - validate values
-            if math.isfinite(transform.x) and math.isfinite(transform.y):
+            x = transform.x
+            y = transform.y
+            if (abs(x - last_x) >= 0.5 or abs(y - last_y) >= 0.5) and \
+                    math.isfinite(x) and math.isfinite(y):
                 try:
-                    t.goto(transform.x, transform.y)
+                    t.goto(x, y)
+                    last_x = x
+                    last_y = y
                 except Exception:
                     pass
             
-            if math.isfinite(transform.angle):
+            angle = transform.angle
+            if angle != last_angle and math.isfinite(angle):
                 try:
-                    t.setheading(transform.angle)
+                    t.setheading(angle)
+                    last_angle = angle
                 except Exception:
                     pass
             
+            renderable._applied_pose = (last_x, last_y, last_angle, last_size)
+            
             # Show
             try:
                 if not t.isvisible():
@@ -509,10 +581,10 @@ class RenderSystem(GameSystem):
                 
                 # Only show for enemies or if damaged
                 if health.hp >= health.max_hp:
-                    # Hide health bar
-                    if entity.id in self._health_bar_turtles:
+                    # Wipe a bar drawn before the entity healed
+                    if self._health_bar_keys.pop(entity.id, None) is not None:
                         try:
-                            self._health_bar_turtles[entity.id].hideturtle()
+                            self._health_bar_turtles[entity.id].clear()
                         except Exception:
                             pass
                     continue
@@ -526,7 +598,16 @@ class RenderSystem(GameSystem):
                     self._health_bar_turtles[entity.id] = hb
                 
                 hb = self._health_bar_turtles[entity.id]
-                self._draw_health_bar(hb, transform, health, renderable)
+                
+                # Redraw (clear + two pen strokes) only when the bar moved by
+                # at least a pixel, resized, or its fill changed
+                bar_key = (
+                    round(transform.x), round(transform.y),
+                    renderable.size, round(health.health_percent, 2)
+                )
+                if self._health_bar_keys.get(entity.id) != bar_key:
+                    self._draw_health_bar(hb, transform, health, renderable)
+                    self._health_bar_keys[entity.id] = bar_key
             except Exception:
                 # Continue rendering other health bars
                 continue
@@ -543,8 +624,6 @@ class RenderSystem(GameSystem):
             return
             
         try:
-            import math
-            
             # Validate values
             if not math.isfinite(transform.x) or not math.isfinite(transform.y):
                 return
@@ -599,8 +678,9 @@ class RenderSystem(GameSystem):
         for entity_id, info in self._turtles.items():
             if entity_id not in active_entity_ids:
                 to_remove.append(entity_id)
+                # Entity turtles only show their shape (pen is always up),
+                # so hiding is enough; there is no trail to clear
                 info.turtle_obj.hideturtle()
-                info.turtle_obj.clear()
                 self._turtle_pool.append(info.turtle_obj)
         
         for entity_id in to_remove:
@@ -612,7 +692,8 @@ class RenderSystem(GameSystem):
             if entity_id not in active_entity_ids:
                 hb_to_remove.append(entity_id)
                 hb.hideturtle()
-                hb.clear()
+                if self._health_bar_keys.pop(entity_id, None) is not None:
+                    hb.clear()
                 self._health_bar_pool.append(hb)
         
         for entity_id in hb_to_remove:
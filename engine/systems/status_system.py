@@ -33,9 +33,9 @@ class StatusEffectSystem(GameSystem):
     
     def update(self, dt: float) -> None:
         """Process all status effects."""
-        for entity in self.entities.get_entities_with(StatusEffects):
-            status = self.entities.get_component(entity, StatusEffects)
-            if not status:
+        for entity, status in self.entities.query(StatusEffects):
+            # Most entities carry no effects at all
+            if not status.active_flags:
                 continue
             
             expired = []
@@ -79,7 +79,7 @@ class StatusEffectSystem(GameSystem):
         effect_type: StatusEffect,
         duration: float,
         magnitude: float = 1.0,
-        source_id: str = ""
+        source_id: int = 0
     ) -> bool:
         """
         Apply a status effect to an entity.
@@ -9,8 +9,6 @@ Handles:
 """
 
 from __future__ import annotations
-import random
-import math
 from typing import TYPE_CHECKING, Optional
 
 from ..core.system import GameSystem, SystemPriority
@@ -27,6 +25,7 @@ from ..components.upgrades import (
 )
 from ..components.renderable import Renderable, RenderShape, RenderLayer
 from ..components.collider import Collider, ColliderType, CollisionMask
+from ..core.rng import RNG
 
 if TYPE_CHECKING:
     from ..core.entity import Entity
@@ -81,7 +80,7 @@ class UpgradeSystem(GameSystem):
             return
         
         # 50% chance to lose a random upgrade stack
-        if random.random() < self.degradation_chance:
+        if RNG.random() < self.degradation_chance:
             lost_type = upgrades.remove_random_stack()
             if lost_type:
                 # Visual/audio feedback would go here
@@ -117,7 +116,7 @@ class UpgradeSystem(GameSystem):
         drop_chance = calculate_drop_chance(self.current_wave, probability_bonus)
         
         # Boss always drops
-        if is_boss or random.random() < drop_chance:
+        if is_boss or RNG.random() < drop_chance:
             # Get enemy position
             transform = self.entities.get_component(entity, Transform)
             if transform:
@@ -135,8 +134,8 @@ class UpgradeSystem(GameSystem):
         definition = UPGRADE_DEFINITIONS[upgrade_type]
         
         # Transform with slight random offset
-        offset_x = random.uniform(-20, 20)
-        offset_y = random.uniform(-20, 20)
+        offset_x = RNG.uniform(-20, 20)
+        offset_y = RNG.uniform(-20, 20)
         self.entities.add_component(entity, Transform(
             x=x + offset_x,
             y=y + offset_y,
@@ -319,6 +318,9 @@ class UpgradeSystem(GameSystem):
         if not player_transform:
             return
         
+        pickup_radius = 25.0  # Player pickup range
+        pickup_radius_sq = pickup_radius * pickup_radius
+        
         # Check all upgrade pickups
         for entity in self.entities.get_entities_with(UpgradePickupTag):
             if not self.entities.is_alive(entity):
@@ -330,13 +332,10 @@ class UpgradeSystem(GameSystem):
             if not pickup_tag or not pickup_transform:
                 continue
             
-            # Check distance
+            # Check distance (squared, no sqrt needed for a range test)
             dx = pickup_transform.x - player_transform.x
             dy = pickup_transform.y - player_transform.y
-            distance = math.sqrt(dx*dx + dy*dy)
-            
-            pickup_radius = 25.0  # Player pickup range
-            if distance < pickup_radius:
+            if dx*dx + dy*dy < pickup_radius_sq:
                 # Add upgrade to player
                 success = upgrades.add_upgrade(pickup_tag.upgrade_type)
                 
@@ -387,7 +386,7 @@ class UpgradeSystem(GameSystem):
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class UpgradePickupTag:
     """Tag for upgrade pickup entities."""
     upgrade_type: UpgradeType
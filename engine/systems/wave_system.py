@@ -12,7 +12,6 @@ Enemy Design Philosophy:
 
 from __future__ import annotations
 import math
-import random
 from typing import TYPE_CHECKING, Dict, List, Callable, Optional
 from dataclasses import dataclass
 from enum import Enum, auto
@@ -27,6 +26,7 @@ from ..components.health import Health, Shield
 from ..components.weapon import Weapon, WeaponType
 from ..components.ai import AIBrain, AIBehavior, AIState
 from ..components.tags import EnemyTag, BossTag
+from ..core.rng import RNG
 
 if TYPE_CHECKING:
     from ..core.entity import Entity
@@ -417,7 +417,7 @@ class WaveSystem(GameSystem):
         # Chance to trigger event every few waves
         if self.state == WaveState.ACTIVE and not self.event_active:
             if self.current_wave >= 3 and self.current_wave % 2 == 0:
-                if random.random() < 0.15:  # 15% chance per applicable wave
+                if RNG.random() < 0.15:  # 15% chance per applicable wave
                     self._trigger_special_event()
     
     def _trigger_special_event(self) -> None:
@@ -428,7 +428,7 @@ class WaveSystem(GameSystem):
             ("enemy_mutation", 25.0),  # Random enemy becomes corrupted
         ]
         
-        event_type, duration = random.choice(events)
+        event_type, duration = RNG.choice(events)
         self.event_active = True
         self.event_type = event_type
         self.event_timer = duration
@@ -447,7 +447,7 @@ class WaveSystem(GameSystem):
         try:
             enemies = list(self.entities.get_entities_with(EnemyTag))
             if enemies:
-                target = random.choice(enemies)
+                target = RNG.choice(enemies)
                 health = self.entities.get_component(target, Health)
                 renderable = self.entities.get_component(target, Renderable)
                 
@@ -466,11 +466,13 @@ class WaveSystem(GameSystem):
     def _update_spawner_enemies(self, dt: float) -> None:
         """Update hive/spawner enemies to spawn drones."""
         try:
-            for entity in self.entities.get_entities_with(EnemyTag):
+            # Spawners are found through the tag index, so frames without a
+            # hive don't walk every enemy
+            for entity in self.entities.get_entities_with_tag("spawner"):
                 if not self.entities.is_alive(entity):
                     continue
                 
-                if not self.entities.has_tag(entity, "spawner"):
+                if not self.entities.has_component(entity, EnemyTag):
                     continue
                 
                 # Get AI brain for timer
@@ -488,10 +490,10 @@ class WaveSystem(GameSystem):
                     brain.state_timer = 0.0
                     
                     # Spawn 2-3 small drones near the hive
-                    spawn_count = random.randint(2, 3)
+                    spawn_count = RNG.randint(2, 3)
                     for _ in range(spawn_count):
-                        offset_x = random.uniform(-30, 30)
-                        offset_y = random.uniform(-30, 30)
+                        offset_x = RNG.uniform(-30, 30)
+                        offset_y = RNG.uniform(-30, 30)
                         self._spawn_swarm(transform.x + offset_x, transform.y + offset_y)
                         self.enemies_remaining += 1
         except Exception:
@@ -568,7 +570,7 @@ class WaveSystem(GameSystem):
             if total_weight <= 0:
                 break
             
-            roll = random.uniform(0, total_weight)
+            roll = RNG.uniform(0, total_weight)
             cumulative = 0
             selected = None
             
@@ -603,7 +605,6 @@ class WaveSystem(GameSystem):
                 x, y = self._get_spawn_position()
                 
                 # Validate spawn position
-                import math
                 if not math.isfinite(x) or not math.isfinite(y):
                     x, y = 0.0, self.arena_height / 2 - 50
                 
@@ -623,15 +624,15 @@ class WaveSystem(GameSystem):
         hw = self.arena_width / 2 - 30
         hh = self.arena_height / 2 - 30
         
-        side = random.randint(0, 3)
+        side = RNG.randint(0, 3)
         if side == 0:  # Top
-            return (random.uniform(-hw, hw), hh)
+            return (RNG.uniform(-hw, hw), hh)
         elif side == 1:  # Bottom
-            return (random.uniform(-hw, hw), -hh)
+            return (RNG.uniform(-hw, hw), -hh)
         elif side == 2:  # Left
-            return (-hw, random.uniform(-hh, hh))
+            return (-hw, RNG.uniform(-hh, hh))
         else:  # Right
-            return (hw, random.uniform(-hh, hh))
+            return (hw, RNG.uniform(-hh, hh))
     
     def _complete_wave(self) -> None:
         """Handle wave completion."""
@@ -650,41 +651,44 @@ class WaveSystem(GameSystem):
         entity = self.entities.create_entity()
         wave_scale = 1.0 + self.current_wave * 0.05
         
-        self.entities.add_component(entity, Transform(x=x, y=y, angle=random.uniform(0, 360)))
-        self.entities.add_component(entity, Velocity())
-        self.entities.add_component(entity, Physics(
-            max_speed=180.0 * wave_scale,
-            acceleration=400.0,
-            friction=0.1,
-            drag=0.95
-        ))
-        self.entities.add_component(entity, Renderable(
-            shape=RenderShape.TRIANGLE,
-            color="#4488ff",  # Blue = swarmer
-            outline_color="#2266cc",
-            size=0.6,
-            layer=RenderLayer.ENEMY
-        ))
-        self.entities.add_component(entity, Collider(
-            radius=10.0,
-            layer=CollisionMask.ENEMY,
-            mask=CollisionMask.PLAYER | CollisionMask.OBSTACLE | CollisionMask.PLAYER_PROJECTILE
-        ))
-        self.entities.add_component(entity, Health(
-            hp=5.0 + self.current_wave * 3,
-            max_hp=5.0 + self.current_wave * 3
-        ))
-        self.entities.add_component(entity, AIBrain(
-            behavior=AIBehavior.CHASER,
-            awareness_range=500.0,
-            attack_range=25.0,
-            speed_multiplier=wave_scale
-        ))
-        self.entities.add_component(entity, EnemyTag(
-            enemy_type="drone",
-            wave_spawned=self.current_wave,
-            point_value=50
-        ))
+        self.entities.add_components(
+            entity,
+            Transform(x=x, y=y, angle=RNG.uniform(0, 360)),
+            Velocity(),
+            Physics(
+                max_speed=180.0 * wave_scale,
+                acceleration=400.0,
+                friction=0.1,
+                drag=0.95
+            ),
+            Renderable(
+                shape=RenderShape.TRIANGLE,
+                color="#4488ff",  # Blue = swarmer
+                outline_color="#2266cc",
+                size=0.6,
+                layer=RenderLayer.ENEMY
+            ),
+            Collider(
+                radius=10.0,
+                layer=CollisionMask.ENEMY,
+                mask=CollisionMask.PLAYER | CollisionMask.OBSTACLE | CollisionMask.PLAYER_PROJECTILE
+            ),
+            Health(
+                hp=5.0 + self.current_wave * 3,
+                max_hp=5.0 + self.current_wave * 3
+            ),
+            AIBrain(
+                behavior=AIBehavior.CHASER,
+                awareness_range=500.0,
+                attack_range=25.0,
+                speed_multiplier=wave_scale
+            ),
+            EnemyTag(
+                enemy_type="drone",
+                wave_spawned=self.current_wave,
+                point_value=50
+            ),
+        )
         self.entities.add_tag(entity, "enemy")
         return entity
     
@@ -693,50 +697,53 @@ class WaveSystem(GameSystem):
         entity = self.entities.create_entity()
         wave_scale = 1.0 + self.current_wave * 0.04
         
-        self.entities.add_component(entity, Transform(x=x, y=y, angle=random.uniform(0, 360)))
-        self.entities.add_component(entity, Velocity())
-        self.entities.add_component(entity, Physics(
-            max_speed=150.0 * wave_scale,
-            acceleration=300.0,
-            friction=0.08,
-            drag=0.96
-        ))
-        self.entities.add_component(entity, Renderable(
-            shape=RenderShape.TRIANGLE,
-            color="#44ff44",  # Green = scout/ranged
-            outline_color="#22aa22",
-            size=0.7,
-            layer=RenderLayer.ENEMY
-        ))
-        self.entities.add_component(entity, Collider(
-            radius=11.0,
-            layer=CollisionMask.ENEMY,
-            mask=CollisionMask.PLAYER | CollisionMask.OBSTACLE | CollisionMask.PLAYER_PROJECTILE
-        ))
-        self.entities.add_component(entity, Health(
-            hp=8.0 + self.current_wave * 4,
-            max_hp=8.0 + self.current_wave * 4
-        ))
-        self.entities.add_component(entity, Weapon(
-            weapon_type=WeaponType.SINGLE,
-            damage=5.0,
-            fire_rate=1.5,
-            projectile_speed=280.0,
-            projectile_color="#66ff66"
-        ))
-        self.entities.add_component(entity, AIBrain(
-            behavior=AIBehavior.ORBIT,
-            awareness_range=400.0,
-            attack_range=300.0,
-            preferred_range=200.0,
-            attack_cooldown=0.7,
-            turn_speed=150.0
-        ))
-        self.entities.add_component(entity, EnemyTag(
-            enemy_type="scout",
-            wave_spawned=self.current_wave,
-            point_value=100
-        ))
+        self.entities.add_components(
+            entity,
+            Transform(x=x, y=y, angle=RNG.uniform(0, 360)),
+            Velocity(),
+            Physics(
+                max_speed=150.0 * wave_scale,
+                acceleration=300.0,
+                friction=0.08,
+                drag=0.96
+            ),
+            Renderable(
+                shape=RenderShape.TRIANGLE,
+                color="#44ff44",  # Green = scout/ranged
+                outline_color="#22aa22",
+                size=0.7,
+                layer=RenderLayer.ENEMY
+            ),
+            Collider(
+                radius=11.0,
+                layer=CollisionMask.ENEMY,
+                mask=CollisionMask.PLAYER | CollisionMask.OBSTACLE | CollisionMask.PLAYER_PROJECTILE
+            ),
+            Health(
+                hp=8.0 + self.current_wave * 4,
+                max_hp=8.0 + self.current_wave * 4
+            ),
+            Weapon(
+                weapon_type=WeaponType.SINGLE,
+                damage=5.0,
+                fire_rate=1.5,
+                projectile_speed=280.0,
+                projectile_color="#66ff66"
+            ),
+            AIBrain(
+                behavior=AIBehavior.ORBIT,
+                awareness_range=400.0,
+                attack_range=300.0,
+                preferred_range=200.0,
+                attack_cooldown=0.7,
+                turn_speed=150.0
+            ),
+            EnemyTag(
+                enemy_type="scout",
+                wave_spawned=self.current_wave,
+                point_value=100
+            ),
+        )
         self.entities.add_tag(entity, "enemy")
         return entity
     
@@ -745,43 +752,46 @@ class WaveSystem(GameSystem):
         entity = self.entities.create_entity()
         wave_scale = 1.0 + self.current_wave * 0.06
         
-        self.entities.add_component(entity, Transform(x=x, y=y, angle=random.uniform(0, 360)))
-        self.entities.add_component(entity, Velocity())
-        self.entities.add_component(entity, Physics(
-            max_speed=80.0 * wave_scale,
-            acceleration=150.0,
-            friction=0.15,
-            drag=0.92
-        ))
-        self.entities.add_component(entity, Renderable(
-            shape=RenderShape.SQUARE,
-            color="#ff4444",  # Red = heavy/bruiser
-            outline_color="#aa0000",
-            size=1.2,
-            layer=RenderLayer.ENEMY
-        ))
-        self.entities.add_component(entity, Collider(
-            radius=18.0,
-            layer=CollisionMask.ENEMY,
-            mask=CollisionMask.PLAYER | CollisionMask.OBSTACLE | CollisionMask.PLAYER_PROJECTILE
-        ))
-        self.entities.add_component(entity, Health(
-            hp=15.0 + self.current_wave * 8,
-            max_hp=15.0 + self.current_wave * 8,
-            armor=0.2
-        ))
-        self.entities.add_component(entity, AIBrain(
-            behavior=AIBehavior.CHASER,
-            awareness_range=400.0,
-            attack_range=35.0,
-            speed_multiplier=wave_scale * 0.8,
-            turn_speed=60.0
-        ))
-        self.entities.add_component(entity, EnemyTag(
-            enemy_type="bruiser",
-            wave_spawned=self.current_wave,
-            point_value=150
-        ))
+        self.entities.add_components(
+            entity,
+            Transform(x=x, y=y, angle=RNG.uniform(0, 360)),
+            Velocity(),
+            Physics(
+                max_speed=80.0 * wave_scale,
+                acceleration=150.0,
+                friction=0.15,
+                drag=0.92
+            ),
+            Renderable(
+                shape=RenderShape.SQUARE,
+                color="#ff4444",  # Red = heavy/bruiser
+                outline_color="#aa0000",
+                size=1.2,
+                layer=RenderLayer.ENEMY
+            ),
+            Collider(
+                radius=18.0,
+                layer=CollisionMask.ENEMY,
+                mask=CollisionMask.PLAYER | CollisionMask.OBSTACLE | CollisionMask.PLAYER_PROJECTILE
+            ),
+            Health(
+                hp=15.0 + self.current_wave * 8,
+                max_hp=15.0 + self.current_wave * 8,
+                armor=0.2
+            ),
+            AIBrain(
+                behavior=AIBehavior.CHASER,
+                awareness_range=400.0,
+                attack_range=35.0,
+                speed_multiplier=wave_scale * 0.8,
+                turn_speed=60.0
+            ),
+            EnemyTag(
+                enemy_type="bruiser",
+                wave_spawned=self.current_wave,
+                point_value=150
+            ),
+        )
         self.entities.add_tag(entity, "enemy")
         return entity
     
@@ -789,46 +799,49 @@ class WaveSystem(GameSystem):
         """Spawn a Turret enemy - stationary, rotates to track, high fire rate."""
         entity = self.entities.create_entity()
         
-        self.entities.add_component(entity, Transform(x=x, y=y))
-        self.entities.add_component(entity, Velocity())
-        self.entities.add_component(entity, Physics(is_kinematic=True))
-        self.entities.add_component(entity, Renderable(
-            shape=RenderShape.SQUARE,
-            color="#44ffff",  # Cyan = turret
-            outline_color="#00aaaa",
-            size=0.9,
-            layer=RenderLayer.ENEMY
-        ))
-        self.entities.add_component(entity, Collider(
-            radius=14.0,
-            layer=CollisionMask.ENEMY,
-            mask=CollisionMask.PLAYER | CollisionMask.PLAYER_PROJECTILE,
-            is_static=True
-        ))
-        self.entities.add_component(entity, Health(
-            hp=12.0 + self.current_wave * 6,
-            max_hp=12.0 + self.current_wave * 6,
-            armor=0.1
-        ))
-        self.entities.add_component(entity, Weapon(
-            weapon_type=WeaponType.SINGLE,
-            damage=4.0,
-            fire_rate=2.5 + self.current_wave * 0.15,
-            projectile_speed=350.0,
-            projectile_color="#88ffff"
-        ))
-        self.entities.add_component(entity, AIBrain(
-            behavior=AIBehavior.TURRET,
-            awareness_range=350.0,
-            attack_range=320.0,
-            attack_cooldown=0.4,
-            turn_speed=120.0
-        ))
-        self.entities.add_component(entity, EnemyTag(
-            enemy_type="turret",
-            wave_spawned=self.current_wave,
-            point_value=120
-        ))
+        self.entities.add_components(
+            entity,
+            Transform(x=x, y=y),
+            Velocity(),
+            Physics(is_kinematic=True),
+            Renderable(
+                shape=RenderShape.SQUARE,
+                color="#44ffff",  # Cyan = turret
+                outline_color="#00aaaa",
+                size=0.9,
+                layer=RenderLayer.ENEMY
+            ),
+            Collider(
+                radius=14.0,
+                layer=CollisionMask.ENEMY,
+                mask=CollisionMask.PLAYER | CollisionMask.PLAYER_PROJECTILE,
+                is_static=True
+            ),
+            Health(
+                hp=12.0 + self.current_wave * 6,
+                max_hp=12.0 + self.current_wave * 6,
+                armor=0.1
+            ),
+            Weapon(
+                weapon_type=WeaponType.SINGLE,
+                damage=4.0,
+                fire_rate=2.5 + self.current_wave * 0.15,
+                projectile_speed=350.0,
+                projectile_color="#88ffff"
+            ),
+            AIBrain(
+                behavior=AIBehavior.TURRET,
+                awareness_range=350.0,
+                attack_range=320.0,
+                attack_cooldown=0.4,
+                turn_speed=120.0
+            ),
+            EnemyTag(
+                enemy_type="turret",
+                wave_spawned=self.current_wave,
+                point_value=120
+            ),
+        )
         self.entities.add_tag(entity, "enemy")
         return entity
     
@@ -836,42 +849,45 @@ class WaveSystem(GameSystem):
         """Spawn a swarm enemy - small, fast, uses boids behavior."""
         entity = self.entities.create_entity()
         
-        self.entities.add_component(entity, Transform(x=x, y=y, angle=random.uniform(0, 360)))
-        self.entities.add_component(entity, Velocity())
-        self.entities.add_component(entity, Physics(
-            max_speed=200.0,
-            acceleration=450.0,
-            friction=0.05,
-            drag=0.98
-        ))
-        self.entities.add_component(entity, Renderable(
-            shape=RenderShape.CIRCLE,
-            color="#88ff88",
-            outline_color="#44aa44",
-            size=0.4,
-            layer=RenderLayer.ENEMY
-        ))
-        self.entities.add_component(entity, Collider(
-            radius=6.0,
-            layer=CollisionMask.ENEMY,
-            mask=CollisionMask.PLAYER | CollisionMask.OBSTACLE | CollisionMask.PLAYER_PROJECTILE
-        ))
-        self.entities.add_component(entity, Health(
-            hp=3.0 + self.current_wave * 1.5,
-            max_hp=3.0 + self.current_wave * 1.5
-        ))
-        self.entities.add_component(entity, AIBrain(
-            behavior=AIBehavior.SWARM,
-            awareness_range=400.0,
-            attack_range=20.0,
-            separation_distance=25.0,
-            neighbor_distance=70.0
-        ))
-        self.entities.add_component(entity, EnemyTag(
-            enemy_type="swarm",
-            wave_spawned=self.current_wave,
-            point_value=30
-        ))
+        self.entities.add_components(
+            entity,
+            Transform(x=x, y=y, angle=RNG.uniform(0, 360)),
+            Velocity(),
+            Physics(
+                max_speed=200.0,
+                acceleration=450.0,
+                friction=0.05,
+                drag=0.98
+            ),
+            Renderable(
+                shape=RenderShape.CIRCLE,
+                color="#88ff88",
+                outline_color="#44aa44",
+                size=0.4,
+                layer=RenderLayer.ENEMY
+            ),
+            Collider(
+                radius=6.0,
+                layer=CollisionMask.ENEMY,
+                mask=CollisionMask.PLAYER | CollisionMask.OBSTACLE | CollisionMask.PLAYER_PROJECTILE
+            ),
+            Health(
+                hp=3.0 + self.current_wave * 1.5,
+                max_hp=3.0 + self.current_wave * 1.5
+            ),
+            AIBrain(
+                behavior=AIBehavior.SWARM,
+                awareness_range=400.0,
+                attack_range=20.0,
+                separation_distance=25.0,
+                neighbor_distance=70.0
+            ),
+            EnemyTag(
+                enemy_type="swarm",
+                wave_spawned=self.current_wave,
+                point_value=30
+            ),
+        )
         self.entities.add_tag(entity, "enemy")
         return entity
     
@@ -882,50 +898,53 @@ class WaveSystem(GameSystem):
         entity = self.entities.create_entity()
         wave_scale = 1.0 + self.current_wave * 0.04
         
-        self.entities.add_component(entity, Transform(x=x, y=y, angle=random.uniform(0, 360)))
-        self.entities.add_component(entity, Velocity())
-        self.entities.add_component(entity, Physics(
-            max_speed=120.0 * wave_scale,
-            acceleration=250.0,
-            friction=0.1,
-            drag=0.95
-        ))
-        self.entities.add_component(entity, Renderable(
-            shape=RenderShape.DIAMOND,
-            color="#ff8800",  # Orange = special
-            outline_color="#cc6600",
-            size=0.8,
-            layer=RenderLayer.ENEMY
-        ))
-        self.entities.add_component(entity, Collider(
-            radius=12.0,
-            layer=CollisionMask.ENEMY,
-            mask=CollisionMask.PLAYER | CollisionMask.OBSTACLE | CollisionMask.PLAYER_PROJECTILE
-        ))
-        self.entities.add_component(entity, Health(
-            hp=10.0 + self.current_wave * 5,
-            max_hp=10.0 + self.current_wave * 5
-        ))
-        self.entities.add_component(entity, Weapon(
-            weapon_type=WeaponType.SINGLE,
-            damage=4.0,
-            fire_rate=1.2,
-            projectile_speed=250.0,
-            projectile_color="#ffaa44"
-        ))
-        self.entities.add_component(entity, AIBrain(
-            behavior=AIBehavior.ORBIT,
-            awareness_range=400.0,
-            attack_range=350.0,
-            preferred_range=250.0,
-            attack_cooldown=0.8,
-            turn_speed=100.0
-        ))
-        self.entities.add_component(entity, EnemyTag(
-            enemy_type="ricochet",
-            wave_spawned=self.current_wave,
-            point_value=180
-        ))
+        self.entities.add_components(
+            entity,
+            Transform(x=x, y=y, angle=RNG.uniform(0, 360)),
+            Velocity(),
+            Physics(
+                max_speed=120.0 * wave_scale,
+                acceleration=250.0,
+                friction=0.1,
+                drag=0.95
+            ),
+            Renderable(
+                shape=RenderShape.DIAMOND,
+                color="#ff8800",  # Orange = special
+                outline_color="#cc6600",
+                size=0.8,
+                layer=RenderLayer.ENEMY
+            ),
+            Collider(
+                radius=12.0,
+                layer=CollisionMask.ENEMY,
+                mask=CollisionMask.PLAYER | CollisionMask.OBSTACLE | CollisionMask.PLAYER_PROJECTILE
+            ),
+            Health(
+                hp=10.0 + self.current_wave * 5,
+                max_hp=10.0 + self.current_wave * 5
+            ),
+            Weapon(
+                weapon_type=WeaponType.SINGLE,
+                damage=4.0,
+                fire_rate=1.2,
+                projectile_speed=250.0,
+                projectile_color="#ffaa44"
+            ),
+            AIBrain(
+                behavior=AIBehavior.ORBIT,
+                awareness_range=400.0,
+                attack_range=350.0,
+                preferred_range=250.0,
+                attack_cooldown=0.8,
+                turn_speed=100.0
+            ),
+            EnemyTag(
+                enemy_type="ricochet",
+                wave_spawned=self.current_wave,
+                point_value=180
+            ),
+        )
         self.entities.add_tag(entity, "enemy")
         return entity
     
@@ -934,52 +953,55 @@ class WaveSystem(GameSystem):
         entity = self.entities.create_entity()
         wave_scale = 1.0 + self.current_wave * 0.04
         
-        self.entities.add_component(entity, Transform(x=x, y=y))
-        self.entities.add_component(entity, Velocity())
-        self.entities.add_component(entity, Physics(
-            max_speed=180.0 * wave_scale,
-            acceleration=350.0,
-            friction=0.08,
-            drag=0.96
-        ))
-        self.entities.add_component(entity, Renderable(
-            shape=RenderShape.CIRCLE,
-            color="#ff44ff",  # Purple = specialist
-            outline_color="#aa00aa",
-            size=0.7,
-            layer=RenderLayer.ENEMY
-        ))
-        self.entities.add_component(entity, Collider(
-            radius=10.0,
-            layer=CollisionMask.ENEMY,
-            mask=CollisionMask.PLAYER | CollisionMask.OBSTACLE | CollisionMask.PLAYER_PROJECTILE
-        ))
-        self.entities.add_component(entity, Health(
-            hp=6.0 + self.current_wave * 4,
-            max_hp=6.0 + self.current_wave * 4
-        ))
-        self.entities.add_component(entity, Weapon(
-            weapon_type=WeaponType.BURST,
-            damage=3.0,
-            fire_rate=2.5,
-            projectile_speed=300.0,
-            projectile_color="#ff88ff",
-            burst_count=3,
-            burst_delay=0.08
-        ))
-        self.entities.add_component(entity, AIBrain(
-            behavior=AIBehavior.ORBIT,
-            awareness_range=450.0,
-            attack_range=300.0,
-            preferred_range=150.0,
-            attack_cooldown=1.5,
-            turn_speed=180.0
-        ))
-        self.entities.add_component(entity, EnemyTag(
-            enemy_type="orbiter",
-            wave_spawned=self.current_wave,
-            point_value=200
-        ))
+        self.entities.add_components(
+            entity,
+            Transform(x=x, y=y),
+            Velocity(),
+            Physics(
+                max_speed=180.0 * wave_scale,
+                acceleration=350.0,
+                friction=0.08,
+                drag=0.96
+            ),
+            Renderable(
+                shape=RenderShape.CIRCLE,
+                color="#ff44ff",  # Purple = specialist
+                outline_color="#aa00aa",
+                size=0.7,
+                layer=RenderLayer.ENEMY
+            ),
+            Collider(
+                radius=10.0,
+                layer=CollisionMask.ENEMY,
+                mask=CollisionMask.PLAYER | CollisionMask.OBSTACLE | CollisionMask.PLAYER_PROJECTILE
+            ),
+            Health(
+                hp=6.0 + self.current_wave * 4,
+                max_hp=6.0 + self.current_wave * 4
+            ),
+            Weapon(
+                weapon_type=WeaponType.BURST,
+                damage=3.0,
+                fire_rate=2.5,
+                projectile_speed=300.0,
+                projectile_color="#ff88ff",
+                burst_count=3,
+                burst_delay=0.08
+            ),
+            AIBrain(
+                behavior=AIBehavior.ORBIT,
+                awareness_range=450.0,
+                attack_range=300.0,
+                preferred_range=150.0,
+                attack_cooldown=1.5,
+                turn_speed=180.0
+            ),
+            EnemyTag(
+                enemy_type="orbiter",
+                wave_spawned=self.current_wave,
+                point_value=200
+            ),
+        )
         self.entities.add_tag(entity, "enemy")
         return entity
     
@@ -988,57 +1010,60 @@ class WaveSystem(GameSystem):
         entity = self.entities.create_entity()
         wave_scale = 1.0 + self.current_wave * 0.05
         
-        self.entities.add_component(entity, Transform(x=x, y=y, angle=random.uniform(0, 360)))
-        self.entities.add_component(entity, Velocity())
-        self.entities.add_component(entity, Physics(
-            max_speed=70.0 * wave_scale,
-            acceleration=150.0,
-            friction=0.12,
-            drag=0.93
-        ))
-        self.entities.add_component(entity, Renderable(
-            shape=RenderShape.SQUARE,
-            color="#8888ff",  # Blue-purple = shielded
-            outline_color="#4444cc",
-            size=1.0,
-            layer=RenderLayer.ENEMY
-        ))
-        self.entities.add_component(entity, Collider(
-            radius=16.0,
-            layer=CollisionMask.ENEMY,
-            mask=CollisionMask.PLAYER | CollisionMask.OBSTACLE | CollisionMask.PLAYER_PROJECTILE
-        ))
-        self.entities.add_component(entity, Health(
-            hp=20.0 + self.current_wave * 8,
-            max_hp=20.0 + self.current_wave * 8,
-            armor=0.3
-        ))
-        self.entities.add_component(entity, Shield(
-            hp=25.0 + self.current_wave * 5,
-            max_hp=25.0 + self.current_wave * 5,
-            recharge_rate=5.0,
-            recharge_delay=2.0
-        ))
-        self.entities.add_component(entity, Weapon(
-            weapon_type=WeaponType.SINGLE,
-            damage=6.0,
-            fire_rate=1.0,
-            projectile_speed=280.0,
-            projectile_color="#aaaaff"
-        ))
-        self.entities.add_component(entity, AIBrain(
-            behavior=AIBehavior.CHASER,
-            awareness_range=350.0,
-            attack_range=200.0,
-            attack_cooldown=1.0,
-            turn_speed=60.0,
-            speed_multiplier=wave_scale * 0.7
-        ))
-        self.entities.add_component(entity, EnemyTag(
-            enemy_type="shielder",
-            wave_spawned=self.current_wave,
-            point_value=250
-        ))
+        self.entities.add_components(
+            entity,
+            Transform(x=x, y=y, angle=RNG.uniform(0, 360)),
+            Velocity(),
+            Physics(
+                max_speed=70.0 * wave_scale,
+                acceleration=150.0,
+                friction=0.12,
+                drag=0.93
+            ),
+            Renderable(
+                shape=RenderShape.SQUARE,
+                color="#8888ff",  # Blue-purple = shielded
+                outline_color="#4444cc",
+                size=1.0,
+                layer=RenderLayer.ENEMY
+            ),
+            Collider(
+                radius=16.0,
+                layer=CollisionMask.ENEMY,
+                mask=CollisionMask.PLAYER | CollisionMask.OBSTACLE | CollisionMask.PLAYER_PROJECTILE
+            ),
+            Health(
+                hp=20.0 + self.current_wave * 8,
+                max_hp=20.0 + self.current_wave * 8,
+                armor=0.3
+            ),
+            Shield(
+                hp=25.0 + self.current_wave * 5,
+                max_hp=25.0 + self.current_wave * 5,
+                recharge_rate=5.0,
+                recharge_delay=2.0
+            ),
+            Weapon(
+                weapon_type=WeaponType.SINGLE,
+                damage=6.0,
+                fire_rate=1.0,
+                projectile_speed=280.0,
+                projectile_color="#aaaaff"
+            ),
+            AIBrain(
+                behavior=AIBehavior.CHASER,
+                awareness_range=350.0,
+                attack_range=200.0,
+                attack_cooldown=1.0,
+                turn_speed=60.0,
+                speed_multiplier=wave_scale * 0.7
+            ),
+            EnemyTag(
+                enemy_type="shielder",
+                wave_spawned=self.current_wave,
+                point_value=250
+            ),
+        )
         self.entities.add_tag(entity, "enemy")
         return entity
     
@@ -1050,41 +1075,44 @@ class WaveSystem(GameSystem):
         size_mult = [1.0, 0.6, 0.35][min(size_tier, 2)]
         hp_mult = [1.0, 0.5, 0.25][min(size_tier, 2)]
         
-        self.entities.add_component(entity, Transform(x=x, y=y, angle=random.uniform(0, 360)))
-        self.entities.add_component(entity, Velocity())
-        self.entities.add_component(entity, Physics(
-            max_speed=160.0 + size_tier * 30,  # Smaller = faster
-            acceleration=350.0,
-            friction=0.08,
-            drag=0.96
-        ))
-        self.entities.add_component(entity, Renderable(
-            shape=RenderShape.HEXAGON,
-            color="#ffff44",  # Yellow
-            outline_color="#aaaa00",
-            size=0.9 * size_mult,
-            layer=RenderLayer.ENEMY
-        ))
-        self.entities.add_component(entity, Collider(
-            radius=14.0 * size_mult,
-            layer=CollisionMask.ENEMY,
-            mask=CollisionMask.PLAYER | CollisionMask.OBSTACLE | CollisionMask.PLAYER_PROJECTILE
-        ))
-        self.entities.add_component(entity, Health(
-            hp=(8.0 + self.current_wave * 3) * hp_mult,
-            max_hp=(8.0 + self.current_wave * 3) * hp_mult
-        ))
-        self.entities.add_component(entity, AIBrain(
-            behavior=AIBehavior.CHASER,
-            awareness_range=400.0,
-            attack_range=25.0,
-            speed_multiplier=1.0 + size_tier * 0.3
-        ))
-        self.entities.add_component(entity, EnemyTag(
-            enemy_type=f"divider_{size_tier}",
-            wave_spawned=self.current_wave,
-            point_value=80 - size_tier * 20
-        ))
+        self.entities.add_components(
+            entity,
+            Transform(x=x, y=y, angle=RNG.uniform(0, 360)),
+            Velocity(),
+            Physics(
+                max_speed=160.0 + size_tier * 30,  # Smaller = faster
+                acceleration=350.0,
+                friction=0.08,
+                drag=0.96
+            ),
+            Renderable(
+                shape=RenderShape.HEXAGON,
+                color="#ffff44",  # Yellow
+                outline_color="#aaaa00",
+                size=0.9 * size_mult,
+                layer=RenderLayer.ENEMY
+            ),
+            Collider(
+                radius=14.0 * size_mult,
+                layer=CollisionMask.ENEMY,
+                mask=CollisionMask.PLAYER | CollisionMask.OBSTACLE | CollisionMask.PLAYER_PROJECTILE
+            ),
+            Health(
+                hp=(8.0 + self.current_wave * 3) * hp_mult,
+                max_hp=(8.0 + self.current_wave * 3) * hp_mult
+            ),
+            AIBrain(
+                behavior=AIBehavior.CHASER,
+                awareness_range=400.0,
+                attack_range=25.0,
+                speed_multiplier=1.0 + size_tier * 0.3
+            ),
+            EnemyTag(
+                enemy_type=f"divider_{size_tier}",
+                wave_spawned=self.current_wave,
+                point_value=80 - size_tier * 20
+            ),
+        )
         self.entities.add_tag(entity, "enemy")
         self.entities.add_tag(entity, f"divider_{size_tier}")
         return entity
@@ -1094,42 +1122,45 @@ class WaveSystem(GameSystem):
         entity = self.entities.create_entity()
         wave_scale = 1.0 + self.current_wave * 0.05
         
-        self.entities.add_component(entity, Transform(x=x, y=y, angle=random.uniform(0, 360)))
-        self.entities.add_component(entity, Velocity())
-        self.entities.add_component(entity, Physics(
-            max_speed=300.0 * wave_scale,  # Very fast
-            acceleration=600.0,
-            friction=0.05,
-            drag=0.98
-        ))
-        self.entities.add_component(entity, Renderable(
-            shape=RenderShape.TRIANGLE,
-            color="#ff6644",  # Orange-red
-            outline_color="#cc4422",
-            size=0.9,
-            layer=RenderLayer.ENEMY
-        ))
-        self.entities.add_component(entity, Collider(
-            radius=13.0,
-            layer=CollisionMask.ENEMY,
-            mask=CollisionMask.PLAYER | CollisionMask.OBSTACLE | CollisionMask.PLAYER_PROJECTILE
-        ))
-        self.entities.add_component(entity, Health(
-            hp=12.0 + self.current_wave * 5,
-            max_hp=12.0 + self.current_wave * 5
-        ))
-        self.entities.add_component(entity, AIBrain(
-            behavior=AIBehavior.CHASER,
-            awareness_range=500.0,
-            attack_range=30.0,
-            speed_multiplier=wave_scale * 1.5,
-            turn_speed=45.0  # Slow turning = predictable
-        ))
-        self.entities.add_component(entity, EnemyTag(
-            enemy_type="charger",
-            wave_spawned=self.current_wave,
-            point_value=160
-        ))
+        self.entities.add_components(
+            entity,
+            Transform(x=x, y=y, angle=RNG.uniform(0, 360)),
+            Velocity(),
+            Physics(
+                max_speed=300.0 * wave_scale,  # Very fast
+                acceleration=600.0,
+                friction=0.05,
+                drag=0.98
+            ),
+            Renderable(
+                shape=RenderShape.TRIANGLE,
+                color="#ff6644",  # Orange-red
+                outline_color="#cc4422",
+                size=0.9,
+                layer=RenderLayer.ENEMY
+            ),
+            Collider(
+                radius=13.0,
+                layer=CollisionMask.ENEMY,
+                mask=CollisionMask.PLAYER | CollisionMask.OBSTACLE | CollisionMask.PLAYER_PROJECTILE
+            ),
+            Health(
+                hp=12.0 + self.current_wave * 5,
+                max_hp=12.0 + self.current_wave * 5
+            ),
+            AIBrain(
+                behavior=AIBehavior.CHASER,
+                awareness_range=500.0,
+                attack_range=30.0,
+                speed_multiplier=wave_scale * 1.5,
+                turn_speed=45.0  # Slow turning = predictable
+            ),
+            EnemyTag(
+                enemy_type="charger",
+                wave_spawned=self.current_wave,
+                point_value=160
+            ),
+        )
         self.entities.add_tag(entity, "enemy")
         return entity
     
@@ -1138,52 +1169,55 @@ class WaveSystem(GameSystem):
         entity = self.entities.create_entity()
         wave_scale = 1.0 + self.current_wave * 0.04
         
-        self.entities.add_component(entity, Transform(x=x, y=y, angle=random.uniform(0, 360)))
-        self.entities.add_component(entity, Velocity())
-        self.entities.add_component(entity, Physics(
-            max_speed=140.0 * wave_scale,
-            acceleration=280.0,
-            friction=0.1,
-            drag=0.95
-        ))
-        self.entities.add_component(entity, Renderable(
-            shape=RenderShape.DIAMOND,
-            color="#aa88ff",  # Light purple
-            outline_color="#6644aa",
-            size=0.7,
-            layer=RenderLayer.ENEMY,
-            glow=True,
-            pulse_speed=1.5
-        ))
-        self.entities.add_component(entity, Collider(
-            radius=11.0,
-            layer=CollisionMask.ENEMY,
-            mask=CollisionMask.PLAYER | CollisionMask.OBSTACLE | CollisionMask.PLAYER_PROJECTILE
-        ))
-        self.entities.add_component(entity, Health(
-            hp=9.0 + self.current_wave * 4,
-            max_hp=9.0 + self.current_wave * 4
-        ))
-        self.entities.add_component(entity, Weapon(
-            weapon_type=WeaponType.SINGLE,
-            damage=5.0,
-            fire_rate=0.8,
-            projectile_speed=320.0,
-            projectile_color="#cc88ff"
-        ))
-        self.entities.add_component(entity, AIBrain(
-            behavior=AIBehavior.ORBIT,
-            awareness_range=400.0,
-            attack_range=280.0,
-            preferred_range=200.0,
-            attack_cooldown=2.5,  # Long cooldown (shoots from stealth)
-            turn_speed=150.0
-        ))
-        self.entities.add_component(entity, EnemyTag(
-            enemy_type="phantom",
-            wave_spawned=self.current_wave,
-            point_value=220
-        ))
+        self.entities.add_components(
+            entity,
+            Transform(x=x, y=y, angle=RNG.uniform(0, 360)),
+            Velocity(),
+            Physics(
+                max_speed=140.0 * wave_scale,
+                acceleration=280.0,
+                friction=0.1,
+                drag=0.95
+            ),
+            Renderable(
+                shape=RenderShape.DIAMOND,
+                color="#aa88ff",  # Light purple
+                outline_color="#6644aa",
+                size=0.7,
+                layer=RenderLayer.ENEMY,
+                glow=True,
+                pulse_speed=1.5
+            ),
+            Collider(
+                radius=11.0,
+                layer=CollisionMask.ENEMY,
+                mask=CollisionMask.PLAYER | CollisionMask.OBSTACLE | CollisionMask.PLAYER_PROJECTILE
+            ),
+            Health(
+                hp=9.0 + self.current_wave * 4,
+                max_hp=9.0 + self.current_wave * 4
+            ),
+            Weapon(
+                weapon_type=WeaponType.SINGLE,
+                damage=5.0,
+                fire_rate=0.8,
+                projectile_speed=320.0,
+                projectile_color="#cc88ff"
+            ),
+            AIBrain(
+                behavior=AIBehavior.ORBIT,
+                awareness_range=400.0,
+                attack_range=280.0,
+                preferred_range=200.0,
+                attack_cooldown=2.5,  # Long cooldown (shoots from stealth)
+                turn_speed=150.0
+            ),
+            EnemyTag(
+                enemy_type="phantom",
+                wave_spawned=self.current_wave,
+                point_value=220
+            ),
+        )
         self.entities.add_tag(entity, "enemy")
         return entity
     
@@ -1194,51 +1228,54 @@ class WaveSystem(GameSystem):
         entity = self.entities.create_entity()
         wave_scale = 1.0 + self.current_wave * 0.04
         
-        self.entities.add_component(entity, Transform(x=x, y=y, angle=random.uniform(0, 360)))
-        self.entities.add_component(entity, Velocity())
-        self.entities.add_component(entity, Physics(
-            max_speed=150.0 * wave_scale,
-            acceleration=300.0,
-            friction=0.1,
-            drag=0.95
-        ))
-        self.entities.add_component(entity, Renderable(
-            shape=RenderShape.TRIANGLE,
-            color="#00ff88",  # Similar to player
-            outline_color="#00aa55",
-            size=0.85,
-            layer=RenderLayer.ENEMY,
-            glow=True
-        ))
-        self.entities.add_component(entity, Collider(
-            radius=13.0,
-            layer=CollisionMask.ENEMY,
-            mask=CollisionMask.PLAYER | CollisionMask.OBSTACLE | CollisionMask.PLAYER_PROJECTILE
-        ))
-        self.entities.add_component(entity, Health(
-            hp=11.0 + self.current_wave * 5,
-            max_hp=11.0 + self.current_wave * 5
-        ))
-        self.entities.add_component(entity, Weapon(
-            weapon_type=WeaponType.SINGLE,
-            damage=6.0,
-            fire_rate=3.0,  # Same as player
-            projectile_speed=400.0,
-            projectile_color="#88ffaa"
-        ))
-        self.entities.add_component(entity, AIBrain(
-            behavior=AIBehavior.ORBIT,
-            awareness_range=450.0,
-            attack_range=350.0,
-            preferred_range=200.0,
-            attack_cooldown=0.5,
-            turn_speed=200.0
-        ))
-        self.entities.add_component(entity, EnemyTag(
-            enemy_type="mimic",
-            wave_spawned=self.current_wave,
-            point_value=300
-        ))
+        self.entities.add_components(
+            entity,
+            Transform(x=x, y=y, angle=RNG.uniform(0, 360)),
+            Velocity(),
+            Physics(
+                max_speed=150.0 * wave_scale,
+                acceleration=300.0,
+                friction=0.1,
+                drag=0.95
+            ),
+            Renderable(
+                shape=RenderShape.TRIANGLE,
+                color="#00ff88",  # Similar to player
+                outline_color="#00aa55",
+                size=0.85,
+                layer=RenderLayer.ENEMY,
+                glow=True
+            ),
+            Collider(
+                radius=13.0,
+                layer=CollisionMask.ENEMY,
+                mask=CollisionMask.PLAYER | CollisionMask.OBSTACLE | CollisionMask.PLAYER_PROJECTILE
+            ),
+            Health(
+                hp=11.0 + self.current_wave * 5,
+                max_hp=11.0 + self.current_wave * 5
+            ),
+            Weapon(
+                weapon_type=WeaponType.SINGLE,
+                damage=6.0,
+                fire_rate=3.0,  # Same as player
+                projectile_speed=400.0,
+                projectile_color="#88ffaa"
+            ),
+            AIBrain(
+                behavior=AIBehavior.ORBIT,
+                awareness_range=450.0,
+                attack_range=350.0,
+                preferred_range=200.0,
+                attack_cooldown=0.5,
+                turn_speed=200.0
+            ),
+            EnemyTag(
+                enemy_type="mimic",
+                wave_spawned=self.current_wave,
+                point_value=300
+            ),
+        )
         self.entities.add_tag(entity, "enemy")
         return entity
     
@@ -1246,44 +1283,47 @@ class WaveSystem(GameSystem):
         """Spawn a Hive enemy - spawns small drones periodically."""
         entity = self.entities.create_entity()
         
-        self.entities.add_component(entity, Transform(x=x, y=y, angle=0))
-        self.entities.add_component(entity, Velocity())
-        self.entities.add_component(entity, Physics(
-            max_speed=40.0,  # Very slow
-            acceleration=80.0,
-            friction=0.15,
-            drag=0.9
-        ))
-        self.entities.add_component(entity, Renderable(
-            shape=RenderShape.HEXAGON,
-            color="#ffaa00",  # Orange
-            outline_color="#cc8800",
-            size=1.3,
-            layer=RenderLayer.ENEMY,
-            glow=True,
-            pulse_speed=0.5
-        ))
-        self.entities.add_component(entity, Collider(
-            radius=20.0,
-            layer=CollisionMask.ENEMY,
-            mask=CollisionMask.PLAYER | CollisionMask.PLAYER_PROJECTILE
-        ))
-        self.entities.add_component(entity, Health(
-            hp=25.0 + self.current_wave * 10,
-            max_hp=25.0 + self.current_wave * 10,
-            armor=0.2
-        ))
-        self.entities.add_component(entity, AIBrain(
-            behavior=AIBehavior.WANDER,
-            awareness_range=500.0,
-            attack_range=400.0,
-            speed_multiplier=0.5
-        ))
-        self.entities.add_component(entity, EnemyTag(
-            enemy_type="hive",
-            wave_spawned=self.current_wave,
-            point_value=350
-        ))
+        self.entities.add_components(
+            entity,
+            Transform(x=x, y=y, angle=0),
+            Velocity(),
+            Physics(
+                max_speed=40.0,  # Very slow
+                acceleration=80.0,
+                friction=0.15,
+                drag=0.9
+            ),
+            Renderable(
+                shape=RenderShape.HEXAGON,
+                color="#ffaa00",  # Orange
+                outline_color="#cc8800",
+                size=1.3,
+                layer=RenderLayer.ENEMY,
+                glow=True,
+                pulse_speed=0.5
+            ),
+            Collider(
+                radius=20.0,
+                layer=CollisionMask.ENEMY,
+                mask=CollisionMask.PLAYER | CollisionMask.PLAYER_PROJECTILE
+            ),
+            Health(
+                hp=25.0 + self.current_wave * 10,
+                max_hp=25.0 + self.current_wave * 10,
+                armor=0.2
+            ),
+            AIBrain(
+                behavior=AIBehavior.WANDER,
+                awareness_range=500.0,
+                attack_range=400.0,
+                speed_multiplier=0.5
+            ),
+            EnemyTag(
+                enemy_type="hive",
+                wave_spawned=self.current_wave,
+                point_value=350
+            ),
+        )
         self.entities.add_tag(entity, "enemy")
         self.entities.add_tag(entity, "spawner")
         return entity
@@ -1293,52 +1333,55 @@ class WaveSystem(GameSystem):
         entity = self.entities.create_entity()
         wave_scale = 1.0 + self.current_wave * 0.04
         
-        self.entities.add_component(entity, Transform(x=x, y=y, angle=random.uniform(0, 360)))
-        self.entities.add_component(entity, Velocity())
-        self.entities.add_component(entity, Physics(
-            max_speed=130.0 * wave_scale,
-            acceleration=260.0,
-            friction=0.1,
-            drag=0.95
-        ))
-        self.entities.add_component(entity, Renderable(
-            shape=RenderShape.DIAMOND,
-            color="#ff00ff",  # Magenta
-            outline_color="#aa00aa",
-            size=0.75,
-            layer=RenderLayer.ENEMY,
-            glow=True,
-            pulse_speed=2.0
-        ))
-        self.entities.add_component(entity, Collider(
-            radius=11.0,
-            layer=CollisionMask.ENEMY,
-            mask=CollisionMask.PLAYER | CollisionMask.OBSTACLE | CollisionMask.PLAYER_PROJECTILE
-        ))
-        self.entities.add_component(entity, Health(
-            hp=12.0 + self.current_wave * 5,
-            max_hp=12.0 + self.current_wave * 5
-        ))
-        self.entities.add_component(entity, Weapon(
-            weapon_type=WeaponType.SINGLE,
-            damage=5.0,
-            fire_rate=1.5,
-            projectile_speed=320.0,
-            projectile_color="#ff88ff"
-        ))
-        self.entities.add_component(entity, AIBrain(
-            behavior=AIBehavior.ORBIT,
-            awareness_range=500.0,
-            attack_range=280.0,
-            preferred_range=180.0,
-            attack_cooldown=0.7,
-            turn_speed=200.0
-        ))
-        self.entities.add_component(entity, EnemyTag(
-            enemy_type="stalker",
-            wave_spawned=self.current_wave,
-            point_value=280
-        ))
+        self.entities.add_components(
+            entity,
+            Transform(x=x, y=y, angle=RNG.uniform(0, 360)),
+            Velocity(),
+            Physics(
+                max_speed=130.0 * wave_scale,
+                acceleration=260.0,
+                friction=0.1,
+                drag=0.95
+            ),
+            Renderable(
+                shape=RenderShape.DIAMOND,
+                color="#ff00ff",  # Magenta
+                outline_color="#aa00aa",
+                size=0.75,
+                layer=RenderLayer.ENEMY,
+                glow=True,
+                pulse_speed=2.0
+            ),
+            Collider(
+                radius=11.0,
+                layer=CollisionMask.ENEMY,
+                mask=CollisionMask.PLAYER | CollisionMask.OBSTACLE | CollisionMask.PLAYER_PROJECTILE
+            ),
+            Health(
+                hp=12.0 + self.current_wave * 5,
+                max_hp=12.0 + self.current_wave * 5
+            ),
+            Weapon(
+                weapon_type=WeaponType.SINGLE,
+                damage=5.0,
+                fire_rate=1.5,
+                projectile_speed=320.0,
+                projectile_color="#ff88ff"
+            ),
+            AIBrain(
+                behavior=AIBehavior.ORBIT,
+                awareness_range=500.0,
+                attack_range=280.0,
+                preferred_range=180.0,
+                attack_cooldown=0.7,
+                turn_speed=200.0
+            ),
+            EnemyTag(
+                enemy_type="stalker",
+                wave_spawned=self.current_wave,
+                point_value=280
+            ),
+        )
         self.entities.add_tag(entity, "enemy")
         return entity
     
@@ -1347,50 +1390,53 @@ class WaveSystem(GameSystem):
         entity = self.entities.create_entity()
         wave_scale = 1.0 + self.current_wave * 0.04
         
-        self.entities.add_component(entity, Transform(x=x, y=y, angle=random.uniform(0, 360)))
-        self.entities.add_component(entity, Velocity())
-        self.entities.add_component(entity, Physics(
-            max_speed=110.0 * wave_scale,
-            acceleration=220.0,
-            friction=0.1,
-            drag=0.95
-        ))
-        self.entities.add_component(entity, Renderable(
-            shape=RenderShape.HEXAGON,
-            color="#ff4488",  # Pink-red
-            outline_color="#cc2266",
-            size=0.8,
-            layer=RenderLayer.ENEMY
-        ))
-        self.entities.add_component(entity, Collider(
-            radius=12.0,
-            layer=CollisionMask.ENEMY,
-            mask=CollisionMask.PLAYER | CollisionMask.OBSTACLE | CollisionMask.PLAYER_PROJECTILE
-        ))
-        self.entities.add_component(entity, Health(
-            hp=10.0 + self.current_wave * 4,
-            max_hp=10.0 + self.current_wave * 4
-        ))
-        self.entities.add_component(entity, Weapon(
-            weapon_type=WeaponType.SINGLE,
-            damage=4.0,
-            fire_rate=0.8,
-            projectile_speed=220.0,  # Slower projectiles
-            projectile_color="#ff88aa"
-        ))
-        self.entities.add_component(entity, AIBrain(
-            behavior=AIBehavior.ORBIT,
-            awareness_range=400.0,
-            attack_range=300.0,
-            preferred_range=220.0,
-            attack_cooldown=1.2,
-            turn_speed=120.0
-        ))
-        self.entities.add_component(entity, EnemyTag(
-            enemy_type="splicer",
-            wave_spawned=self.current_wave,
-            point_value=260
-        ))
+        self.entities.add_components(
+            entity,
+            Transform(x=x, y=y, angle=RNG.uniform(0, 360)),
+            Velocity(),
+            Physics(
+                max_speed=110.0 * wave_scale,
+                acceleration=220.0,
+                friction=0.1,
+                drag=0.95
+            ),
+            Renderable(
+                shape=RenderShape.HEXAGON,
+                color="#ff4488",  # Pink-red
+                outline_color="#cc2266",
+                size=0.8,
+                layer=RenderLayer.ENEMY
+            ),
+            Collider(
+                radius=12.0,
+                layer=CollisionMask.ENEMY,
+                mask=CollisionMask.PLAYER | CollisionMask.OBSTACLE | CollisionMask.PLAYER_PROJECTILE
+            ),
+            Health(
+                hp=10.0 + self.current_wave * 4,
+                max_hp=10.0 + self.current_wave * 4
+            ),
+            Weapon(
+                weapon_type=WeaponType.SINGLE,
+                damage=4.0,
+                fire_rate=0.8,
+                projectile_speed=220.0,  # Slower projectiles
+                projectile_color="#ff88aa"
+            ),
+            AIBrain(
+                behavior=AIBehavior.ORBIT,
+                awareness_range=400.0,
+                attack_range=300.0,
+                preferred_range=220.0,
+                attack_cooldown=1.2,
+                turn_speed=120.0
+            ),
+            EnemyTag(
+                enemy_type="splicer",
+                wave_spawned=self.current_wave,
+                point_value=260
+            ),
+        )
         self.entities.add_tag(entity, "enemy")
         return entity
     
@@ -1401,56 +1447,59 @@ class WaveSystem(GameSystem):
         entity = self.entities.create_entity()
         wave_scale = 1.0 + self.current_wave * 0.05
         
-        self.entities.add_component(entity, Transform(x=x, y=y, angle=random.uniform(0, 360)))
-        self.entities.add_component(entity, Velocity())
-        self.entities.add_component(entity, Physics(
-            max_speed=100.0 * wave_scale,
-            acceleration=200.0,
-            friction=0.1,
-            drag=0.94
-        ))
-        self.entities.add_component(entity, Renderable(
-            shape=RenderShape.SQUARE,
-            color="#ff8800",  # Orange = elite
-            outline_color="#cc6600",
-            size=1.4,
-            layer=RenderLayer.ENEMY,
-            glow=True,
-            pulse_speed=1.0
-        ))
-        self.entities.add_component(entity, Collider(
-            radius=22.0,
-            layer=CollisionMask.ENEMY,
-            mask=CollisionMask.PLAYER | CollisionMask.OBSTACLE | CollisionMask.PLAYER_PROJECTILE
-        ))
-        self.entities.add_component(entity, Health(
-            hp=40.0 + self.current_wave * 15,
-            max_hp=40.0 + self.current_wave * 15,
-            armor=0.25
-        ))
-        self.entities.add_component(entity, Weapon(
-            weapon_type=WeaponType.BURST,
-            damage=8.0,
-            fire_rate=1.5,
-            projectile_speed=300.0,
-            projectile_color="#ffaa44",
-            burst_count=4,
-            burst_delay=0.1
-        ))
-        self.entities.add_component(entity, AIBrain(
-            behavior=AIBehavior.BOSS,  # Uses phase-based behavior
-            awareness_range=600.0,
-            attack_range=400.0,
-            preferred_range=200.0,
-            attack_cooldown=2.0,
-            turn_speed=80.0,
-            phase_hp_thresholds=[0.66, 0.33, 0.0]
-        ))
-        self.entities.add_component(entity, EnemyTag(
-            enemy_type="sentinel",
-            wave_spawned=self.current_wave,
-            point_value=500
-        ))
+        self.entities.add_components(
+            entity,
+            Transform(x=x, y=y, angle=RNG.uniform(0, 360)),
+            Velocity(),
+            Physics(
+                max_speed=100.0 * wave_scale,
+                acceleration=200.0,
+                friction=0.1,
+                drag=0.94
+            ),
+            Renderable(
+                shape=RenderShape.SQUARE,
+                color="#ff8800",  # Orange = elite
+                outline_color="#cc6600",
+                size=1.4,
+                layer=RenderLayer.ENEMY,
+                glow=True,
+                pulse_speed=1.0
+            ),
+            Collider(
+                radius=22.0,
+                layer=CollisionMask.ENEMY,
+                mask=CollisionMask.PLAYER | CollisionMask.OBSTACLE | CollisionMask.PLAYER_PROJECTILE
+            ),
+            Health(
+                hp=40.0 + self.current_wave * 15,
+                max_hp=40.0 + self.current_wave * 15,
+                armor=0.25
+            ),
+            Weapon(
+                weapon_type=WeaponType.BURST,
+                damage=8.0,
+                fire_rate=1.5,
+                projectile_speed=300.0,
+                projectile_color="#ffaa44",
+                burst_count=4,
+                burst_delay=0.1
+            ),
+            AIBrain(
+                behavior=AIBehavior.BOSS,  # Uses phase-based behavior
+                awareness_range=600.0,
+                attack_range=400.0,
+                preferred_range=200.0,
+                attack_cooldown=2.0,
+                turn_speed=80.0,
+                phase_hp_thresholds=[0.66, 0.33, 0.0]
+            ),
+            EnemyTag(
+                enemy_type="sentinel",
+                wave_spawned=self.current_wave,
+                point_value=500
+            ),
+        )
         self.entities.add_tag(entity, "enemy")
         self.entities.add_tag(entity, "elite")
         return entity
@@ -1460,59 +1509,62 @@ class WaveSystem(GameSystem):
         entity = self.entities.create_entity()
         wave_scale = 1.0 + self.current_wave * 0.04
         
-        self.entities.add_component(entity, Transform(x=x, y=y, angle=random.uniform(0, 360)))
-        self.entities.add_component(entity, Velocity())
-        self.entities.add_component(entity, Physics(
-            max_speed=80.0 * wave_scale,
-            acceleration=160.0,
-            friction=0.12,
-            drag=0.93
-        ))
-        self.entities.add_component(entity, Renderable(
-            shape=RenderShape.HEXAGON,
-            color="#ffff00",  # Gold = commander
-            outline_color="#cccc00",
-            size=1.2,
-            layer=RenderLayer.ENEMY,
-            glow=True,
-            pulse_speed=0.8
-        ))
-        self.entities.add_component(entity, Collider(
-            radius=18.0,
-            layer=CollisionMask.ENEMY,
-            mask=CollisionMask.PLAYER | CollisionMask.OBSTACLE | CollisionMask.PLAYER_PROJECTILE
-        ))
-        self.entities.add_component(entity, Health(
-            hp=30.0 + self.current_wave * 12,
-            max_hp=30.0 + self.current_wave * 12,
-            armor=0.15
-        ))
-        self.entities.add_component(entity, Shield(
-            hp=20.0 + self.current_wave * 5,
-            max_hp=20.0 + self.current_wave * 5,
-            recharge_rate=8.0,
-            recharge_delay=3.0
-        ))
-        self.entities.add_component(entity, Weapon(
-            weapon_type=WeaponType.SINGLE,
-            damage=6.0,
-            fire_rate=1.0,
-            projectile_speed=280.0,
-            projectile_color="#ffff88"
-        ))
-        self.entities.add_component(entity, AIBrain(
-            behavior=AIBehavior.FLEE,  # Stays back, commands others
-            awareness_range=500.0,
-            attack_range=300.0,
-            preferred_range=250.0,
-            attack_cooldown=1.0,
-            turn_speed=120.0
-        ))
-        self.entities.add_component(entity, EnemyTag(
-            enemy_type="sovereign",
-            wave_spawned=self.current_wave,
-            point_value=450
-        ))
+        self.entities.add_components(
+            entity,
+            Transform(x=x, y=y, angle=RNG.uniform(0, 360)),
+            Velocity(),
+            Physics(
+                max_speed=80.0 * wave_scale,
+                acceleration=160.0,
+                friction=0.12,
+                drag=0.93
+            ),
+            Renderable(
+                shape=RenderShape.HEXAGON,
+                color="#ffff00",  # Gold = commander
+                outline_color="#cccc00",
+                size=1.2,
+                layer=RenderLayer.ENEMY,
+                glow=True,
+                pulse_speed=0.8
+            ),
+            Collider(
+                radius=18.0,
+                layer=CollisionMask.ENEMY,
+                mask=CollisionMask.PLAYER | CollisionMask.OBSTACLE | CollisionMask.PLAYER_PROJECTILE
+            ),
+            Health(
+                hp=30.0 + self.current_wave * 12,
+                max_hp=30.0 + self.current_wave * 12,
+                armor=0.15
+            ),
+            Shield(
+                hp=20.0 + self.current_wave * 5,
+                max_hp=20.0 + self.current_wave * 5,
+                recharge_rate=8.0,
+                recharge_delay=3.0
+            ),
+            Weapon(
+                weapon_type=WeaponType.SINGLE,
+                damage=6.0,
+                fire_rate=1.0,
+                projectile_speed=280.0,
+                projectile_color="#ffff88"
+            ),
+            AIBrain(
+                behavior=AIBehavior.FLEE,  # Stays back, commands others
+                awareness_range=500.0,
+                attack_range=300.0,
+                preferred_range=250.0,
+                attack_cooldown=1.0,
+                turn_speed=120.0
+            ),
+            EnemyTag(
+                enemy_type="sovereign",
+                wave_spawned=self.current_wave,
+                point_value=450
+            ),
+        )
         self.entities.add_tag(entity, "enemy")
         self.entities.add_tag(entity, "elite")
         self.entities.add_tag(entity, "commander")
@@ -1523,44 +1575,47 @@ class WaveSystem(GameSystem):
         entity = self.entities.create_entity()
         wave_scale = 1.0 + self.current_wave * 0.05
         
-        self.entities.add_component(entity, Transform(x=x, y=y, angle=random.uniform(0, 360)))
-        self.entities.add_component(entity, Velocity())
-        self.entities.add_component(entity, Physics(
-            max_speed=280.0 * wave_scale,  # Very fast
-            acceleration=550.0,
-            friction=0.06,
-            drag=0.97
-        ))
-        self.entities.add_component(entity, Renderable(
-            shape=RenderShape.TRIANGLE,
-            color="#ff0044",  # Deep red
-            outline_color="#aa0022",
-            size=0.95,
-            layer=RenderLayer.ENEMY,
-            glow=True,
-            pulse_speed=3.0
-        ))
-        self.entities.add_component(entity, Collider(
-            radius=14.0,
-            layer=CollisionMask.ENEMY,
-            mask=CollisionMask.PLAYER | CollisionMask.OBSTACLE | CollisionMask.PLAYER_PROJECTILE
-        ))
-        self.entities.add_component(entity, Health(
-            hp=18.0 + self.current_wave * 6,
-            max_hp=18.0 + self.current_wave * 6
-        ))
-        self.entities.add_component(entity, AIBrain(
-            behavior=AIBehavior.CHASER,
-            awareness_range=600.0,
-            attack_range=30.0,
-            speed_multiplier=wave_scale * 1.4,
-            turn_speed=150.0
-        ))
-        self.entities.add_component(entity, EnemyTag(
-            enemy_type="executor",
-            wave_spawned=self.current_wave,
-            point_value=400
-        ))
+        self.entities.add_components(
+            entity,
+            Transform(x=x, y=y, angle=RNG.uniform(0, 360)),
+            Velocity(),
+            Physics(
+                max_speed=280.0 * wave_scale,  # Very fast
+                acceleration=550.0,
+                friction=0.06,
+                drag=0.97
+            ),
+            Renderable(
+                shape=RenderShape.TRIANGLE,
+                color="#ff0044",  # Deep red
+                outline_color="#aa0022",
+                size=0.95,
+                layer=RenderLayer.ENEMY,
+                glow=True,
+                pulse_speed=3.0
+            ),
+            Collider(
+                radius=14.0,
+                layer=CollisionMask.ENEMY,
+                mask=CollisionMask.PLAYER | CollisionMask.OBSTACLE | CollisionMask.PLAYER_PROJECTILE
+            ),
+            Health(
+                hp=18.0 + self.current_wave * 6,
+                max_hp=18.0 + self.current_wave * 6
+            ),
+            AIBrain(
+                behavior=AIBehavior.CHASER,
+                awareness_range=600.0,
+                attack_range=30.0,
+                speed_multiplier=wave_scale * 1.4,
+                turn_speed=150.0
+            ),
+            EnemyTag(
+                enemy_type="executor",
+                wave_spawned=self.current_wave,
+                point_value=400
+            ),
+        )
         self.entities.add_tag(entity, "enemy")
         self.entities.add_tag(entity, "elite")
         return entity
@@ -1598,66 +1653,69 @@ class WaveSystem(GameSystem):
         entity = self.entities.create_entity()
         wave_scale = 1.0 + (self.current_wave - 5) * 0.1
         
-        self.entities.add_component(entity, Transform(x=x, y=y))
-        self.entities.add_component(entity, Velocity())
-        self.entities.add_component(entity, Physics(
-            max_speed=80.0 * wave_scale,
-            acceleration=160.0,
-            friction=0.12,
-            drag=0.94
-        ))
-        self.entities.add_component(entity, Renderable(
-            shape=RenderShape.SQUARE,
-            color="#ff4400",  # Orange-red
-            outline_color="#aa2200",
-            size=2.2,
-            layer=RenderLayer.ENEMY,
-            glow=True,
-            pulse_speed=0.5
-        ))
-        self.entities.add_component(entity, Collider(
-            radius=35.0,
-            layer=CollisionMask.ENEMY,
-            mask=CollisionMask.PLAYER | CollisionMask.PLAYER_PROJECTILE
-        ))
-        
         boss_hp = 150.0 * wave_scale
-        self.entities.add_component(entity, Health(
-            hp=boss_hp,
-            max_hp=boss_hp,
-            armor=0.25
-        ))
-        self.entities.add_component(entity, Shield(
-            hp=boss_hp * 0.3,
-            max_hp=boss_hp * 0.3,
-            recharge_rate=5.0,
-            recharge_delay=4.0
-        ))
-        self.entities.add_component(entity, Weapon(
-            weapon_type=WeaponType.SHOTGUN,
-            damage=12.0,
-            fire_rate=0.6,
-            projectile_speed=280.0,
-            bullet_count=5,
-            spread=45.0,
-            projectile_color="#ff6644"
-        ))
-        self.entities.add_component(entity, AIBrain(
-            behavior=AIBehavior.BOSS,
-            awareness_range=600.0,
-            attack_range=400.0,
-            attack_cooldown=1.5,
-            turn_speed=50.0,
-            phase_hp_thresholds=[0.6, 0.0]
-        ))
-        self.entities.add_component(entity, EnemyTag(
-            enemy_type="boss_constructor",
-            wave_spawned=self.current_wave,
-            point_value=1000
-        ))
-        self.entities.add_component(entity, BossTag(
-            boss_name="THE CONSTRUCTOR"
-        ))
+        
+        self.entities.add_components(
+            entity,
+            Transform(x=x, y=y),
+            Velocity(),
+            Physics(
+                max_speed=80.0 * wave_scale,
+                acceleration=160.0,
+                friction=0.12,
+                drag=0.94
+            ),
+            Renderable(
+                shape=RenderShape.SQUARE,
+                color="#ff4400",  # Orange-red
+                outline_color="#aa2200",
+                size=2.2,
+                layer=RenderLayer.ENEMY,
+                glow=True,
+                pulse_speed=0.5
+            ),
+            Collider(
+                radius=35.0,
+                layer=CollisionMask.ENEMY,
+                mask=CollisionMask.PLAYER | CollisionMask.PLAYER_PROJECTILE
+            ),
+            Health(
+                hp=boss_hp,
+                max_hp=boss_hp,
+                armor=0.25
+            ),
+            Shield(
+                hp=boss_hp * 0.3,
+                max_hp=boss_hp * 0.3,
+                recharge_rate=5.0,
+                recharge_delay=4.0
+            ),
+            Weapon(
+                weapon_type=WeaponType.SHOTGUN,
+                damage=12.0,
+                fire_rate=0.6,
+                projectile_speed=280.0,
+                bullet_count=5,
+                spread=45.0,
+                projectile_color="#ff6644"
+            ),
+            AIBrain(
+                behavior=AIBehavior.BOSS,
+                awareness_range=600.0,
+                attack_range=400.0,
+                attack_cooldown=1.5,
+                turn_speed=50.0,
+                phase_hp_thresholds=[0.6, 0.0]
+            ),
+            EnemyTag(
+                enemy_type="boss_constructor",
+                wave_spawned=self.current_wave,
+                point_value=1000
+            ),
+            BossTag(
+                boss_name="THE CONSTRUCTOR"
+            ),
+        )
         self.entities.add_tag(entity, "enemy")
         self.entities.add_tag(entity, "boss")
     
@@ -1671,61 +1729,64 @@ class WaveSystem(GameSystem):
         entity = self.entities.create_entity()
         wave_scale = 1.0 + (self.current_wave - 10) * 0.1
         
-        self.entities.add_component(entity, Transform(x=x, y=y))
-        self.entities.add_component(entity, Velocity())
-        self.entities.add_component(entity, Physics(
-            max_speed=180.0 * wave_scale,
-            acceleration=400.0,
-            friction=0.06,
-            drag=0.97
-        ))
-        self.entities.add_component(entity, Renderable(
-            shape=RenderShape.DIAMOND,
-            color="#8800ff",  # Purple
-            outline_color="#5500aa",
-            size=1.8,
-            layer=RenderLayer.ENEMY,
-            glow=True,
-            pulse_speed=2.0
-        ))
-        self.entities.add_component(entity, Collider(
-            radius=28.0,
-            layer=CollisionMask.ENEMY,
-            mask=CollisionMask.PLAYER | CollisionMask.PLAYER_PROJECTILE
-        ))
-        
         boss_hp = 120.0 * wave_scale
-        self.entities.add_component(entity, Health(
-            hp=boss_hp,
-            max_hp=boss_hp,
-            armor=0.1
-        ))
-        self.entities.add_component(entity, Weapon(
-            weapon_type=WeaponType.BURST,
-            damage=8.0,
-            fire_rate=1.0,
-            projectile_speed=350.0,
-            projectile_color="#aa44ff",
-            burst_count=3,
-            burst_delay=0.1
-        ))
-        self.entities.add_component(entity, AIBrain(
-            behavior=AIBehavior.BOSS,
-            awareness_range=700.0,
-            attack_range=500.0,
-            preferred_range=200.0,
-            attack_cooldown=1.0,
-            turn_speed=200.0,
-            phase_hp_thresholds=[0.5, 0.0]
-        ))
-        self.entities.add_component(entity, EnemyTag(
-            enemy_type="boss_shadow",
-            wave_spawned=self.current_wave,
-            point_value=1500
-        ))
-        self.entities.add_component(entity, BossTag(
-            boss_name="THE SHADOW"
-        ))
+        
+        self.entities.add_components(
+            entity,
+            Transform(x=x, y=y),
+            Velocity(),
+            Physics(
+                max_speed=180.0 * wave_scale,
+                acceleration=400.0,
+                friction=0.06,
+                drag=0.97
+            ),
+            Renderable(
+                shape=RenderShape.DIAMOND,
+                color="#8800ff",  # Purple
+                outline_color="#5500aa",
+                size=1.8,
+                layer=RenderLayer.ENEMY,
+                glow=True,
+                pulse_speed=2.0
+            ),
+            Collider(
+                radius=28.0,
+                layer=CollisionMask.ENEMY,
+                mask=CollisionMask.PLAYER | CollisionMask.PLAYER_PROJECTILE
+            ),
+            Health(
+                hp=boss_hp,
+                max_hp=boss_hp,
+                armor=0.1
+            ),
+            Weapon(
+                weapon_type=WeaponType.BURST,
+                damage=8.0,
+                fire_rate=1.0,
+                projectile_speed=350.0,
+                projectile_color="#aa44ff",
+                burst_count=3,
+                burst_delay=0.1
+            ),
+            AIBrain(
+                behavior=AIBehavior.BOSS,
+                awareness_range=700.0,
+                attack_range=500.0,
+                preferred_range=200.0,
+                attack_cooldown=1.0,
+                turn_speed=200.0,
+                phase_hp_thresholds=[0.5, 0.0]
+            ),
+            EnemyTag(
+                enemy_type="boss_shadow",
+                wave_spawned=self.current_wave,
+                point_value=1500
+            ),
+            BossTag(
+                boss_name="THE SHADOW"
+            ),
+        )
         self.entities.add_tag(entity, "enemy")
         self.entities.add_tag(entity, "boss")
     
@@ -1738,66 +1799,69 @@ class WaveSystem(GameSystem):
         entity = self.entities.create_entity()
         wave_scale = 1.0 + (self.current_wave - 15) * 0.1
         
-        self.entities.add_component(entity, Transform(x=x, y=y))
-        self.entities.add_component(entity, Velocity())
-        self.entities.add_component(entity, Physics(
-            max_speed=100.0 * wave_scale,
-            acceleration=200.0,
-            friction=0.1,
-            drag=0.95
-        ))
-        self.entities.add_component(entity, Renderable(
-            shape=RenderShape.HEXAGON,
-            color="#ff8800",  # Orange
-            outline_color="#cc6600",
-            size=2.5,
-            layer=RenderLayer.ENEMY,
-            glow=True,
-            pulse_speed=0.8
-        ))
-        self.entities.add_component(entity, Collider(
-            radius=40.0,
-            layer=CollisionMask.ENEMY,
-            mask=CollisionMask.PLAYER | CollisionMask.PLAYER_PROJECTILE
-        ))
-        
         boss_hp = 200.0 * wave_scale
-        self.entities.add_component(entity, Health(
-            hp=boss_hp,
-            max_hp=boss_hp,
-            armor=0.3
-        ))
-        self.entities.add_component(entity, Shield(
-            hp=boss_hp * 0.4,
-            max_hp=boss_hp * 0.4,
-            recharge_rate=8.0,
-            recharge_delay=3.0
-        ))
-        self.entities.add_component(entity, Weapon(
-            weapon_type=WeaponType.SHOTGUN,
-            damage=15.0,
-            fire_rate=0.5,
-            projectile_speed=300.0,
-            bullet_count=7,
-            spread=80.0,
-            projectile_color="#ffaa44"
-        ))
-        self.entities.add_component(entity, AIBrain(
-            behavior=AIBehavior.BOSS,
-            awareness_range=700.0,
-            attack_range=500.0,
-            attack_cooldown=2.0,
-            turn_speed=70.0,
-            phase_hp_thresholds=[0.65, 0.3, 0.0]
-        ))
-        self.entities.add_component(entity, EnemyTag(
-            enemy_type="boss_architect",
-            wave_spawned=self.current_wave,
-            point_value=2000
-        ))
-        self.entities.add_component(entity, BossTag(
-            boss_name="THE ARCHITECT"
-        ))
+        
+        self.entities.add_components(
+            entity,
+            Transform(x=x, y=y),
+            Velocity(),
+            Physics(
+                max_speed=100.0 * wave_scale,
+                acceleration=200.0,
+                friction=0.1,
+                drag=0.95
+            ),
+            Renderable(
+                shape=RenderShape.HEXAGON,
+                color="#ff8800",  # Orange
+                outline_color="#cc6600",
+                size=2.5,
+                layer=RenderLayer.ENEMY,
+                glow=True,
+                pulse_speed=0.8
+            ),
+            Collider(
+                radius=40.0,
+                layer=CollisionMask.ENEMY,
+                mask=CollisionMask.PLAYER | CollisionMask.PLAYER_PROJECTILE
+            ),
+            Health(
+                hp=boss_hp,
+                max_hp=boss_hp,
+                armor=0.3
+            ),
+            Shield(
+                hp=boss_hp * 0.4,
+                max_hp=boss_hp * 0.4,
+                recharge_rate=8.0,
+                recharge_delay=3.0
+            ),
+            Weapon(
+                weapon_type=WeaponType.SHOTGUN,
+                damage=15.0,
+                fire_rate=0.5,
+                projectile_speed=300.0,
+                bullet_count=7,
+                spread=80.0,
+                projectile_color="#ffaa44"
+            ),
+            AIBrain(
+                behavior=AIBehavior.BOSS,
+                awareness_range=700.0,
+                attack_range=500.0,
+                attack_cooldown=2.0,
+                turn_speed=70.0,
+                phase_hp_thresholds=[0.65, 0.3, 0.0]
+            ),
+            EnemyTag(
+                enemy_type="boss_architect",
+                wave_spawned=self.current_wave,
+                point_value=2000
+            ),
+            BossTag(
+                boss_name="THE ARCHITECT"
+            ),
+        )
         self.entities.add_tag(entity, "enemy")
         self.entities.add_tag(entity, "boss")
     
@@ -1810,66 +1874,69 @@ class WaveSystem(GameSystem):
         entity = self.entities.create_entity()
         wave_scale = 1.0 + (self.current_wave - 20) * 0.1
         
-        self.entities.add_component(entity, Transform(x=x, y=y))
-        self.entities.add_component(entity, Velocity())
-        self.entities.add_component(entity, Physics(
-            max_speed=150.0 * wave_scale,
-            acceleration=300.0,
-            friction=0.08,
-            drag=0.96
-        ))
-        self.entities.add_component(entity, Renderable(
-            shape=RenderShape.HEXAGON,
-            color="#ffffff",  # White/rainbow
-            outline_color="#ffff00",
-            size=3.0,
-            layer=RenderLayer.ENEMY,
-            glow=True,
-            pulse_speed=1.5
-        ))
-        self.entities.add_component(entity, Collider(
-            radius=50.0,
-            layer=CollisionMask.ENEMY,
-            mask=CollisionMask.PLAYER | CollisionMask.PLAYER_PROJECTILE
-        ))
-        
         boss_hp = 300.0 * wave_scale
-        self.entities.add_component(entity, Health(
-            hp=boss_hp,
-            max_hp=boss_hp,
-            armor=0.35
-        ))
-        self.entities.add_component(entity, Shield(
-            hp=boss_hp * 0.5,
-            max_hp=boss_hp * 0.5,
-            recharge_rate=15.0,
-            recharge_delay=2.0
-        ))
-        self.entities.add_component(entity, Weapon(
-            weapon_type=WeaponType.SHOTGUN,
-            damage=20.0,
-            fire_rate=0.8,
-            projectile_speed=350.0,
-            bullet_count=9,
-            spread=120.0,
-            projectile_color="#ffffff"
-        ))
-        self.entities.add_component(entity, AIBrain(
-            behavior=AIBehavior.BOSS,
-            awareness_range=800.0,
-            attack_range=600.0,
-            attack_cooldown=1.5,
-            turn_speed=100.0,
-            phase_hp_thresholds=[0.7, 0.4, 0.0]
-        ))
-        self.entities.add_component(entity, EnemyTag(
-            enemy_type="boss_final",
-            wave_spawned=self.current_wave,
-            point_value=5000
-        ))
-        self.entities.add_component(entity, BossTag(
-            boss_name="THE FINAL TRIAL"
-        ))
+        
+        self.entities.add_components(
+            entity,
+            Transform(x=x, y=y),
+            Velocity(),
+            Physics(
+                max_speed=150.0 * wave_scale,
+                acceleration=300.0,
+                friction=0.08,
+                drag=0.96
+            ),
+            Renderable(
+                shape=RenderShape.HEXAGON,
+                color="#ffffff",  # White/rainbow
+                outline_color="#ffff00",
+                size=3.0,
+                layer=RenderLayer.ENEMY,
+                glow=True,
+                pulse_speed=1.5
+            ),
+            Collider(
+                radius=50.0,
+                layer=CollisionMask.ENEMY,
+                mask=CollisionMask.PLAYER | CollisionMask.PLAYER_PROJECTILE
+            ),
+            Health(
+                hp=boss_hp,
+                max_hp=boss_hp,
+                armor=0.35
+            ),
+            Shield(
+                hp=boss_hp * 0.5,
+                max_hp=boss_hp * 0.5,
+                recharge_rate=15.0,
+                recharge_delay=2.0
+            ),
+            Weapon(
+                weapon_type=WeaponType.SHOTGUN,
+                damage=20.0,
+                fire_rate=0.8,
+                projectile_speed=350.0,
+                bullet_count=9,
+                spread=120.0,
+                projectile_color="#ffffff"
+            ),
+            AIBrain(
+                behavior=AIBehavior.BOSS,
+                awareness_range=800.0,
+                attack_range=600.0,
+                attack_cooldown=1.5,
+                turn_speed=100.0,
+                phase_hp_thresholds=[0.7, 0.4, 0.0]
+            ),
+            EnemyTag(
+                enemy_type="boss_final",
+                wave_spawned=self.current_wave,
+                point_value=5000
+            ),
+            BossTag(
+                boss_name="THE FINAL TRIAL"
+            ),
+        )
         self.entities.add_tag(entity, "enemy")
         self.entities.add_tag(entity, "boss")
     
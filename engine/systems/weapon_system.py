@@ -6,7 +6,6 @@ Handles weapon cooldowns, firing patterns, and projectile creation.
 
 from __future__ import annotations
 import math
-import random
 from typing import TYPE_CHECKING, Optional
 
 from ..core.system import GameSystem, SystemPriority
@@ -18,11 +17,16 @@ from ..components.renderable import Renderable, RenderShape, RenderLayer
 from ..components.collider import Collider, ColliderType, CollisionMask
 from ..components.tags import PlayerTag, ProjectileTag
 from ..components.upgrades import PlayerUpgrades
+from ..core.rng import RNG
 
 if TYPE_CHECKING:
     from ..core.entity import Entity
 
 
+# Degrees -> radians factor (the same value math.radians multiplies by)
+_DEG_TO_RAD = math.pi / 180.0
+
+
 class WeaponSystem(GameSystem):
     """
     Handles weapon firing and projectile management.
@@ -40,26 +44,22 @@ class WeaponSystem(GameSystem):
     
     def update(self, dt: float) -> None:
         """Process weapons and projectiles."""
-        import math
-        
         # Validate dt
         if not isinstance(dt, (int, float)) or not math.isfinite(dt) or dt <= 0:
             dt = 0.016
         dt = min(dt, 0.1)  # Cap to prevent huge jumps
         
-        # Update weapons
+        # Update weapons (query snapshots its rows, so projectiles spawned
+        # while iterating don't disturb the loop)
         try:
-            weapon_entities = list(self.entities.get_entities_with(Weapon, Transform))
+            weapon_rows = self.entities.query(Weapon, Transform)
         except Exception:
-            weapon_entities = []
+            weapon_rows = ()
             
-        for entity in weapon_entities:
+        for entity, weapon, transform in weapon_rows:
             try:
                 if not self.entities.is_alive(entity):
                     continue
-                    
-                weapon = self.entities.get_component(entity, Weapon)
-                transform = self.entities.get_component(entity, Transform)
                 
                 if not weapon or not transform:
                     continue
@@ -93,25 +93,22 @@ class WeaponSystem(GameSystem):
                 # Continue processing other weapons
                 continue
         
-        # Update projectiles
+        # Update projectiles: a single pass over the Projectile store advances
+        # lifetimes and despawns expired shots (their pooled components are
+        # recycled for the next spawn)
         try:
-            projectile_entities = list(self.entities.get_entities_with(Projectile))
+            projectile_rows = self.entities.query(Projectile)
         except Exception:
-            projectile_entities = []
-            
-        for entity in projectile_entities:
+            projectile_rows = ()
+        
+        destroy = self.entities.destroy_entity
+        for entity, projectile in projectile_rows:
             try:
-                if not self.entities.is_alive(entity):
-                    continue
-                    
-                projectile = self.entities.get_component(entity, Projectile)
-                
-                if projectile:
-                    projectile.time_alive += dt
-                    
-                    if projectile.is_expired:
-                        self.entities.destroy_entity(entity)
+                projectile.time_alive += dt
+                if projectile.is_expired:
+                    destroy(entity)
             except Exception:
+                # Continue processing other projectiles
                 continue
     
     def _fire_weapon(
@@ -166,7 +163,7 @@ class WeaponSystem(GameSystem):
             for i in range(bullet_count):
                 angle_offset = start_angle + (spread_per_bullet * i)
                 # Add some random variation
-                angle_offset += random.uniform(-3, 3)
+                angle_offset += RNG.uniform(-3, 3)
                 self._spawn_projectile(entity, weapon, transform, angle_offset, is_player,
                                       size_mult=projectile_size_mult, pierce_bonus=pierce_bonus)
         
@@ -178,7 +175,7 @@ class WeaponSystem(GameSystem):
         
         elif weapon.weapon_type == WeaponType.RAPID:
             # Same as single but relies on high fire_rate
-            angle_offset = random.uniform(-weapon.spread/2, weapon.spread/2)
+            angle_offset = RNG.uniform(-weapon.spread/2, weapon.spread/2)
             self._spawn_projectile(entity, weapon, transform, angle_offset, is_player,
                                   size_mult=projectile_size_mult, pierce_bonus=pierce_bonus)
         
@@ -215,66 +212,71 @@ class WeaponSystem(GameSystem):
         # Calculate spawn position (slightly in front of owner)
         spawn_distance = 25.0
         angle = owner_transform.angle + angle_offset
-        rad = math.radians(angle)
+        rad = angle * _DEG_TO_RAD
+        cos_a = math.cos(rad)
+        sin_a = math.sin(rad)
         
-        spawn_x = owner_transform.x + math.cos(rad) * spawn_distance
-        spawn_y = owner_transform.y + math.sin(rad) * spawn_distance
+        spawn_x = owner_transform.x + cos_a * spawn_distance
+        spawn_y = owner_transform.y + sin_a * spawn_distance
         
         # Calculate velocity
-        vx = math.cos(rad) * weapon.projectile_speed
-        vy = math.sin(rad) * weapon.projectile_speed
+        vx = cos_a * weapon.projectile_speed
+        vy = sin_a * weapon.projectile_speed
         
         # Create projectile entity
         proj_entity = self.entities.create_entity()
+        registry = self.entities.registry
         
-        # Transform
-        self.entities.add_component(proj_entity, Transform(
-            x=spawn_x,
-            y=spawn_y,
-            angle=angle
-        ))
-        
-        # Velocity
-        self.entities.add_component(proj_entity, Velocity(
-            vx=vx,
-            vy=vy
-        ))
-        
-        # Projectile data
-        proj = Projectile(
-            owner_id=owner.id,
-            damage=weapon.damage,
-            lifetime=weapon.range / weapon.projectile_speed,
-            is_explosive=(weapon.weapon_type == WeaponType.ROCKET),
-            pierce_count=pierce_bonus
-        )
-        self.entities.add_component(proj_entity, proj)
-        
-        # Renderable
-        self.entities.add_component(proj_entity, Renderable(
-            shape=RenderShape.CIRCLE,
-            color=weapon.projectile_color,
-            outline_color=weapon.projectile_color,
-            size=weapon.projectile_size * size_mult,
-            layer=RenderLayer.PROJECTILE
-        ))
-        
-        # Collider
+        # Collision layers
         collision_layer = CollisionMask.PLAYER_PROJECTILE if is_player else CollisionMask.ENEMY_PROJECTILE
         collision_mask = CollisionMask.ENEMY | CollisionMask.OBSTACLE if is_player else CollisionMask.PLAYER | CollisionMask.OBSTACLE
         
-        self.entities.add_component(proj_entity, Collider(
-            collider_type=ColliderType.CIRCLE,
-            radius=5.0 * weapon.projectile_size * size_mult,
-            layer=collision_layer,
-            mask=collision_mask,
-            is_trigger=True  # Projectiles don't push things
-        ))
-        
-        # Tag
-        self.entities.add_component(proj_entity, ProjectileTag(
-            is_player_owned=is_player
-        ))
+        # All components are attached in one call so the projectile lands
+        # directly in its final archetype
+        self.entities.add_components(
+            proj_entity,
+            # Transform
+            Transform(
+                x=spawn_x,
+                y=spawn_y,
+                angle=angle
+            ),
+            # Velocity
+            Velocity(
+                vx=vx,
+                vy=vy
+            ),
+            # Projectile data (recycled from the component pool when possible)
+            registry.acquire(
+                Projectile,
+                owner_id=owner.id,
+                damage=weapon.damage,
+                lifetime=weapon.range / weapon.projectile_speed,
+                is_explosive=(weapon.weapon_type == WeaponType.ROCKET),
+                pierce_count=pierce_bonus
+            ),
+            # Renderable
+            Renderable(
+                shape=RenderShape.CIRCLE,
+                color=weapon.projectile_color,
+                outline_color=weapon.projectile_color,
+                size=weapon.projectile_size * size_mult,
+                layer=RenderLayer.PROJECTILE
+            ),
+            # Collider
+            Collider(
+                collider_type=ColliderType.CIRCLE,
+                radius=5.0 * weapon.projectile_size * size_mult,
+                layer=collision_layer,
+                mask=collision_mask,
+                is_trigger=True  # Projectiles don't push things
+            ),
+            # Tag
+            registry.acquire(
+                ProjectileTag,
+                is_player_owned=is_player
+            ),
+        )
         self.entities.add_tag(proj_entity, "projectile")
         
         # Emit event
@@ -42,7 +42,7 @@ from engine.core.events import (
 )
 from engine.components.tags import PlayerTag
 from engine.components.health import Health, Shield
-from engine.components.upgrades import PlayerUpgrades
+from engine.components.upgrades import PlayerUpgrades, UpgradeType
 from engine.menu import MenuSystem, MenuState
 
 from .config import GameConfig, DEFAULT_CONFIG, ArenaTheme, THEME_PALETTES
@@ -96,8 +96,16 @@ class RoboArena:
         self.game_loop: Optional[GameLoop] = None
         self.menu: Optional[MenuSystem] = None
         
+        # Systems the game talks to directly, captured once in _add_systems
+        # so per-frame UI code never goes back through get_system()
+        self.input_system: Optional[InputSystem] = None
+        self.upgrade_system: Optional[UpgradeSystem] = None
+        self.wave_system: Optional[WaveSystem] = None
+        self.render_system: Optional[RenderSystem] = None
+        
         # UI state
         self.ui_turtle: Optional[turtle.Turtle] = None
+        self._hud_drawn = False  # Whether ui_turtle holds HUD drawings
         self.show_wave_text = False
         self.wave_text_timer = 0.0
         self.current_wave_text = ""
@@ -200,10 +208,10 @@ class RoboArena:
         loop = self.game_loop
         
         # Input (first)
-        loop.add_system(InputSystem(loop.screen))
+        self.input_system = loop.add_system(InputSystem(loop.screen))
         
         # Upgrade system (before other systems apply)
-        loop.add_system(UpgradeSystem())
+        self.upgrade_system = loop.add_system(UpgradeSystem())
         
         # AI and pathfinding
         loop.add_system(PathfindingSystem(
@@ -233,7 +241,7 @@ class RoboArena:
         loop.add_system(StatusEffectSystem())
         
         # Waves
-        loop.add_system(WaveSystem(
+        self.wave_system = loop.add_system(WaveSystem(
             arena_width=cfg.arena.width,
             arena_height=cfg.arena.height,
             start_budget=cfg.wave.start_budget,
@@ -242,7 +250,7 @@ class RoboArena:
         ))
         
         # Rendering (last)
-        loop.add_system(RenderSystem(
+        self.render_system = loop.add_system(RenderSystem(
             loop.screen,
             cfg.arena.width,
             cfg.arena.height,
@@ -306,12 +314,12 @@ class RoboArena:
         self._create_entities()
         
         # Reset upgrade system
-        upgrade_system = self.game_loop.get_system(UpgradeSystem)
+        upgrade_system = self.upgrade_system
         if upgrade_system:
             upgrade_system.reset_player_upgrades()
         
         # Start wave system
-        wave_system = self.game_loop.get_system(WaveSystem)
+        wave_system = self.wave_system
         if wave_system:
             wave_system.start_game()
         
@@ -322,7 +330,7 @@ class RoboArena:
         self.menu.hide()
         
         # Re-enable input system key bindings (menu may have overwritten them)
-        input_system = self.game_loop.get_system(InputSystem)
+        input_system = self.input_system
         if input_system:
             input_system.rebind_keys()
     
@@ -337,7 +345,7 @@ class RoboArena:
         self.menu.hide()
         
         # Re-enable input system key bindings (menu may have overwritten them)
-        input_system = self.game_loop.get_system(InputSystem)
+        input_system = self.input_system
         if input_system:
             input_system.rebind_keys()
     
@@ -383,14 +391,18 @@ class RoboArena:
         self._check_pause_input()
         
         # Don't draw game UI if menu is active
+        # (the HUD only needs clearing once when the menu opens)
         if self.menu and self.menu.state != MenuState.HIDDEN:
-            self.ui_turtle.clear()
+            if self._hud_drawn:
+                self.ui_turtle.clear()
+                self._hud_drawn = False
             return
         
         self.ui_turtle.clear()
+        self._hud_drawn = True
         
         # Get game state
-        wave_system = self.game_loop.get_system(WaveSystem)
+        wave_system = self.wave_system
         
         # Draw HUD - positioned at BOTTOM of screen to not block spawn areas
         hw = self.config.arena.width / 2
@@ -498,7 +510,7 @@ class RoboArena:
                     )
         
         # Special event notification
-        wave_system = self.game_loop.get_system(WaveSystem)
+        wave_system = self.wave_system
         if wave_system and wave_system.event_active:
             event_colors = {
                 "energy_surge": "#ffff00",
@@ -637,19 +649,23 @@ class RoboArena:
         """Draw a health/shield bar."""
         t = self.ui_turtle
         
+        # Pen width is shared by background and fill (and usually by
+        # consecutive bars), so only touch it when it actually changes
+        if t.pensize() != height:
+            t.pensize(height)
+        
         # Background
+        t.pencolor(bg_color)
         t.goto(x, y)
         t.pendown()
-        t.pensize(height)
-        t.pencolor(bg_color)
         t.forward(width)
         t.penup()
         
         # Fill
         if percent > 0:
+            t.pencolor(fill_color)
             t.goto(x, y)
             t.pendown()
-            t.pencolor(fill_color)
             t.forward(width * percent)
             t.penup()
     
@@ -666,7 +682,7 @@ class RoboArena:
             self.wave_text_timer = 2.0
         
         # Update upgrade system with current wave
-        upgrade_system = self.game_loop.get_system(UpgradeSystem)
+        upgrade_system = self.upgrade_system
         if upgrade_system:
             upgrade_system.set_wave(wave_num)
         
@@ -709,7 +725,7 @@ class RoboArena:
         if new_theme != self.current_theme:
             self.current_theme = new_theme
             # Update render system theme
-            render_system = self.game_loop.get_system(RenderSystem)
+            render_system = self.render_system
             if render_system:
                 render_system.set_arena_theme(new_theme)
     
@@ -730,8 +746,6 @@ class RoboArena:
     
     def _check_upgrade_synergies(self, upgrades) -> None:
         """Check if player has achieved any upgrade synergies."""
-        from engine.components.upgrades import UpgradeType
-        
         self.active_synergies.clear()
         
         # Map upgrade types to simple names for synergy checking
@@ -777,7 +791,7 @@ class RoboArena:
     
     def _on_game_state(self, event: GameStateEvent) -> None:
         """Handle game state changes."""
-        wave_system = self.game_loop.get_system(WaveSystem)
+        wave_system = self.wave_system
         
         if event.state == "game_over":
             self.game_loop.change_state(GameState.GAME_OVER)
@@ -806,7 +820,7 @@ class RoboArena:
             self.setup()
         
         # Set up ESC key for pause
-        input_system = self.game_loop.get_system(InputSystem)
+        input_system = self.input_system
         if input_system:
             from engine.systems.input_system import GameAction
             input_system.set_action_callback(
@@ -840,8 +854,8 @@ class RoboArena:
             self._cleanup_and_quit()
 
 
-def main():
-    """Main entry point."""
+def _print_banner() -> None:
+    """Print the intro banner and controls reference to stdout."""
     print()
     print("═" * 55)
     print("           ╔═══════════════════════════╗")
@@ -881,6 +895,14 @@ def main():
     print("    Orange  = Elite (dangerous)")
     print("─" * 55)
     print()
+
+
+def main():
+    """Main entry point."""
+    # The banner is opt-in: console printing is slow on some terminals
+    # and only delays the window from appearing
+    if "--verbose" in sys.argv or os.environ.get("ROBO_ARENA_BANNER") == "1":
+        _print_banner()
     
     # Create and run game
     game = RoboArena()
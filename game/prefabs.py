@@ -7,7 +7,7 @@ making it easy to create consistent game objects.
 
 from __future__ import annotations
 from typing import TYPE_CHECKING, Optional
-import random
+import copy
 
 from engine.core.entity import Entity, EntityManager
 from engine.components.transform import Transform
@@ -19,10 +19,96 @@ from engine.components.weapon import Weapon, WeaponType
 from engine.components.ai import AIBrain, AIBehavior
 from engine.components.status import StatusEffects
 from engine.components.tags import PlayerTag, EnemyTag, ObstacleTag, PowerupTag
+from engine.core.rng import RNG
 
 from .config import GameConfig, DEFAULT_CONFIG
 
 
+# (fill, outline) colors per powerup type, built once at import
+POWERUP_COLORS = {
+    "health": ("#ff4444", "#aa0000"),
+    "shield": ("#4444ff", "#0000aa"),
+    "damage": ("#ffaa00", "#aa7700"),
+    "speed": ("#00ffff", "#00aaaa"),
+}
+_DEFAULT_POWERUP_COLORS = ("#ffffff", "#aaaaaa")
+
+
+# Config-derived player components, shallow-copied on every spawn. The key
+# holds snapshots of the config sections they were built from, so editing
+# config.player / config.weapon transparently rebuilds the prototypes.
+_player_prototype: Optional[tuple] = None
+_player_prototype_key: Optional[tuple] = None
+
+
+def _build_player_prototype(config: GameConfig) -> tuple:
+    """Build the player components that only depend on configuration."""
+    pc = config.player
+    wc = config.weapon
+    
+    return (
+        # Physics
+        Physics(
+            max_speed=pc.move_speed,
+            acceleration=pc.acceleration,
+            angular_acceleration=pc.turn_speed,
+            friction=pc.friction,
+            drag=pc.drag
+        ),
+        
+        # Rendering
+        Renderable(
+            shape=RenderShape.TRIANGLE,
+            color=pc.color,
+            outline_color=pc.outline_color,
+            size=pc.size,
+            layer=RenderLayer.PLAYER
+        ),
+        
+        # Collision
+        Collider(
+            collider_type=ColliderType.CIRCLE,
+            radius=15.0 * pc.size,
+            layer=CollisionMask.PLAYER,
+            mask=CollisionMask.ENEMY | CollisionMask.OBSTACLE | CollisionMask.ENEMY_PROJECTILE | CollisionMask.POWERUP
+        ),
+        
+        # Health & Shield
+        Health(
+            hp=pc.max_hp,
+            max_hp=pc.max_hp
+        ),
+        Shield(
+            hp=pc.max_shield,
+            max_hp=pc.max_shield,
+            recharge_rate=pc.shield_recharge,
+            recharge_delay=pc.shield_delay
+        ),
+        
+        # Weapon
+        Weapon(
+            weapon_type=WeaponType.SINGLE,
+            damage=wc.damage,
+            fire_rate=wc.fire_rate,
+            projectile_speed=wc.projectile_speed,
+            projectile_size=wc.projectile_size,
+            projectile_color=wc.projectile_color
+        ),
+    )
+
+
+def _get_player_prototype(config: GameConfig) -> tuple:
+    """Get the cached player prototype, rebuilding it if the config changed."""
+    global _player_prototype, _player_prototype_key
+    
+    key = (config.player, config.weapon)
+    if _player_prototype is None or _player_prototype_key != key:
+        _player_prototype = _build_player_prototype(config)
+        _player_prototype_key = (copy.copy(config.player), copy.copy(config.weapon))
+    
+    return _player_prototype
+
+
 def create_player(
     entities: EntityManager,
     x: float = 0.0,
@@ -32,6 +118,10 @@ def create_player(
     """
     Create the player entity.
     
+    Config-derived components are shallow copies of a cached prototype
+    (they hold no mutable containers); only the spawn-specific ones are
+    constructed per call.
+    
     Args:
         entities: Entity manager
         x, y: Starting position
@@ -41,68 +131,21 @@ def create_player(
         The player entity
     """
     config = config or DEFAULT_CONFIG
-    pc = config.player
-    wc = config.weapon
     
     entity = entities.create_entity(name="player")
     
-    # Transform
-    entities.add_component(entity, Transform(x=x, y=y, angle=90))
-    
-    # Physics
-    entities.add_component(entity, Velocity())
-    entities.add_component(entity, Physics(
-        max_speed=pc.move_speed,
-        acceleration=pc.acceleration,
-        angular_acceleration=pc.turn_speed,
-        friction=pc.friction,
-        drag=pc.drag
-    ))
-    
-    # Rendering
-    entities.add_component(entity, Renderable(
-        shape=RenderShape.TRIANGLE,
-        color=pc.color,
-        outline_color=pc.outline_color,
-        size=pc.size,
-        layer=RenderLayer.PLAYER
-    ))
-    
-    # Collision
-    entities.add_component(entity, Collider(
-        collider_type=ColliderType.CIRCLE,
-        radius=15.0 * pc.size,
-        layer=CollisionMask.PLAYER,
-        mask=CollisionMask.ENEMY | CollisionMask.OBSTACLE | CollisionMask.ENEMY_PROJECTILE | CollisionMask.POWERUP
-    ))
-    
-    # Health & Shield
-    entities.add_component(entity, Health(
-        hp=pc.max_hp,
-        max_hp=pc.max_hp
-    ))
-    entities.add_component(entity, Shield(
-        hp=pc.max_shield,
-        max_hp=pc.max_shield,
-        recharge_rate=pc.shield_recharge,
-        recharge_delay=pc.shield_delay
-    ))
-    
-    # Weapon
-    entities.add_component(entity, Weapon(
-        weapon_type=WeaponType.SINGLE,
-        damage=wc.damage,
-        fire_rate=wc.fire_rate,
-        projectile_speed=wc.projectile_speed,
-        projectile_size=wc.projectile_size,
-        projectile_color=wc.projectile_color
-    ))
-    
-    # Status effects container
-    entities.add_component(entity, StatusEffects())
-    
-    # Tag
-    entities.add_component(entity, PlayerTag())
+    entities.add_components(
+        entity,
+        # Transform and velocity
+        Transform(x=x, y=y, angle=90),
+        Velocity(),
+        # Physics, rendering, collision, health, shield and weapon
+        *[copy.copy(prototype) for prototype in _get_player_prototype(config)],
+        # Status effects container
+        entities.registry.acquire(StatusEffects),
+        # Tag
+        PlayerTag(),
+    )
     entities.add_tag(entity, "player")
     
     return entity
@@ -132,42 +175,47 @@ def create_obstacle(
     """
     entity = entities.create_entity()
     
-    # Transform
-    entities.add_component(entity, Transform(x=x, y=y))
-    
-    # Static physics
-    entities.add_component(entity, Velocity())
-    entities.add_component(entity, Physics(is_kinematic=True))
-    
-    # Rendering
-    entities.add_component(entity, Renderable(
-        shape=RenderShape.SQUARE,
-        color="#666666",
-        outline_color="#888888",
-        size=max(width, height) / 20,  # Scale based on size
-        layer=RenderLayer.OBSTACLE
-    ))
-    
-    # Collision
-    entities.add_component(entity, Collider(
-        collider_type=ColliderType.AABB,
-        width=width,
-        height=height,
-        layer=CollisionMask.OBSTACLE,
-        mask=CollisionMask.ALL,
-        is_static=True
-    ))
+    components = [
+        # Transform
+        Transform(x=x, y=y),
+        
+        # Static physics
+        Velocity(),
+        Physics(is_kinematic=True),
+        
+        # Rendering
+        Renderable(
+            shape=RenderShape.SQUARE,
+            color="#666666",
+            outline_color="#888888",
+            size=max(width, height) / 20,  # Scale based on size
+            layer=RenderLayer.OBSTACLE
+        ),
+        
+        # Collision
+        Collider(
+            collider_type=ColliderType.AABB,
+            width=width,
+            height=height,
+            layer=CollisionMask.OBSTACLE,
+            mask=CollisionMask.ALL,
+            is_static=True
+        ),
+        
+        # Tag
+        ObstacleTag(
+            blocks_movement=True,
+            blocks_projectiles=True,
+            destructible=destructible
+        ),
+    ]
     
     # Health (if destructible)
     if destructible:
-        entities.add_component(entity, Health(hp=hp, max_hp=hp))
+        components.append(Health(hp=hp, max_hp=hp))
     
-    # Tag
-    entities.add_component(entity, ObstacleTag(
-        blocks_movement=True,
-        blocks_projectiles=True,
-        destructible=destructible
-    ))
+    # Attached in one call so the obstacle lands directly in its final archetype
+    entities.add_components(entity, *components)
     entities.add_tag(entity, "obstacle")
     
     return entity
@@ -195,43 +243,40 @@ def create_powerup(
     entity = entities.create_entity()
     
     # Determine color based on type
-    colors = {
-        "health": ("#ff4444", "#aa0000"),
-        "shield": ("#4444ff", "#0000aa"),
-        "damage": ("#ffaa00", "#aa7700"),
-        "speed": ("#00ffff", "#00aaaa"),
-    }
-    color, outline = colors.get(powerup_type, ("#ffffff", "#aaaaaa"))
-    
-    # Transform
-    entities.add_component(entity, Transform(x=x, y=y))
-    
-    # Slight floating animation via velocity
-    entities.add_component(entity, Velocity(angular=45))
-    
-    # Rendering
-    entities.add_component(entity, Renderable(
-        shape=RenderShape.CIRCLE,
-        color=color,
-        outline_color=outline,
-        size=0.6,
-        layer=RenderLayer.POWERUP
-    ))
+    color, outline = POWERUP_COLORS.get(powerup_type, _DEFAULT_POWERUP_COLORS)
     
-    # Collision (trigger only)
-    entities.add_component(entity, Collider(
-        collider_type=ColliderType.CIRCLE,
-        radius=12.0,
-        layer=CollisionMask.POWERUP,
-        mask=CollisionMask.PLAYER,
-        is_trigger=True
-    ))
-    
-    # Tag
-    entities.add_component(entity, PowerupTag(
-        powerup_type=powerup_type,
-        value=value
-    ))
+    entities.add_components(
+        entity,
+        # Transform
+        Transform(x=x, y=y),
+        
+        # Slight floating animation via velocity
+        Velocity(angular=45),
+        
+        # Rendering
+        Renderable(
+            shape=RenderShape.CIRCLE,
+            color=color,
+            outline_color=outline,
+            size=0.6,
+            layer=RenderLayer.POWERUP
+        ),
+        
+        # Collision (trigger only)
+        Collider(
+            collider_type=ColliderType.CIRCLE,
+            radius=12.0,
+            layer=CollisionMask.POWERUP,
+            mask=CollisionMask.PLAYER,
+            is_trigger=True
+        ),
+        
+        # Tag
+        PowerupTag(
+            powerup_type=powerup_type,
+            value=value
+        ),
+    )
     entities.add_tag(entity, "powerup")
     
     return entity
@@ -255,24 +300,27 @@ def create_arena_obstacles(
     hw = arena_width / 2 - 50
     hh = arena_height / 2 - 50
     min_dist_from_center = 100
+    min_dist_sq = min_dist_from_center * min_dist_from_center
+    uniform = RNG.uniform
+    rand = RNG.random
     
     for _ in range(obstacle_count):
-        # Random position avoiding center
+        # Random position avoiding center (rejection sampling)
         for _ in range(10):  # Max attempts
-            x = random.uniform(-hw, hw)
-            y = random.uniform(-hh, hh)
+            x = uniform(-hw, hw)
+            y = uniform(-hh, hh)
             
-            if (x**2 + y**2) > min_dist_from_center**2:
+            if x * x + y * y > min_dist_sq:
                 break
         
         # Random size
-        size = random.uniform(30, 60)
+        size = uniform(30, 60)
         
         obstacle = create_obstacle(
             entities, x, y,
             width=size,
             height=size,
-            destructible=random.random() < 0.3  # 30% chance destructible
+            destructible=rand() < 0.3  # 30% chance destructible
         )
         obstacles.append(obstacle)
     
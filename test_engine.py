@@ -10,7 +10,7 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from engine.core import Entity, EntityManager, EventBus, SystemManager
+from engine.core import Entity, EntityManager, EventBus, SystemManager, ComponentRegistry, reseed
 from engine.components import (
     Transform, Velocity, Physics, Health, Shield,
     Weapon, WeaponType, Projectile, AIBrain, AIBehavior,
@@ -45,6 +45,13 @@ def test_entity_manager():
     t1 = em.get_component(e1, Transform)
     assert t1.x == 100 and t1.y == 50
     
+    # Several components attached in one call
+    e3 = em.create_entity()
+    em.add_components(e3, Transform(x=5, y=5), Velocity(vx=1))
+    assert em.has_components(e3, Transform, Velocity)
+    assert em.get_component(e3, Velocity).vx == 1
+    em.destroy_entity(e3, immediate=True)
+    
     # Query by component
     entities_with_transform = list(em.get_entities_with(Transform))
     assert len(entities_with_transform) == 2
@@ -52,6 +59,17 @@ def test_entity_manager():
     entities_with_velocity = list(em.get_entities_with(Velocity))
     assert len(entities_with_velocity) == 1
     
+    # Query yields components alongside the entity
+    rows = list(em.query(Transform, Velocity))
+    assert len(rows) == 1
+    entity, transform, velocity = rows[0]
+    assert entity == e1 and transform is t1 and velocity.vx == 10
+    
+    # Replacing a component keeps the signature but bumps the version
+    version = em.component_version(e1)
+    em.add_component(e1, Velocity(vx=10, vy=5))
+    assert em.component_version(e1) != version
+    
     # Named lookup
     assert em.get_named("test1") == e1
     
@@ -59,12 +77,28 @@ def test_entity_manager():
     em.add_tag(e1, "player")
     assert em.has_tag(e1, "player")
     assert list(em.get_entities_with_tag("player")) == [e1]
+    em.add_tag(e2, "enemy")
+    em.remove_tag(e1, "player")
+    assert not em.has_tag(e1, "player") and em.has_tag(e2, "enemy")
     
     # Destroy
     em.destroy_entity(e2)
     assert em.entity_count == 2  # Still there (deferred)
     em.flush_destroyed()
     assert em.entity_count == 1
+    assert list(em.get_entities_with_tag("enemy")) == []
+    
+    # Pooled components are recycled on destruction
+    registry = ComponentRegistry()
+    registry.register(Projectile, pooled=True)
+    pooled_em = EntityManager(registry)
+    e3 = pooled_em.create_entity()
+    proj = pooled_em.add_component(e3, Projectile(damage=5))
+    proj.register_hit(42)
+    pooled_em.destroy_entity(e3, immediate=True)
+    recycled = registry.acquire(Projectile, damage=7)
+    assert recycled is proj
+    assert recycled.damage == 7 and recycled.hit_entities == []
     
     print("  ✓ EntityManager tests passed")
 
@@ -138,6 +172,9 @@ def test_components():
     status.apply_effect(StatusEffect.SLOW, duration=5.0, magnitude=0.5)
     assert status.has_effect(StatusEffect.SLOW)
     assert status.speed_modifier == 0.5
+    status.clear_debuffs()
+    assert not status.has_effect(StatusEffect.SLOW)
+    assert status.active_flags == 0
     
     print("  ✓ Component tests passed")
 
@@ -165,6 +202,22 @@ def test_physics_system():
     assert transform.x > initial_x
     assert abs(transform.x - 100) < 5  # Should be around 100
     
+    # Disabled systems are skipped until re-enabled
+    moved_x = transform.x
+    sm.disable_system(PhysicsSystem)
+    sm.update(1/60)
+    assert transform.x == moved_x
+    sm.get_system(PhysicsSystem).enabled = True
+    sm.update(1/60)
+    assert transform.x > moved_x
+    
+    # Unforced bodies coast to a full stop and then rest
+    coaster = em.create_entity()
+    em.add_components(coaster, Transform(x=0, y=0), Velocity(vx=1, vy=0), Physics(friction=5.0))
+    for _ in range(120):
+        sm.update(1/60)
+    assert em.get_component(coaster, Velocity).vx == 0.0
+    
     sm.cleanup()
     print("  ✓ PhysicsSystem tests passed")
 
@@ -203,6 +256,18 @@ def test_collision_system():
     
     assert len(collisions) == 1
     
+    # Overlapping colliders whose masks exclude each other never collide
+    e3 = em.create_entity()
+    em.add_component(e3, Transform(x=5, y=0))
+    em.add_component(e3, Collider(
+        radius=20,
+        layer=CollisionMask.POWERUP,
+        mask=CollisionMask.ENEMY
+    ))
+    collisions.clear()
+    sm.update(1/60)
+    assert all(e3.id not in (c.entity_a_id, c.entity_b_id) for c in collisions)
+    
     sm.cleanup()
     print("  ✓ CollisionSystem tests passed")
 
@@ -276,6 +341,12 @@ def test_wave_system():
     assert "chaser" in wave_sys.enemy_configs
     assert "turret" in wave_sys.enemy_configs
     
+    # Spawn positions replay exactly after reseeding the shared RNG
+    reseed(42)
+    first = [wave_sys._get_spawn_position() for _ in range(3)]
+    reseed(42)
+    assert [wave_sys._get_spawn_position() for _ in range(3)] == first
+    
     sm.cleanup()
     print("  ✓ WaveSystem tests passed")
 